@@ -0,0 +1,61 @@
+"""Measure the time per game of the standard game between greedy players.
+
+Run with the package installed:
+
+    python benchmarks/game_benchmark.py
+    python benchmarks/game_benchmark.py --budget 200
+
+The script plays the same seeded headless games (7-card hands, as in every
+normal game) several times and reports the best time per game in microseconds.
+Data structures that only pay off for unusual games, e.g., for very large hands,
+must not slow down this path; with `--budget` the script exits with status 1 if
+a game takes longer than the given number of microseconds.
+"""
+
+import json
+import platform
+import random
+import sys
+import time
+
+import click
+
+from crazyeights.simulation import play_headless_game
+
+
+def measure_game_time(num_games: int, num_players: int, repeat: int) -> float:
+    """Return the best time per game in microseconds over `repeat` runs of the
+    games with seeds `0..num_games`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for seed in range(num_games):
+            play_headless_game(num_players, random.Random(seed))
+        best = min(best, time.perf_counter() - start)
+    return best / num_games * 1e6
+
+
+@click.command()
+@click.option("-n", "--num-games", default=2000, show_default=True)
+@click.option("-p", "--num-players", default=2, show_default=True)
+@click.option("--repeat", default=5, show_default=True, help="Runs of all games.")
+@click.option("--json", "json_file", type=click.File("w"), help="Save the results.")
+@click.option("--budget", type=float, help="Maximum time per game in microseconds.")
+def main(num_games, num_players, repeat, json_file, budget):
+    """Measure the time per game between greedy players."""
+    us_per_game = measure_game_time(num_games, num_players, repeat)
+    click.echo(f"{num_players} players: {us_per_game:.1f} µs/game")
+    if json_file is not None:
+        data = {
+            "python": platform.python_version(),
+            "num_players": num_players,
+            "us_per_game": us_per_game,
+        }
+        json.dump(data, json_file, indent=2)
+    if budget is not None and us_per_game > budget:
+        click.echo(f"Over the budget of {budget} µs per game.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure how long it takes to import the package and start the CLI.
+
+Run with the package installed:
+
+    python benchmarks/import_benchmark.py
+    python benchmarks/import_benchmark.py --budget 50
+
+Each command is run in a fresh interpreter with `python -X importtime`, which
+reports the time spent importing every module. The script prints the cumulative
+import time of the commands (the best of several runs) and the slowest modules
+they import. With `--budget` it exits with status 1 if a command spends more
+than the given number of milliseconds on imports.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+
+import click
+
+COMMANDS = {
+    "import": ["-c", "import crazyeights"],
+    "import_game": ["-c", "from crazyeights import CrazyEightsGame"],
+    "cli_help": ["-m", "crazyeights", "--help"],
+    "simulate_help": ["-m", "crazyeights", "simulate", "--help"],
+}
+
+
+def parse_importtime(output: str) -> tuple[int, dict[str, int]]:
+    """Return the total import time in microseconds and the cumulative import
+    time of each module from the output of `python -X importtime`."""
+    total = 0
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        name = module.strip()
+        times[name] = int(cumulative)
+        # Nested imports are indented by two more spaces than their parent; the
+        # times of the top-level imports add up to the total.
+        if len(module) - len(module.lstrip()) == 1:
+            total += int(cumulative)
+    return total, times
+
+
+def measure_imports(args: list[str]) -> tuple[int, dict[str, int]]:
+    """Return the total import time of a command in microseconds and the
+    cumulative import times of its modules."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(process.stderr)
+
+
+def run_benchmarks(names, repeat: int, num_modules: int) -> dict:
+    results = {}
+    for name in names:
+        total, modules = min(
+            (measure_imports(COMMANDS[name]) for _ in range(repeat)),
+            key=lambda measurement: measurement[0],
+        )
+        slowest = sorted(modules.items(), key=lambda item: -item[1])[:num_modules]
+        results[name] = {"import_ms": total / 1000, "modules": len(modules)}
+        click.echo(f"{name:>15}: {total / 1000:7.1f} ms, {len(modules)} modules")
+        for module, time in slowest:
+            click.echo(f"{'':>17}{time / 1000:7.1f} ms  {module}")
+    return results
+
+
+@click.command()
+@click.argument("names", nargs=-1, type=click.Choice(list(COMMANDS)))
+@click.option("--repeat", default=5, show_default=True, help="Runs per command.")
+@click.option(
+    "--modules",
+    "num_modules",
+    default=5,
+    show_default=True,
+    help="Number of slowest modules to show.",
+)
+@click.option("--json", "json_file", type=click.File("w"), help="Save the results.")
+@click.option(
+    "--budget",
+    type=float,
+    help="Maximum import time of each command in milliseconds.",
+)
+def main(names, repeat, num_modules, json_file, budget):
+    """Measure the import time of the commands NAMES (default: all)."""
+    results = run_benchmarks(names or COMMANDS, repeat, num_modules)
+    if json_file is not None:
+        data = {"python": platform.python_version(), "benchmarks": results}
+        json.dump(data, json_file, indent=2)
+    if budget is not None:
+        over_budget = [
+            name for name, result in results.items() if result["import_ms"] > budget
+        ]
+        if over_budget:
+            click.echo(f"Over the budget of {budget} ms: {', '.join(over_budget)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Benchmarks for the hot paths of the game loop.
+
+Run with the package installed:
+
+    python benchmarks/run_benchmarks.py --json baseline.json
+    python benchmarks/run_benchmarks.py --compare baseline.json
+
+Each benchmark reports the number of operations per second (the best of several
+repeats) and the memory allocated by a single operation, measured with
+`tracemalloc`: the number of memory blocks that are still allocated when the
+operation returns (including its result) and the peak number of bytes allocated
+while it runs. With `--compare` the results are compared with a
+previous run, and the script exits with status 1 if any benchmark got slower by
+more than the tolerance.
+"""
+
+import itertools
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Callable
+
+import click
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.deck import Card, Deck, short_string
+from crazyeights.game import CrazyEightsGame
+from crazyeights.notifier import NullNotifier
+from crazyeights.player import TurnContext
+from crazyeights.simulation import create_headless_players
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Register a function that sets up a benchmark and returns the operation."""
+
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def create_player() -> GreedyPlayer:
+    player = GreedyPlayer("Bench", NullNotifier)
+    player.draw_n_cards(Deck(random.Random(2023)), 7)
+    return player
+
+
+# A top discard that matches some, but not all cards of `create_player`'s hand.
+TOP_DISCARD = Card("Clubs", "7")
+
+
+@benchmark("deck")
+def bench_deck():
+    rng = random.Random(0)
+    return lambda: Deck(rng)
+
+
+@benchmark("get_playable_cards")
+def bench_get_playable_cards():
+    player = create_player()
+    return lambda: player.get_playable_cards(TOP_DISCARD)
+
+
+@benchmark("pick_card_to_play")
+def bench_pick_card_to_play():
+    player = create_player()
+    # A context is created once per turn, so its cost is part of the decision.
+    return lambda: player.pick_card_to_play(TurnContext(player.hand, TOP_DISCARD))
+
+
+@benchmark("short_string")
+def bench_short_string():
+    hand = create_player().hand
+    return lambda: short_string(hand)
+
+
+@benchmark("game")
+def bench_game():
+    # The games are different in each run, so cycle through a fixed set of seeds
+    # to make the results comparable.
+    seeds = itertools.cycle(range(100))
+
+    def play_game():
+        players = create_headless_players(2)
+        return CrazyEightsGame(players, random.Random(next(seeds))).play()
+
+    return play_game
+
+
+def measure_speed(operation, repeat: int = 5) -> float:
+    """Return the number of operations per second in the fastest repeat."""
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def measure_allocations(operation, number: int = 20) -> tuple[int, int]:
+    """Return the number of blocks left allocated and the peak number of bytes
+    allocated by a single operation (the maximum over `number` runs)."""
+    operation()
+    tracemalloc.start()
+    try:
+        max_blocks = max_bytes = 0
+        for _ in range(number):
+            before = tracemalloc.take_snapshot()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            result = operation()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            del result
+            blocks = sum(
+                stat.count_diff
+                for stat in after.compare_to(before, "traceback")
+                if stat.count_diff > 0
+            )
+            max_blocks = max(max_blocks, blocks)
+            max_bytes = max(max_bytes, peak - current)
+        return max_blocks, max_bytes
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(names) -> dict:
+    results = {}
+    for name in names:
+        operation = BENCHMARKS[name]()
+        ops_per_sec = measure_speed(operation)
+        blocks, peak_bytes = measure_allocations(operation)
+        results[name] = {
+            "ops_per_sec": ops_per_sec,
+            "allocated_blocks": blocks,
+            "peak_bytes": peak_bytes,
+        }
+        click.echo(
+            f"{name:>20}: {ops_per_sec:12,.0f} ops/s "
+            f"{blocks:6} blocks {peak_bytes:9,} bytes"
+        )
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Print the change of each benchmark and return the names of the benchmarks
+    that got slower by more than `tolerance`."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]
+        ratio = result["ops_per_sec"] / old["ops_per_sec"]
+        regressed = ratio < 1 - tolerance
+        if regressed:
+            regressions.append(name)
+        click.echo(
+            f"{name:>20}: {ratio - 1:+8.1%} ops/s, "
+            f"{result['allocated_blocks'] - old['allocated_blocks']:+6} blocks, "
+            f"{result['peak_bytes'] - old['peak_bytes']:+9,} bytes"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return regressions
+
+
+@click.command()
+@click.argument("names", nargs=-1, type=click.Choice(list(BENCHMARKS)))
+@click.option("--json", "json_file", type=click.File("w"), help="Save the results.")
+@click.option(
+    "--compare",
+    "baseline_file",
+    type=click.File("r"),
+    help="Compare the results with a saved baseline.",
+)
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.1,
+    show_default=True,
+    help="Allowed slowdown relative to the baseline.",
+)
+def main(names, json_file, baseline_file, tolerance):
+    """Run the benchmarks NAMES (default: all)."""
+    results = run_benchmarks(names or BENCHMARKS)
+    if json_file is not None:
+        data = {"python": platform.python_version(), "benchmarks": results}
+        json.dump(data, json_file, indent=2)
+    if baseline_file is not None:
+        baseline = json.load(baseline_file)["benchmarks"]
+        click.echo(f"\nCompared with baseline (tolerance {tolerance:.0%}):")
+        if compare(results, baseline, tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Compare the cost of cloning a game with `copy.deepcopy` and with snapshots.
+
+Run with `python benchmarks/snapshot_benchmark.py` with the package installed.
+"""
+
+import copy
+import random
+import timeit
+
+from crazyeights.game import CrazyEightsGame
+from crazyeights.simulation import create_headless_players
+
+NUMBER = 2_000
+
+
+def main():
+    game = CrazyEightsGame(create_headless_players(2), random.Random(2023))
+    for _ in range(6):
+        game.play_turn()
+    players = create_headless_players(2)
+    snapshot = game.snapshot()
+
+    timings = {
+        "deepcopy": lambda: copy.deepcopy(game),
+        "snapshot": game.snapshot,
+        "restore": lambda: game.restore(snapshot),
+        "from_snapshot": lambda: CrazyEightsGame.from_snapshot(snapshot, players),
+    }
+    for name, function in timings.items():
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:>14}: {seconds * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
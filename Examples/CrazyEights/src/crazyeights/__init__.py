@@ -1,7 +1,44 @@
-from .deck import Card, Deck
-from .player import Player
-from .game import CrazyEightsGame
-from .ai.player import GreedyPlayer
-from .interactive.player import InteractivePlayer
+"""An implementation of the Crazy Eights card game.
+
+The classes exported by the package are imported on first access, so that
+`import crazyeights` (and every process that only needs one of its modules)
+does not pay for importing the whole game.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ai.player import GreedyPlayer
+    from .deck import Card, Deck
+    from .game import CrazyEightsGame
+    from .interactive.player import InteractivePlayer
+    from .player import Player
 
 __version__ = "0.0.1"
+
+# The module that defines each attribute loaded by `__getattr__`.
+_LAZY_ATTRIBUTES = {
+    "Card": ".deck",
+    "Deck": ".deck",
+    "Player": ".player",
+    "CrazyEightsGame": ".game",
+    "GreedyPlayer": ".ai.player",
+    "InteractivePlayer": ".interactive.player",
+}
+
+__all__ = [*_LAZY_ATTRIBUTES, "__version__"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache the attribute so that `__getattr__` is not called for it again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
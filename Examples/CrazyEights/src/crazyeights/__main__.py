@@ -1,39 +1,268 @@
-import random
+"""The command line interface.
+
+The CLI is started many times by scripts, so only `click` is imported when the
+module is loaded; each command imports the modules it needs when it runs.
+"""
 
 import click
 
-from crazyeights.game import CrazyEightsGame
-from crazyeights.interactive.player import InteractivePlayer
-from crazyeights.ai.player import GreedyPlayer
+from crazyeights.remote import DEFAULT_COORDINATOR_PORT, DEFAULT_PORT
 
 
 def play_game(players):
+    from crazyeights.game import CrazyEightsGame
+
     game = CrazyEightsGame(players)
     result = game.play()
     game.print_result(result)
 
 
-def main(interactive, greedy, seed):
-    interactive_players = [InteractivePlayer(name) for name in interactive]
-    computer_players = [GreedyPlayer(name) for name in greedy]
-    players = interactive_players + computer_players
-    if len(players) < 2:
-        for i in range(2 - len(players)):
-            players.append(GreedyPlayer(f"Computer {i + 1}"))
+def main(player_specs, seed):
+    import random
+
+    from crazyeights.strategies import create_players
+
+    specs = list(player_specs)
+    for i in range(2 - len(specs)):
+        specs.append((f"Computer {i + 1}", "greedy"))
+    players = create_players(specs)
     if seed >= 0:
         random.seed(seed)
     play_game(players)
 
 
-@click.command()
+def parse_player_specs(ctx, param, values):
+    from crazyeights.strategies import parse_player_spec
+
+    try:
+        return [parse_player_spec(value) for value in values]
+    except ValueError as error:
+        raise click.BadParameter(str(error)) from error
+
+
+def run_simulation(
+    num_games,
+    seed,
+    num_players,
+    engine,
+    workers=1,
+    log_file=None,
+    results_path=None,
+    checkpoint_path=None,
+    checkpoint_interval=None,
+):
+    from crazyeights.results import ResultsWriter
+    from crazyeights.simulation import simulate
+    from crazyeights.tournament import run_tournament
+
+    if workers == 1 and checkpoint_path is None:
+        results = ResultsWriter(results_path, num_players) if results_path else None
+        try:
+            stats = simulate(num_games, seed, num_players, engine, log_file, results)
+        finally:
+            if results is not None:
+                results.close()
+    else:
+        stats = run_tournament(
+            num_games,
+            seed,
+            num_players,
+            engine,
+            workers=workers or None,
+            results_path=results_path,
+            checkpoint_path=checkpoint_path,
+            checkpoint_interval=checkpoint_interval,
+        )
+    print(stats.report())
+
+
+@click.group(invoke_without_command=True)
 @click.option(
-    "-i", "--interactive", multiple=True, help="Names of interactive players."
+    "--player",
+    "player_specs",
+    multiple=True,
+    metavar="NAME:STRATEGY",
+    callback=parse_player_specs,
+    help="A player and its strategy, e.g., Alice:interactive (see `strategies`).",
 )
-@click.option("-g", "--greedy", multiple=True, help="Names of greedy players.")
 @click.option("--seed", default=-1, help="Random seed.")
 @click.version_option()
-def app(interactive, greedy, seed):
-    main(interactive, greedy, seed)
+@click.pass_context
+def app(ctx, player_specs, seed):
+    if ctx.invoked_subcommand is None:
+        from crazyeights.strategies import UnknownStrategyError
+
+        try:
+            main(player_specs, seed)
+        except UnknownStrategyError as error:
+            raise click.BadParameter(error.args[0], param_hint="'--player'") from error
+
+
+@app.command("strategies")
+def strategies_command():
+    """List the available player strategies."""
+    from crazyeights.strategies import available_strategies
+
+    for name, entry_point in sorted(available_strategies().items()):
+        click.echo(f"{name:15} {entry_point.value}")
+
+
+@app.command("simulate")
+@click.option("-n", "--num-games", default=1000, help="Number of games to play.")
+@click.option("-p", "--num-players", default=2, help="Number of players per game.")
+@click.option("--seed", default=-1, help="Random seed.")
+@click.option(
+    "--engine",
+    type=click.Choice(["object", "fast", "numpy"]),
+    default="object",
+    help="Game engine used for the simulation.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=1,
+    help="Number of worker processes (0 for one per CPU).",
+)
+@click.option(
+    "--log",
+    "log_file",
+    type=click.File("w", encoding="utf-8"),
+    help="Write all games to this file (object engine and a single worker only).",
+)
+@click.option(
+    "--results",
+    "results_path",
+    type=click.Path(dir_okay=False),
+    help="Append the outcome of every game to this binary results file.",
+)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False),
+    help="Save the progress to this file and resume from it if it exists.",
+)
+@click.option(
+    "--checkpoint-interval",
+    default=60.0,
+    help="Seconds between checkpoints.",
+)
+def simulate_command(
+    num_games,
+    num_players,
+    seed,
+    engine,
+    workers,
+    log_file,
+    results_path,
+    checkpoint_path,
+    checkpoint_interval,
+):
+    """Play games between computer players without output and report statistics."""
+    if log_file is not None and (
+        engine != "object" or workers != 1 or checkpoint_path is not None
+    ):
+        raise click.UsageError(
+            "--log requires the object engine and one worker, without --checkpoint."
+        )
+    from crazyeights.tournament import CheckpointError
+
+    try:
+        run_simulation(
+            num_games,
+            seed,
+            num_players,
+            engine,
+            workers,
+            log_file,
+            results_path,
+            checkpoint_path,
+            checkpoint_interval,
+        )
+    except CheckpointError as error:
+        raise click.UsageError(str(error)) from error
+
+
+@app.command("serve")
+@click.option("--host", default="127.0.0.1", help="Address to listen on.")
+@click.option("--port", default=DEFAULT_PORT, help="Port to listen on.")
+@click.option("--humans", default=1, help="Number of human players per table.")
+@click.option("--computers", default=1, help="Number of computer players per table.")
+@click.option("--timeout", default=60.0, help="Seconds a player has for each decision.")
+@click.option("--seed", default=-1, help="Random seed.")
+@click.option(
+    "--metrics",
+    "metrics_path",
+    type=click.Path(dir_okay=False),
+    help="Write metrics to this file in the Prometheus text format.",
+)
+def serve_command(host, port, humans, computers, timeout, seed, metrics_path):
+    """Host games for players connecting over TCP, e.g., with `nc`."""
+    import asyncio
+
+    from crazyeights.metrics import PrometheusTextSink
+    from crazyeights.remote.server import GameServer
+
+    metrics_sink = PrometheusTextSink(metrics_path) if metrics_path else None
+    server = GameServer(host, port, humans, computers, timeout, seed, metrics_sink)
+    click.echo(f"Serving Crazy Eights on {host}:{port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if metrics_sink is not None:
+            metrics_sink.close()
+
+
+@app.command("coordinate")
+@click.option("-n", "--num-games", default=1000, help="Number of games to play.")
+@click.option("-p", "--num-players", default=2, help="Number of players per game.")
+@click.option("--seed", default=-1, help="Random seed.")
+@click.option(
+    "--engine",
+    type=click.Choice(["object", "fast", "numpy"]),
+    default="object",
+    help="Game engine used by the workers.",
+)
+@click.option("--chunk-size", default=1000, help="Number of games per work item.")
+@click.option("--host", default="127.0.0.1", help="Address to listen on.")
+@click.option("--port", default=DEFAULT_COORDINATOR_PORT, help="Port to listen on.")
+@click.option(
+    "--timeout",
+    default=600.0,
+    help="Seconds a worker has for a chunk before it is reassigned.",
+)
+def coordinate_command(
+    num_games, num_players, seed, engine, chunk_size, host, port, timeout
+):
+    """Hand out games to workers on other machines and report the statistics."""
+    import asyncio
+
+    from crazyeights.remote.cluster import Coordinator
+
+    coordinator = Coordinator(
+        num_games, seed, num_players, engine, chunk_size, host, port, timeout
+    )
+    click.echo(f"Coordinating {num_games} games on {host}:{port}")
+    stats = asyncio.run(coordinator.run())
+    print(stats.report())
+    for name, num_chunks in sorted(coordinator.chunks_by_worker.items()):
+        print(f"Worker {name}: {num_chunks} chunks")
+    print(f"Chunks reassigned: {coordinator.num_reassigned}")
+
+
+@app.command("work")
+@click.option("--host", default="127.0.0.1", help="Address of the coordinator.")
+@click.option(
+    "--port", default=DEFAULT_COORDINATOR_PORT, help="Port of the coordinator."
+)
+@click.option("--name", help="Name reported to the coordinator (default: host name).")
+def work_command(host, port, name):
+    """Play games handed out by a coordinator until all games are played."""
+    from crazyeights.remote.cluster import run_worker
+
+    num_chunks = run_worker(host, port, name)
+    click.echo(f"Played {num_chunks} chunks.")
 
 
 if __name__ == "__main__":
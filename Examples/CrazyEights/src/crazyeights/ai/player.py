@@ -1,33 +1,236 @@
+import random
+import time
 from abc import ABC
+from typing import TYPE_CHECKING, Callable, Optional
 
 from crazyeights.ai.notifier import ComputerPlayerNotifier
-from crazyeights.deck import Card, RANKS, SUITS
-from crazyeights.player import Player
+from crazyeights.ai.policy import greedy_card
+from crazyeights.deck import CARDS_BY_INDEX, Card, RANKS, SUITS
+from crazyeights.endgame import EndgameSolver, SearchLimitExceeded
+from crazyeights.fast import (
+    EIGHT_BASE,
+    NUM_CARDS,
+    NUM_SUITS,
+    FastCrazyEightsGame,
+    cards_to_mask,
+)
+from crazyeights.game import GameResult
+from crazyeights.notifier import Notifier
+from crazyeights.player import Player, TurnContext
+
+if TYPE_CHECKING:
+    from crazyeights.game import CrazyEightsGame
 
 
 class ComputerPlayer(Player, ABC):
-    """A superclass for automated players."""
+    """A superclass for automated players.
+
+    The notifier is created by calling `notifier_factory` with the player; by default
+    a `ComputerPlayerNotifier` is used that prints to the console.
+
+    If an `endgame_solver` is given, the player plays the moves of the solver
+    instead of its own strategy as soon as the deck is empty in a game between two
+    players: then the opponent's hand consists of all cards that are neither in
+    the player's hand nor on the discard pile, and the solver can find the best
+    move. If the solver exceeds its search limit, the player's strategy is used."""
 
-    def __init__(self, name):
-        notifier = ComputerPlayerNotifier(self)
+    def __init__(
+        self,
+        name,
+        notifier_factory: Optional[Callable[[Player], Notifier]] = None,
+        endgame_solver: Optional[EndgameSolver] = None,
+    ):
+        if notifier_factory is None:
+            notifier_factory = ComputerPlayerNotifier
+        notifier = notifier_factory(self)
         super().__init__(name, notifier)
+        self.endgame_solver = endgame_solver
+        self.endgame_suit: Optional[str] = None
+
+    def try_to_play_card(
+        self, game: "CrazyEightsGame", context: Optional[TurnContext] = None
+    ) -> bool:
+        if self.endgame_solver is not None and not game.deck and len(game.players) == 2:
+            start = time.perf_counter()
+            move = self.solve_endgame(game)
+            if game.metrics is not None:
+                game.metrics.add_time("pick_seconds", self, time.perf_counter() - start)
+            if move is not None:
+                card, self.endgame_suit = move
+                if card is None:
+                    return False
+                self.play_card(game, card)
+                return True
+        return super().try_to_play_card(game, context)
+
+    def solve_endgame(
+        self, game: "CrazyEightsGame"
+    ) -> Optional[tuple[Optional[Card], Optional[str]]]:
+        """Return the move of the endgame solver, or None if it took too long."""
+        seen = set(self.hand)
+        seen.update(game.discard_pile)
+        opponent_hand = [card for card in CARDS_BY_INDEX if card not in seen]
+        try:
+            return self.endgame_solver.best_move(
+                [self.hand, opponent_hand],
+                game.top_discard,
+                game.active_suit,
+                game.num_players_skipped,
+            )
+        except SearchLimitExceeded:
+            return None
 
     def pick_suit(self) -> str:
-        """Pick the suit that the player has the most of."""
-        suit_counts = {suit: 0 for suit in SUITS}
-        for card in self.hand:
-            suit_counts[card.suit] += 1
-        return max(suit_counts, key=lambda suit: suit_counts[suit])
+        """Pick the suit chosen by the endgame solver or, outside the endgame, the
+        suit that the player has the most of."""
+        if self.endgame_suit is not None:
+            suit, self.endgame_suit = self.endgame_suit, None
+            return suit
+        return max(SUITS, key=self.hand.count_suit)
 
 
 class GreedyPlayer(ComputerPlayer):
     """An automated player that always plays the highest ranked card."""
 
-    def pick_card_to_play(self, top_discard: Card) -> Card | None:
-        """Pick the highest ranked playable card."""
-        playable_cards = self.get_playable_cards(top_discard)
-        if playable_cards:
-            return max(playable_cards, key=lambda card: RANKS.index(card.rank))
-        elif eight := self.get_eight():
-            return eight
-        return None
+    def pick_card_to_play(self, context: TurnContext) -> Card | None:
+        """Pick the highest ranked playable card; ties go to the card that comes
+        first in the hand."""
+        return greedy_card(context.hand, context.top_discard, context.active_suit)
+
+    # Batched decisions for `crazyeights.vectorized`; see `crazyeights.strategies`.
+
+    @classmethod
+    def pick_cards_batch(cls, hands, playable, hand_order):
+        """Pick the highest ranked playable card of each of many players; ties go
+        to the card that comes first in the hand."""
+        import numpy as np
+
+        ranks = np.arange(NUM_CARDS) // NUM_SUITS
+        priorities = np.where(
+            playable, ranks * NUM_CARDS + (NUM_CARDS - 1 - hand_order), -1
+        )
+        return np.where(playable.any(axis=1), priorities.argmax(axis=1), -1)
+
+    @classmethod
+    def pick_suits_batch(cls, hands):
+        """Pick the suit that each of many players has the most of."""
+        return hands.reshape(len(hands), -1, NUM_SUITS).sum(axis=1).argmax(axis=1)
+
+
+# A move is a card to play and, for a crazy 8, the suit to pick.
+Move = tuple[Card, Optional[str]]
+
+
+class MonteCarloPlayer(ComputerPlayer):
+    """An automated player that evaluates its moves by playing out the game.
+
+    For each decision the player deals the cards it has not seen (i.e., the cards
+    that are neither in its hand nor on the discard pile) randomly to the hands of
+    its opponents and the deck. In each of these samples it tries every playable
+    card (and every suit for an 8) and plays the rest of the game with the greedy
+    strategy of `crazyeights.fast`, without any output. It picks the move that won
+    most often; ties go to the move `GreedyPlayer` would pick.
+
+    `rollouts` is the number of games played out per decision; it is split evenly
+    between the possible moves. `rng` is used to sample the unseen cards; by
+    default the player uses the random number generator of the game (or the
+    global one if the game has none), so games with a seed are reproducible."""
+
+    def __init__(
+        self,
+        name,
+        notifier_factory: Optional[Callable[[Player], Notifier]] = None,
+        rollouts: int = 200,
+        rng: Optional[random.Random] = None,
+        endgame_solver: Optional[EndgameSolver] = None,
+    ):
+        if rollouts < 1:
+            raise ValueError("The number of rollouts must be positive.")
+        super().__init__(name, notifier_factory, endgame_solver)
+        self.rollouts = rollouts
+        self.rng = rng
+        self.picked_suit: Optional[str] = None
+
+    def pick_card_to_play(self, context: TurnContext) -> Card | None:
+        """Pick the playable card with the most wins in the rollouts."""
+        self.picked_suit = None
+        playable_cards = sorted(
+            context.playable_cards,
+            key=lambda card: RANKS.index(card.rank),
+            reverse=True,
+        )
+        if not playable_cards:
+            return None
+        moves: list[Move] = []
+        for card in playable_cards:
+            if card.rank == "8":
+                # The suits the player holds most of (without the 8) come first,
+                # so that ties go to the suit `ComputerPlayer.pick_suit` picks.
+                suits = sorted(
+                    SUITS,
+                    key=lambda suit: self.hand.count_suit(suit) - (card.suit == suit),
+                    reverse=True,
+                )
+                moves.extend((card, suit) for suit in suits)
+            else:
+                moves.append((card, None))
+        if context.game is None:
+            # Without the game there is nothing to sample; play like a greedy player.
+            return playable_cards[0]
+        if len(moves) > 1:
+            wins = self.evaluate_moves(context.game, moves)
+            moves = [moves[wins.index(max(wins))]]
+        card, self.picked_suit = moves[0]
+        return card
+
+    def pick_suit(self) -> str:
+        """Pick the suit chosen in the rollouts, or the suit the player has the
+        most of."""
+        if self.picked_suit is None:
+            return super().pick_suit()
+        suit, self.picked_suit = self.picked_suit, None
+        return suit
+
+    def evaluate_moves(self, game: "CrazyEightsGame", moves: list[Move]) -> list[int]:
+        """Return the number of rollouts each move won in `game`."""
+        players = game.players
+        seat = players.index(self)
+        opponent_hand_sizes = [
+            len(player.hand) for player in players[seat + 1 :] + players[:seat]
+        ]
+        seen = set(self.hand)
+        seen.update(game.discard_pile)
+        unseen = [card.index for card in CARDS_BY_INDEX if card not in seen]
+        hand = cards_to_mask(self.hand)
+        # The rollouts start with the next player, who sits at index 1.
+        next_player = 1 % len(players)
+
+        rng = self.rng or game.rng or random
+        wins = [0] * len(moves)
+        for _ in range(max(1, self.rollouts // len(moves))):
+            rng.shuffle(unseen)
+            opponent_hands = []
+            start = 0
+            for size in opponent_hand_sizes:
+                mask = 0
+                for index in unseen[start : start + size]:
+                    mask |= 1 << index
+                opponent_hands.append(mask)
+                start += size
+            deck = unseen[start:]
+            for i, (card, suit) in enumerate(moves):
+                remaining = hand & ~(1 << card.index)
+                if not remaining:
+                    wins[i] += 1
+                    continue
+                top = card.index if suit is None else EIGHT_BASE + SUITS.index(suit)
+                rollout = FastCrazyEightsGame.from_state(
+                    [remaining, *opponent_hands], deck.copy(), top, next_player
+                )
+                result = rollout.play()
+                if (
+                    result == GameResult.CURRENT_PLAYER_WON
+                    and rollout.current_player_index == 0
+                ):
+                    wins[i] += 1
+        return wins
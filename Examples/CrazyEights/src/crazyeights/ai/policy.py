@@ -0,0 +1,62 @@
+"""The decisions of the greedy strategy, computed on bitmasks.
+
+`GreedyPlayer` plays the highest ranked card that matches the top of the discard
+pile; its decision depends only on the cards in its hand, the top discard and the
+active suit. With the cards of the hand as a bitmask (`Hand.mask`) and the cards
+that match the top as another (`crazyeights.fast.MATCH_MASKS`), the rank to play
+is found with a handful of integer operations. Ties between playable cards of the
+picked rank are broken by the order of the hand.
+"""
+
+from typing import Optional
+
+from crazyeights.deck import RANKS, SUITS, Card
+from crazyeights.fast import EIGHT_BASE, MATCH_MASKS, NUM_SUITS
+from crazyeights.hand import Hand
+
+NO_CARD = -1
+
+
+def top_code(top_discard: Card, active_suit: Optional[str] = None) -> int:
+    """Return the index of the top discard, or of the 8 of `active_suit` (as in
+    `crazyeights.fast`) if a suit was picked for a crazy 8."""
+    if active_suit is None:
+        return top_discard.index
+    return EIGHT_BASE + SUITS.index(active_suit)
+
+
+def greedy_rank(hand_mask: int, top: int) -> int:
+    """Return the index of the rank the greedy strategy plays from the hand with
+    the given mask on the top code `top`, or `NO_CARD` if it cannot play.
+
+    Examples:
+    >>> hand = Hand([Card("Hearts", "2"), Card("Hearts", "King"), Card("Clubs", "Ace")])
+    >>> RANKS[greedy_rank(hand.mask, top_code(Card("Hearts", "7")))]
+    'King'
+    >>> greedy_rank(hand.mask, top_code(Card("Spades", "7")))
+    -1
+    """
+    playable = hand_mask & MATCH_MASKS[top]
+    # Cards are indexed rank-major, so the highest playable card has the highest
+    # rank.
+    return (playable.bit_length() - 1) // NUM_SUITS if playable else NO_CARD
+
+
+def greedy_card(
+    hand: Hand, top_discard: Card, active_suit: Optional[str] = None
+) -> Card | None:
+    """Return the card `GreedyPlayer` plays from `hand`, or None.
+
+    Examples:
+    >>> hand = Hand([Card("Hearts", "King"), Card("Spades", "King")])
+    >>> greedy_card(hand, Card("Clubs", "King"))
+    Card(Hearts, King)
+    >>> greedy_card(hand, Card("Clubs", "7")) is None
+    True
+    """
+    playable = hand.mask & MATCH_MASKS[top_code(top_discard, active_suit)]
+    if not playable:
+        return None
+    rank = RANKS[(playable.bit_length() - 1) // NUM_SUITS]
+    # Every bit of `playable` is a card in the hand, so one of them matches.
+    return next(card for card in hand.cards_of_rank(rank) if playable >> card.index & 1)
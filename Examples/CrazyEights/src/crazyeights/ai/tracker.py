@@ -0,0 +1,145 @@
+"""Card counting for computer players.
+
+A `CardTracker` follows a game as a `GameObserver` and keeps what one player can
+know about the cards it has not seen: which cards these are, how many cards each
+player holds, and which suits the other players could not follow. Every event
+updates the tracker in constant time, and the cards are stored as bitmasks with
+the indices of `crazyeights.fast`, so queries are cheap as well.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from crazyeights.ai.policy import top_code
+from crazyeights.deck import CARDS_BY_INDEX, SUITS, Card
+from crazyeights.fast import MATCH_MASKS, NUM_CARDS, SUIT_MASKS, cards_to_mask
+from crazyeights.observer import GameObserver
+from crazyeights.player import Player
+
+if TYPE_CHECKING:
+    from crazyeights.game import CrazyEightsGame
+
+ALL_CARDS = (1 << NUM_CARDS) - 1
+
+
+class CardTracker(GameObserver):
+    """Tracks the unseen cards of a game from the point of view of `player`.
+
+    Add the tracker to a game with `game.add_observer(tracker)`; it can be added
+    at any time, since it starts from the current state of the game. The tracker
+    assumes a full deck.
+
+    A player who has to draw could not follow the suit to match; the tracker
+    records this suit as a void of the player. The player then holds an unknown
+    card, which may belong to any of its earlier voids, so only the current suit
+    is kept. This assumes that a player plays the drawn card if it matches, as
+    the computer players do.
+
+    Examples:
+    >>> from crazyeights.simulation import create_headless_players
+    >>> from crazyeights.game import CrazyEightsGame
+    >>> import random
+    >>> players = create_headless_players(2)
+    >>> game = CrazyEightsGame(players, random.Random(1))
+    >>> tracker = CardTracker(players[0])
+    >>> game.add_observer(tracker)
+    >>> tracker.num_unseen, tracker.hand_sizes, tracker.deck_size
+    (44, [7, 7], 37)
+    >>> for _ in range(6):
+    ...     _ = game.play_turn()
+    >>> tracker.deck_size == len(game.deck)
+    True
+    """
+
+    def __init__(self, player: Player):
+        self.player = player
+        self.player_index = -1
+        self.unseen = ALL_CARDS
+        self.hand_sizes: list[int] = []
+        self.voids: list[set[str]] = []
+        self.top_discard: Optional[Card] = None
+        self.active_suit: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<CardTracker for {self.player.name}: {self.num_unseen} unseen cards>"
+
+    def start(self, game: "CrazyEightsGame") -> None:
+        self.player_index = next(
+            i for i, player in enumerate(game.players) if player is self.player
+        )
+        seen = cards_to_mask(self.player.hand) | cards_to_mask(game.discard_pile)
+        self.unseen = ALL_CARDS & ~seen
+        self.hand_sizes = [len(player.hand) for player in game.players]
+        self.voids = [set() for _ in game.players]
+        self.top_discard = game.top_discard
+        self.active_suit = game.active_suit
+
+    def card_played(self, player_index: int, card: Card) -> None:
+        self.unseen &= ~(1 << card.index)
+        self.hand_sizes[player_index] -= 1
+        self.top_discard = card
+        self.active_suit = None
+
+    def suit_picked(self, player_index: int, suit: str) -> None:
+        self.active_suit = suit
+
+    def card_drawn(self, player_index: int, card: Optional[Card]) -> None:
+        suit_to_follow = self.active_suit or self.top_discard.suit
+        if card is None:
+            self.voids[player_index].add(suit_to_follow)
+            return
+        self.hand_sizes[player_index] += 1
+        if player_index == self.player_index:
+            self.unseen &= ~(1 << card.index)
+        else:
+            self.voids[player_index] = {suit_to_follow}
+
+    @property
+    def num_unseen(self) -> int:
+        return self.unseen.bit_count()
+
+    @property
+    def unseen_cards(self) -> list[Card]:
+        """The cards that are neither in the player's hand nor on the discard pile."""
+        return [CARDS_BY_INDEX[i] for i in range(NUM_CARDS) if self.unseen >> i & 1]
+
+    @property
+    def deck_size(self) -> int:
+        """The number of cards left in the deck."""
+        opponents = sum(self.hand_sizes) - self.hand_sizes[self.player_index]
+        return self.num_unseen - opponents
+
+    def void_mask(self) -> int:
+        """Return the unseen cards of the suits that no other player can hold;
+        these cards must be in the deck."""
+        mask = ALL_CARDS
+        for index, voids in enumerate(self.voids):
+            if index != self.player_index and self.hand_sizes[index]:
+                mask &= sum(SUIT_MASKS[SUITS.index(suit)] for suit in voids)
+        return self.unseen & mask
+
+    def draw_probability(self, cards: int) -> float:
+        """Return the probability that the next card drawn is one of `cards`, a
+        bitmask of card indices.
+
+        Unseen cards of suits that all other players are void in are in the deck;
+        the remaining places in the deck are assumed to be equally likely to hold
+        any of the other unseen cards."""
+        deck_size = self.deck_size
+        if deck_size <= 0:
+            return 0.0
+        forced = self.void_mask()
+        num_forced = forced.bit_count()
+        num_free = self.num_unseen - num_forced
+        in_deck = (deck_size - num_forced) / num_free if num_free else 0.0
+        cards &= self.unseen
+        expected = (cards & forced).bit_count() + in_deck * (
+            cards & ~forced
+        ).bit_count()
+        return expected / deck_size
+
+    def probability_next_draw_playable(self) -> float:
+        """Return the probability that the next card drawn can be played on the
+        current top of the discard pile."""
+        return self.draw_probability(
+            MATCH_MASKS[top_code(self.top_discard, self.active_suit)]
+        )
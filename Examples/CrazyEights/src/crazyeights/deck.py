@@ -1,4 +1,5 @@
 import random
+from typing import Iterable, Optional
 
 SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
 RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King", "Ace"]
@@ -26,9 +27,67 @@ RANK_SYMBOLS = {
 
 
 class Card:
-    def __init__(self, suit, rank):
-        self.suit = suit
-        self.rank = rank
+    """A playing card.
+
+    Cards are immutable and there is exactly one instance of each of the 52 cards:
+    `Card(suit, rank)` returns the shared instance. Therefore, cards can be compared
+    by identity, used as dict keys or set members, and shared between any number of
+    decks, hands and games.
+
+    Each card has an `index` between 0 and 51. Cards are indexed rank-major, i.e.,
+    cards with higher ranks have higher indices.
+
+    Examples:
+    >>> Card("Hearts", "Ace") is Card("Hearts", "Ace")
+    True
+    >>> Card("Hearts", "Ace").index
+    48
+    >>> Card("Hearts", "Ace").suit = "Spades"
+    Traceback (most recent call last):
+    ...
+    AttributeError: Cards are immutable.
+    >>> Card("Hearts", "1")
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid card: 1 of Hearts.
+    """
+
+    __slots__ = ("suit", "rank", "index")
+
+    def __new__(cls, suit: str, rank: str) -> "Card":
+        try:
+            return _CARDS[suit, rank]
+        except KeyError:
+            raise ValueError(f"Invalid card: {rank} of {suit}.") from None
+
+    @classmethod
+    def _create(cls, suit: str, rank: str) -> "Card":
+        card = object.__new__(cls)
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(
+            card, "index", RANKS.index(rank) * len(SUITS) + SUITS.index(suit)
+        )
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Cards are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Cards are immutable.")
+
+    def __reduce__(self):
+        return Card, (self.suit, self.rank)
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo) -> "Card":
+        return self
+
+    # Since there is only one instance of each card, equality is identity.
+    def __hash__(self) -> int:
+        return self.index
 
     def __repr__(self) -> str:
         return f"Card({self.suit}, {self.rank})"
@@ -36,11 +95,6 @@ class Card:
     def __str__(self) -> str:
         return f"{self.rank} of {self.suit}"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Card):
-            return NotImplemented
-        return self.suit == other.suit and self.rank == other.rank
-
     @property
     def shorthand(self) -> str:
         """Return shorthand notation for card.
@@ -53,10 +107,12 @@ class Card:
         """
         return f"{RANK_SYMBOLS[self.rank]}{SUIT_SYMBOLS[self.suit]}"
 
-    def matches(self, top_discard: "Card") -> bool:
+    def matches(self, top_discard: "Card", active_suit: Optional[str] = None) -> bool:
         """Returns True if the card matches the given card.
 
-        Cards match if they have the same suit, rank, or if the card is an 8.
+        Cards match if they have the same suit, rank, or if the card is an 8. If a
+        crazy 8 is on top of the discard pile, `active_suit` is the suit picked by
+        the player who played it and has to be matched instead of the suit of the 8.
 
         Examples:
         >>> Card("Hearts", "Ace").matches(Card("Hearts", "King"))
@@ -71,14 +127,25 @@ class Card:
         False
         >>> Card("Hearts", "8").matches(Card("Diamonds", "8"))
         True
+        >>> Card("Hearts", "Ace").matches(Card("Diamonds", "8"), "Hearts")
+        True
         """
         return (
-            self.suit == top_discard.suit
+            self.suit == (active_suit or top_discard.suit)
             or self.rank == top_discard.rank
             or self.rank == "8"
         )
 
 
+_CARDS = {(suit, rank): Card._create(suit, rank) for suit in SUITS for rank in RANKS}
+
+# The 52 cards, in the order in which a new deck contains them before shuffling.
+CARDS = tuple(_CARDS.values())
+
+# The 52 cards, ordered by index.
+CARDS_BY_INDEX = tuple(sorted(CARDS, key=lambda card: card.index))
+
+
 def short_string(cards: list[Card]) -> str:
     """Return a short string representation of the given list of cards.
 
@@ -97,18 +164,66 @@ class Deck:
 
     Implements `__len__` and `__getitem__` methods and can therefore be treated as a
     sequence of remaining cards.
+
+    Internally the cards are stored in a tuple that is never modified, together
+    with the number of cards remaining; drawing a card only decrements that number.
+    Therefore, a snapshot of the deck is just the tuple and the number of cards, and
+    any number of snapshots and restored decks can share the same tuple.
     """
 
-    def __init__(self):
-        """Initialize deck of 52 cards. Cards are shuffled."""
-        self.cards = [Card(suit, rank) for suit in SUITS for rank in RANKS]
-        random.shuffle(self.cards)
+    def __init__(self, rng: Optional[random.Random] = None):
+        """Initialize deck of 52 cards. Cards are shuffled.
+
+        The cards are shuffled with `rng` if it is given, otherwise with the global
+        random number generator of the `random` module."""
+        cards = list(CARDS)
+        (rng or random).shuffle(cards)
+        self._cards = tuple(cards)
+        self._size = len(cards)
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Card]) -> "Deck":
+        """Return a deck containing the given cards in the given order.
+
+        Cards are drawn from the end.
+
+        Examples:
+        >>> deck = Deck.from_cards([Card("Hearts", "2"), Card("Clubs", "3")])
+        >>> deck.draw_card()
+        Card(Clubs, 3)
+        """
+        deck = cls.__new__(cls)
+        deck.cards = cards
+        return deck
+
+    @property
+    def cards(self) -> tuple[Card, ...]:
+        """The remaining cards as a tuple; the last card is drawn next.
+
+        The tuple cannot be modified; assign a new sequence of cards to change the
+        deck. Before the first card is drawn, this is the stored tuple itself."""
+        if self._size == len(self._cards):
+            return self._cards
+        return self._cards[: self._size]
+
+    @cards.setter
+    def cards(self, cards: Iterable[Card]) -> None:
+        self._cards = tuple(cards)
+        self._size = len(self._cards)
+
+    def snapshot(self) -> tuple[tuple[Card, ...], int]:
+        """Return the state of the deck. Takes constant time."""
+        return self._cards, self._size
+
+    def restore(self, state: tuple[tuple[Card, ...], int]) -> None:
+        """Restore a state returned by `snapshot`. Takes constant time."""
+        self._cards, self._size = state
 
     def __repr__(self) -> str:
-        return f"<Deck with {len(self.cards)} cards>"
+        return f"<Deck with {self._size} cards>"
 
     def __str__(self) -> str:
-        return f"Deck with {len(self.cards)} cards" if self.cards else "Empty deck"
+        return f"Deck with {self._size} cards" if self._size else "Empty deck"
 
     def __len__(self) -> int:
         """Return the number of cards remaining in deck.
@@ -118,11 +233,17 @@ class Deck:
         >>> len(deck)
         52
         """
-        return len(self.cards)
+        return self._size
 
     def __getitem__(self, index) -> Card:
         """Return the card at the given index."""
-        return self.cards[index]
+        if isinstance(index, slice):
+            return self.cards[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("deck index out of range")
+        return self._cards[index]
 
     @property
     def short_str(self) -> str:
@@ -136,4 +257,7 @@ class Deck:
             Card: The card drawn from the deck.
             None: If the deck is empty.
         """
-        return self.cards.pop() if self.cards else None
+        if not self._size:
+            return None
+        self._size -= 1
+        return self._cards[self._size]
@@ -0,0 +1,201 @@
+"""An exact solver for the endgame, i.e., the rest of a game once the deck is empty.
+
+Without a deck to draw from, nothing is left to chance: if the hands of all
+players are known, the best move can be found by searching the whole game tree.
+The solver searches it with the max-n algorithm, in which each player picks the
+move that is best for themselves, and stores the values of all positions it has
+solved in a transposition table. Each player scores 1 for a win, 0 for a loss and
+`1 / num_players` if no one wins.
+
+Positions use the representation of `crazyeights.fast`: hands are bitmasks and
+the top discard is the 8 of the picked suit after a crazy 8. Positions are
+rotated so that the player to move comes first; therefore, the same position is
+found in the table no matter whose turn it is.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, Optional, Sequence
+
+from crazyeights.deck import CARDS_BY_INDEX, SUITS, Card
+from crazyeights.fast import EIGHT, EIGHT_BASE, MATCH_MASKS, NUM_SUITS, cards_to_mask
+
+# A position: the hands (player to move first), the top discard and the number of
+# players that have passed since the last card was played.
+Position = tuple[tuple[int, ...], int, int]
+Value = tuple[float, ...]
+# A move: the index of the card to play and the resulting top discard, or None
+# for passing.
+Move = Optional[tuple[int, int]]
+# Positions kept in a transposition table by default: enough for the endgames of
+# normal games while bounding the memory of a solver that is kept for many games.
+# Pass a larger `max_entries` for long searches, e.g., to analyze positions
+# offline.
+DEFAULT_MAX_ENTRIES = 2**16
+
+
+class SearchLimitExceeded(Exception):
+    """Raised if a search visits more positions than the solver allows."""
+
+
+class TranspositionTable:
+    """A dict of solved positions that evicts the least recently used entries.
+
+    Examples:
+    >>> table = TranspositionTable(max_entries=2)
+    >>> table.put("a", 1)
+    >>> table.put("b", 2)
+    >>> table.get("a")
+    1
+    >>> table.put("c", 3)
+    >>> table.get("b") is None
+    True
+    >>> len(table), table.hits, table.misses
+    (2, 1, 1)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("The table must have room for at least one entry.")
+        self.max_entries = max_entries
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<TranspositionTable: {len(self)} of {self.max_entries} entries>"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value) -> None:
+        self.entries[key] = value
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class EndgameSolver:
+    """Finds the best moves in positions without a deck.
+
+    The transposition table is kept between searches, so that positions solved for
+    one move are not solved again for the next. A single search visits at most
+    `max_nodes` positions that are not in the table (if given); otherwise it raises
+    `SearchLimitExceeded`, which bounds the time a move takes."""
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, max_nodes: Optional[int] = None
+    ):
+        self.table = TranspositionTable(max_entries)
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+    def __repr__(self) -> str:
+        return f"<EndgameSolver: {self.table!r}>"
+
+    @staticmethod
+    def moves(hand: int, top: int) -> list[tuple[int, int]]:
+        """Return the cards that can be played from `hand` with the resulting top
+        discard, highest ranks first. An 8 can be played with every suit."""
+        moves = []
+        playable = hand & MATCH_MASKS[top]
+        while playable:
+            card = playable.bit_length() - 1
+            playable &= ~(1 << card)
+            if card // NUM_SUITS == EIGHT:
+                moves.extend((card, EIGHT_BASE + suit) for suit in range(NUM_SUITS))
+            else:
+                moves.append((card, card))
+        return moves
+
+    def solve(
+        self, hands: Sequence[int], top: int, num_players_skipped: int = 0
+    ) -> tuple[Value, Move]:
+        """Return the value of a position and the best move for the player to move.
+
+        `hands[0]` is the hand of the player to move, followed by the hands of the
+        next players in turn order."""
+        self.nodes = 0
+        hands = tuple(hands)
+        best_value, best_move = None, None
+        for move in [*self.moves(hands[0], top), None]:
+            value = self.value_after(hands, top, num_players_skipped, move)
+            if best_value is None or value[0] > best_value[0]:
+                best_value, best_move = value, move
+        return best_value, best_move
+
+    def value_after(
+        self, hands: tuple[int, ...], top: int, num_players_skipped: int, move: Move
+    ) -> Value:
+        """Return the value of the position after the player to move made `move`."""
+        num_players = len(hands)
+        if move is None:
+            if num_players_skipped + 1 == num_players:
+                return (1 / num_players,) * num_players
+            child = self.value((*hands[1:], hands[0]), top, num_players_skipped + 1)
+        else:
+            card, new_top = move
+            hand = hands[0] & ~(1 << card)
+            if not hand:
+                return (1.0,) + (0.0,) * (num_players - 1)
+            child = self.value((*hands[1:], hand), new_top, 0)
+        # The child's values start with the next player; rotate them back.
+        return child[-1:] + child[:-1]
+
+    def value(
+        self, hands: tuple[int, ...], top: int, num_players_skipped: int
+    ) -> Value:
+        key = (hands, top, num_players_skipped)
+        value = self.table.get(key)
+        if value is not None:
+            return value
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SearchLimitExceeded(f"More than {self.max_nodes} positions.")
+        value = None
+        for move in [*self.moves(hands[0], top), None]:
+            move_value = self.value_after(hands, top, num_players_skipped, move)
+            if value is None or move_value[0] > value[0]:
+                value = move_value
+        self.table.put(key, value)
+        return value
+
+    def best_move(
+        self,
+        hands: Sequence[Iterable[Card]],
+        top_discard: Card,
+        active_suit: Optional[str] = None,
+        num_players_skipped: int = 0,
+    ) -> tuple[Optional[Card], Optional[str]]:
+        """Return the card the player to move should play (or None to pass) and
+        the suit to pick if it is an 8.
+
+        `hands[0]` is the hand of the player to move, followed by the hands of the
+        next players in turn order.
+
+        Examples:
+        >>> solver = EndgameSolver()
+        >>> mine = [Card("Spades", "8"), Card("Hearts", "2")]
+        >>> theirs = [Card("Clubs", "King")]
+        >>> solver.best_move([mine, theirs], Card("Clubs", "3"))
+        (Card(Spades, 8), 'Hearts')
+        """
+        if active_suit is not None:
+            top = EIGHT_BASE + SUITS.index(active_suit)
+        else:
+            top = top_discard.index
+        masks = [cards_to_mask(hand) for hand in hands]
+        _, move = self.solve(masks, top, num_players_skipped)
+        if move is None:
+            return None, None
+        card, new_top = move
+        if card // NUM_SUITS == EIGHT:
+            return CARDS_BY_INDEX[card], SUITS[new_top % NUM_SUITS]
+        return CARDS_BY_INDEX[card], None
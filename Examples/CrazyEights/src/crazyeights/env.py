@@ -0,0 +1,229 @@
+"""A Gym-style environment that plays many games at once for training policies.
+
+`VectorEnv` holds `num_envs` games in a `VectorizedGames` instance. In each game
+the agent plays one seat and all other seats are played by a strategy with
+batched decisions (by default the greedy strategy). `step` takes one action per
+game, plays the agent's turn, then lets the other players move until it is the
+agent's turn again, all with array operations over every game at once. Finished
+games are started again in place, with new decks.
+
+Actions are integers in `range(NUM_ACTIONS)`:
+
+- `0..51`: play the card with this index (the indices of `crazyeights.fast`).
+  The actions for the 8s mean "play an 8 and pick the suit of this card"; the
+  agent plays the first 8 in its hand.
+- `DRAW`: draw a card. A drawn card that can be played is played at once (a
+  drawn 8 with the suit the agent has most of). Drawing is only allowed if the
+  agent cannot play; if the deck is empty, the agent passes.
+
+Invalid actions are replaced by the move of the opponents' strategy and are
+reported in the `invalid` entry of the infos. Observations are dicts of arrays
+with one row per game; `action_mask` marks the valid actions.
+
+This module requires NumPy, which can be installed with the `numpy` extra.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from crazyeights.fast import EIGHT, EIGHT_BASE, NUM_CARDS, NUM_SUITS
+from crazyeights.strategies import StrategyFactory
+from crazyeights.vectorized import (
+    MATCH,
+    NO_PLAYABLE_CARDS,
+    RANK_OF,
+    WON,
+    VectorizedGames,
+    random_decks,
+)
+
+DRAW = NUM_CARDS
+NUM_ACTIONS = NUM_CARDS + 1
+EIGHTS = np.arange(EIGHT_BASE, EIGHT_BASE + NUM_SUITS)
+
+WIN_REWARD = 1.0
+LOSS_REWARD = -1.0
+
+
+class VectorEnv:
+    """`num_envs` games of Crazy Eights in which the agent plays `agent_seat`.
+
+    The agent receives a reward of `WIN_REWARD` when it wins a game,
+    `LOSS_REWARD` when another player wins, and 0 otherwise.
+
+    Examples:
+    >>> env = VectorEnv(num_envs=3, num_players=2, seed=1)
+    >>> observations = env.reset()
+    >>> observations["hand"].shape, observations["opponent_hand_sizes"].shape
+    ((3, 52), (3, 1))
+    >>> actions = env.greedy_actions()
+    >>> observations, rewards, dones, infos = env.step(actions)
+    >>> rewards.tolist(), dones.tolist(), infos["invalid"].tolist()
+    ([0.0, 0.0, 0.0], [False, False, False], [False, False, False])
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        num_players: int = 2,
+        agent_seat: int = 0,
+        strategy: Optional[StrategyFactory] = None,
+        seed: Optional[int] = None,
+    ):
+        if not 0 <= agent_seat < num_players:
+            raise ValueError("The agent's seat must be one of the players' seats.")
+        self.num_envs = num_envs
+        self.num_players = num_players
+        self.agent_seat = agent_seat
+        self.generator = np.random.default_rng(seed)
+        self.games = VectorizedGames(
+            random_decks(num_envs, self.generator), num_players, strategy
+        )
+        self.all_games = np.arange(num_envs)
+        self.agent_rows = self.all_games * num_players + agent_seat
+        # The seats of the opponents, in the order in which they play after the
+        # agent.
+        self.opponent_seats = (agent_seat + np.arange(1, num_players)) % num_players
+        self.opponent_rows = self.all_games[:, None] * num_players + self.opponent_seats
+        self.episode_returns = np.zeros(num_envs)
+        self.play_until_agent_turn()
+
+    def __repr__(self) -> str:
+        return f"<VectorEnv: {self.num_envs} games of {self.num_players} players>"
+
+    def reset(self, seed: Optional[int] = None) -> dict[str, np.ndarray]:
+        """Start new games in all environments and return their observations."""
+        if seed is not None:
+            self.generator = np.random.default_rng(seed)
+        self.games.deal(self.all_games, random_decks(self.num_envs, self.generator))
+        self.play_until_agent_turn()
+        return self.observations()
+
+    def play_until_agent_turn(self) -> None:
+        """Let the other players take their turns in all running games until it
+        is the agent's turn."""
+        games = self.games
+        while True:
+            waiting = np.flatnonzero(
+                games.live & (games.current_players != self.agent_seat)
+            )
+            if not len(waiting):
+                return
+            games.step(waiting)
+
+    def observations(self) -> dict[str, np.ndarray]:
+        """Return the observations of the agent in all games."""
+        games = self.games
+        hands = games.hands[self.agent_rows]
+        tops = games.tops
+        playable = hands & MATCH[tops]
+        return {
+            "hand": hands,
+            "top": tops.astype(np.int8),
+            # An 8 on top of the discard pile has to be followed in its suit (the
+            # suit picked for it, if it was played as a crazy 8).
+            "active_suit": np.where(
+                RANK_OF[tops] == EIGHT, tops % NUM_SUITS, -1
+            ).astype(np.int8),
+            "opponent_hand_sizes": games.hands[self.opponent_rows]
+            .sum(axis=2)
+            .astype(np.int8),
+            "deck_size": games.deck_sizes.astype(np.int8),
+            "action_mask": self.action_mask(hands, playable),
+        }
+
+    @staticmethod
+    def action_mask(hands: np.ndarray, playable: np.ndarray) -> np.ndarray:
+        """Return the valid actions for `hands` with the `playable` cards."""
+        mask = np.zeros((len(hands), NUM_ACTIONS), dtype=bool)
+        mask[:, :NUM_CARDS] = playable
+        has_eight = hands[:, EIGHTS].any(axis=1)
+        mask[:, EIGHTS] = has_eight[:, None]
+        mask[:, DRAW] = ~playable.any(axis=1)
+        return mask
+
+    def greedy_actions(self, games: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return the actions of the opponents' strategy in the agent's seat."""
+        if games is None:
+            games = self.all_games
+        rows = self.agent_rows[games]
+        state = self.games
+        hands = state.hands[rows]
+        playable = hands & MATCH[state.tops[games]]
+        cards = state.pick_cards(games, rows, playable)
+        eights = np.flatnonzero((cards >= 0) & (RANK_OF[cards] == EIGHT))
+        if len(eights):
+            # The suit is picked after the 8 has left the hand.
+            hands = hands[eights]
+            hands[np.arange(len(eights)), cards[eights]] = False
+            cards[eights] = EIGHT_BASE + state.pick_suits(hands)
+        return np.where(cards >= 0, cards, DRAW)
+
+    def step(
+        self, actions
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """Play one turn of the agent with `actions` in every game, followed by
+        the turns of the other players.
+
+        Returns the observations, the rewards, which games ended (and were
+        restarted), and a dict of infos: `invalid` marks the invalid actions,
+        and `episode_return` and `episode_length` hold the agent's total reward
+        and the number of turns of the games that ended."""
+        games = self.games
+        all_games, rows = self.all_games, self.agent_rows
+        actions = np.asarray(actions, dtype=np.int64)
+        hands = games.hands[rows]
+        match = MATCH[games.tops]
+        playable = hands & match
+        in_range = (actions >= 0) & (actions < NUM_ACTIONS)
+        mask = self.action_mask(hands, playable)
+        invalid = ~(in_range & mask[all_games, np.where(in_range, actions, DRAW)])
+        if invalid.any():
+            actions = actions.copy()
+            actions[invalid] = self.greedy_actions(np.flatnonzero(invalid))
+
+        drawing = actions == DRAW
+        failed = games.draw_for_turn(all_games, rows, drawing, match, playable)
+        # After a draw, the drawn card is the only one that can be played.
+        drawn_playable = drawing & playable.any(axis=1)
+        playing = np.flatnonzero(~drawing | drawn_playable)
+        if len(playing):
+            cards = np.where(drawing, playable.argmax(axis=1), actions)[playing]
+            suits = np.full(len(playing), -1)
+            play_eight = ~drawing[playing] & (RANK_OF[cards] == EIGHT)
+            if play_eight.any():
+                suits[play_eight] = cards[play_eight] - EIGHT_BASE
+                # Play the first 8 in the hand.
+                eight_rows = playing[play_eight]
+                order = np.where(
+                    hands[eight_rows][:, EIGHTS],
+                    games.hand_order[eight_rows][:, EIGHTS],
+                    NUM_CARDS,
+                )
+                cards[play_eight] = EIGHT_BASE + order.argmin(axis=1)
+            # The strategy picks the suits for drawn 8s (where `suits` is -1).
+            games.play_cards(playing, rows[playing], cards, suits)
+        games.end_turns(
+            all_games, np.full(self.num_envs, self.agent_seat), rows, failed
+        )
+        self.play_until_agent_turn()
+
+        dones = ~games.live
+        rewards = np.zeros(self.num_envs)
+        won = games.results == WON
+        rewards[won & (games.winners == self.agent_seat)] = WIN_REWARD
+        rewards[won & (games.winners != self.agent_seat)] = LOSS_REWARD
+        self.episode_returns += rewards
+        infos = {
+            "invalid": invalid,
+            "no_playable_cards": games.results == NO_PLAYABLE_CARDS,
+            "episode_return": np.where(dones, self.episode_returns, 0.0),
+            "episode_length": np.where(dones, games.num_turns, 0),
+        }
+        finished = np.flatnonzero(dones)
+        if len(finished):
+            self.episode_returns[finished] = 0.0
+            games.deal(finished, random_decks(len(finished), self.generator))
+            self.play_until_agent_turn()
+        return self.observations(), rewards, dones, infos
@@ -0,0 +1,262 @@
+"""A fast game engine for games between greedy players.
+
+Cards are represented by their indices 0..51 (see `Card.index`) and hands by
+integers in which bit `i` is set if the card with index `i` is in the hand. Cards
+are indexed rank-major, i.e., the index of a card is `4 * rank_index + suit_index`.
+Therefore, the card with the highest rank in a hand is simply its highest bit.
+
+The engine plays exactly the same games as `CrazyEightsGame` with `GreedyPlayer`s:
+for the same state of the random number generator both produce the same result,
+winner and number of turns.
+"""
+
+import random
+from typing import Optional
+
+from crazyeights.deck import CARDS, CARDS_BY_INDEX, Card, RANKS, SUITS
+from crazyeights.game import GameResult
+
+NUM_SUITS = len(SUITS)
+NUM_CARDS = len(SUITS) * len(RANKS)
+EIGHT = RANKS.index("8")
+HAND_SIZE = 7
+
+
+def card_index(card: Card) -> int:
+    """Return the index of a card.
+
+    Examples:
+    >>> card_index(Card("Hearts", "2"))
+    0
+    >>> card_index(Card("Spades", "Ace"))
+    51
+    >>> card_index(Card("Diamonds", "8"))
+    25
+    """
+    return card.index
+
+
+def index_card(index: int) -> Card:
+    """Return the card with the given index.
+
+    Examples:
+    >>> index_card(25)
+    Card(Diamonds, 8)
+    """
+    return CARDS_BY_INDEX[index]
+
+
+def cards_to_mask(cards) -> int:
+    """Return the bitmask for a collection of cards.
+
+    Examples:
+    >>> bin(cards_to_mask([Card("Hearts", "2"), Card("Clubs", "2")]))
+    '0b101'
+    """
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.index
+    return mask
+
+
+def mask_to_cards(mask: int) -> list[Card]:
+    """Return the cards in a bitmask, ordered by index.
+
+    Examples:
+    >>> mask_to_cards(0b101)
+    [Card(Hearts, 2), Card(Clubs, 2)]
+    """
+    return [CARDS_BY_INDEX[i] for i in range(NUM_CARDS) if mask >> i & 1]
+
+
+SUIT_MASKS = [
+    sum(1 << (rank * NUM_SUITS + suit) for rank in range(len(RANKS)))
+    for suit in range(NUM_SUITS)
+]
+RANK_MASKS = [
+    ((1 << NUM_SUITS) - 1) << (rank * NUM_SUITS) for rank in range(len(RANKS))
+]
+EIGHTS_MASK = RANK_MASKS[EIGHT]
+EIGHT_BASE = EIGHT * NUM_SUITS
+# `MATCH_MASKS[i]` contains all cards that can be played on the card with index i.
+MATCH_MASKS = [
+    SUIT_MASKS[index % NUM_SUITS] | RANK_MASKS[index // NUM_SUITS] | EIGHTS_MASK
+    for index in range(NUM_CARDS)
+]
+
+# The indices of the cards in the order in which `Deck` creates them.
+DECK_ORDER = [card.index for card in CARDS]
+# Used instead of the initial deck by games that do not start with a full deck.
+TIE_BREAK_ORDER = tuple(range(NUM_CARDS))
+
+
+class FastCrazyEightsGame:
+    """A game between greedy players played on bitmasks.
+
+    When a crazy 8 is played, `top` is set to the 8 of the picked suit, since that
+    card matches exactly the same cards as the played 8 with the picked suit."""
+
+    def __init__(self, num_players: int, rng: Optional[random.Random] = None):
+        deck = DECK_ORDER.copy()
+        (rng or random).shuffle(deck)
+        self.initial_deck = tuple(deck)
+        self.deck = deck
+        self.num_players = num_players
+        self.top = deck.pop()
+        self.hands = []
+        for _ in range(num_players):
+            hand = 0
+            for index in deck[-1 : -HAND_SIZE - 1 : -1]:
+                hand |= 1 << index
+            del deck[-HAND_SIZE:]
+            self.hands.append(hand)
+        self.current_player_index = 0
+        self.num_turns = 0
+
+    def __repr__(self) -> str:
+        return f"FastCrazyEightsGame({self.num_players})"
+
+    @classmethod
+    def from_state(
+        cls,
+        hands: list[int],
+        deck: list[int],
+        top: int,
+        current_player_index: int = 0,
+    ) -> "FastCrazyEightsGame":
+        """Create a game that continues from an arbitrary state.
+
+        `hands` are bitmasks, `deck` holds card indices that are drawn from the end,
+        and `top` is the index of the top discard (the 8 of the picked suit after a
+        crazy 8). Both lists are used by the game without copying them. Since the
+        initial deck is not known, ties between cards of the same rank are broken
+        in favor of the card with the highest index."""
+        game = cls.__new__(cls)
+        game.initial_deck = TIE_BREAK_ORDER
+        game.deck = deck
+        game.num_players = len(hands)
+        game.top = top
+        game.hands = hands
+        game.current_player_index = current_player_index
+        game.num_turns = 0
+        return game
+
+    def pick_card(self, playable: int) -> int:
+        """Return the index of the card the greedy strategy plays.
+
+        `playable` must be non-zero."""
+        highest = playable.bit_length() - 1
+        rank_shift = highest - highest % NUM_SUITS
+        same_rank = playable >> rank_shift
+        if same_rank & (same_rank - 1) == 0:
+            return highest
+        # Hands in `CrazyEightsGame` are ordered by the time cards were drawn, and
+        # cards are drawn from the end of the deck. To break ties between cards of
+        # the same rank the way `GreedyPlayer` does we therefore prefer the card with
+        # the highest position in the initial deck.
+        candidates = [
+            rank_shift + suit for suit in range(NUM_SUITS) if same_rank >> suit & 1
+        ]
+        return max(candidates, key=self.initial_deck.index)
+
+    @staticmethod
+    def pick_suit(hand: int) -> int:
+        """Return the index of the suit the player has the most cards of."""
+        counts = [(hand & suit_mask).bit_count() for suit_mask in SUIT_MASKS]
+        return counts.index(max(counts))
+
+    def play_card(self, player: int, card: int) -> None:
+        hand = self.hands[player] & ~(1 << card)
+        self.hands[player] = hand
+        if card // NUM_SUITS == EIGHT:
+            self.top = EIGHT_BASE + self.pick_suit(hand)
+        else:
+            self.top = card
+
+    def take_turn(self, player: int) -> bool:
+        """Play a turn for `player`.
+
+        Returns False if the player could neither play nor draw a card."""
+        match_mask = MATCH_MASKS[self.top]
+        playable = self.hands[player] & match_mask
+        if playable:
+            self.play_card(player, self.pick_card(playable))
+            return True
+        if not self.deck:
+            return False
+        card = self.deck.pop()
+        self.hands[player] |= 1 << card
+        if match_mask >> card & 1:
+            self.play_card(player, card)
+        return True
+
+    def play(self) -> GameResult:
+        """Play the game to the end.
+
+        This is `take_turn` in a loop, with everything inlined into local variables
+        since this is the innermost loop of large simulations."""
+        num_players = self.num_players
+        if num_players < 2:
+            return GameResult.NOT_ENOUGH_PLAYERS
+
+        hands = self.hands
+        deck = self.deck
+        top = self.top
+        player = self.current_player_index
+        num_turns = self.num_turns
+        num_players_skipped = 0
+        match_masks = MATCH_MASKS
+        pick_card = self.pick_card
+        pick_suit = self.pick_suit
+        try:
+            while True:
+                num_turns += 1
+                hand = hands[player]
+                match_mask = match_masks[top]
+                playable = hand & match_mask
+                if not playable:
+                    if deck:
+                        card = deck.pop()
+                        hand |= 1 << card
+                        if match_mask >> card & 1:
+                            playable = 1 << card
+                        num_players_skipped = 0
+                    else:
+                        num_players_skipped += 1
+                        if num_players_skipped == num_players:
+                            return GameResult.NO_PLAYABLE_CARDS
+                else:
+                    num_players_skipped = 0
+                if playable:
+                    card = pick_card(playable)
+                    hand &= ~(1 << card)
+                    if card // NUM_SUITS == EIGHT:
+                        top = EIGHT_BASE + pick_suit(hand)
+                    else:
+                        top = card
+                hands[player] = hand
+                if not hand:
+                    return GameResult.CURRENT_PLAYER_WON
+
+                player += 1
+                if player == num_players:
+                    player = 0
+        finally:
+            self.top = top
+            self.current_player_index = player
+            self.num_turns = num_turns
+
+
+def play_fast_game(
+    num_players: int, rng: Optional[random.Random] = None
+) -> tuple[GameResult, Optional[int], int, tuple[int, ...]]:
+    """Play a single game between greedy players using the fast engine.
+
+    Returns the same values as `crazyeights.simulation.play_headless_game`."""
+    game = FastCrazyEightsGame(num_players, rng)
+    result = game.play()
+    winner = (
+        game.current_player_index if result == GameResult.CURRENT_PLAYER_WON else None
+    )
+    cards_left = tuple(hand.bit_count() for hand in game.hands)
+    return result, winner, game.num_turns, cards_left
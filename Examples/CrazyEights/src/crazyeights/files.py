@@ -0,0 +1,25 @@
+"""Helpers for files that other processes read while they are being updated."""
+
+import os
+import tempfile
+
+
+def write_atomically(path: str, text: str) -> None:
+    """Write `text` to `path`, atomically replacing any previous file.
+
+    The text is written to a temporary file in the same directory and synced to
+    disk before the file is renamed, so `path` always holds either the previous or
+    the new contents, even if the process or the machine dies while writing."""
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, delete=False, encoding="utf-8"
+    ) as file:
+        try:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, path)
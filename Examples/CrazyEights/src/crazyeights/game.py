@@ -1,7 +1,13 @@
+import random
+import time
 from enum import StrEnum
+from typing import Optional, TextIO
 
 from crazyeights.deck import Card, Deck
+from crazyeights.metrics import GameMetrics, MetricsSink
+from crazyeights.observer import GameObserver
 from crazyeights.player import Player, TurnAction
+from crazyeights.recording import GameRecorder
 
 
 class GameResult(StrEnum):
@@ -12,12 +18,80 @@ class GameResult(StrEnum):
     CURRENT_PLAYER_WON = "Current player won"
 
 
+class GameSnapshot:
+    """The state of a game at one point in time, created by
+    `CrazyEightsGame.snapshot`.
+
+    Snapshots do not copy the deck or the discard pile: the deck is stored as an
+    immutable tuple anyway, and the discard pile is shared with the game, which
+    copies it before it discards the next card (copy on write). The hands are
+    stored as tuples of the (immutable) cards. Snapshots must not be modified."""
+
+    __slots__ = (
+        "deck",
+        "discard_pile",
+        "hands",
+        "current_player_index",
+        "active_suit",
+        "num_turns",
+        "num_players_skipped",
+    )
+
+    def __init__(
+        self,
+        deck: tuple[tuple[Card, ...], int],
+        discard_pile: list[Card],
+        hands: tuple[tuple[Card, ...], ...],
+        current_player_index: int,
+        active_suit: Optional[str],
+        num_turns: int,
+        num_players_skipped: int,
+    ):
+        self.deck = deck
+        self.discard_pile = discard_pile
+        self.hands = hands
+        self.current_player_index = current_player_index
+        self.active_suit = active_suit
+        self.num_turns = num_turns
+        self.num_players_skipped = num_players_skipped
+
+    def __repr__(self) -> str:
+        return f"<GameSnapshot after {self.num_turns} turns>"
+
+
 class CrazyEightsGame:
-    def __init__(self, players):
-        self.deck = Deck()
+    """A game of Crazy Eights.
+
+    The deck is shuffled with `rng` (or the global random number generator); a
+    prepared `deck` can be passed instead. Players that make random decisions,
+    such as `MonteCarloPlayer`, draw from the same generator, so a game with a
+    seeded `rng` is reproducible. If `record` is True, the game is recorded
+    in the compact binary format of `crazyeights.recording` and can be retrieved as
+    `recording`. If a `metrics_sink` is given, the game collects `metrics` while it
+    is played and passes them to the sink when it ends. Observers added with
+    `add_observer` are told about every move of every player."""
+
+    def __init__(
+        self,
+        players,
+        rng: Optional[random.Random] = None,
+        deck: Optional[Deck] = None,
+        record: bool = False,
+        metrics_sink: Optional[MetricsSink] = None,
+    ):
+        self.rng = rng
+        self.deck = Deck(rng) if deck is None else deck
         self.players = players
+        self.recorder = GameRecorder(len(players), self.deck.cards) if record else None
+        self.metrics_sink = metrics_sink
+        self.metrics = GameMetrics() if metrics_sink is not None else None
+        self.observers: list[GameObserver] = []
         self.discard_pile = [self.deck.draw_card()]
+        self._discard_pile_shared = False
         self.current_player_index = 0
+        self.active_suit: Optional[str] = None
+        self.num_turns = 0
+        self.num_players_skipped = 0
         self.deal_cards()
 
     def __repr__(self):
@@ -32,7 +106,15 @@ class CrazyEightsGame:
         return self.discard_pile[-1]
 
     def discard(self, card: Card):
+        """Put a card on the discard pile.
+
+        If the card is a crazy 8, the player who played it sets `active_suit` to the
+        suit that has to be matched next."""
+        if self._discard_pile_shared:
+            self.discard_pile = self.discard_pile.copy()
+            self._discard_pile_shared = False
         self.discard_pile.append(card)
+        self.active_suit = None
 
     @property
     def current_player(self) -> Player:
@@ -41,34 +123,149 @@ class CrazyEightsGame:
     def pick_next_player(self):
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
 
+    def snapshot(self) -> GameSnapshot:
+        """Return a snapshot of the current state of the game.
+
+        The cost of a snapshot is dominated by copying the hands; the deck and the
+        discard pile are shared."""
+        self._discard_pile_shared = True
+        return GameSnapshot(
+            self.deck.snapshot(),
+            self.discard_pile,
+            tuple(tuple(player.hand) for player in self.players),
+            self.current_player_index,
+            self.active_suit,
+            self.num_turns,
+            self.num_players_skipped,
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Restore the state of the game from a snapshot of this game.
+
+        The recording of the game (if any) is not restored."""
+        self.deck.restore(snapshot.deck)
+        self.discard_pile = snapshot.discard_pile
+        self._discard_pile_shared = True
+        for player, hand in zip(self.players, snapshot.hands):
+            player.hand = hand
+        self.current_player_index = snapshot.current_player_index
+        self.active_suit = snapshot.active_suit
+        self.num_turns = snapshot.num_turns
+        self.num_players_skipped = snapshot.num_players_skipped
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot, players) -> "CrazyEightsGame":
+        """Create a new game for `players` in the state of a snapshot.
+
+        This clones a game without copying its players or notifiers; the players
+        get the hands stored in the snapshot."""
+        if len(players) != len(snapshot.hands):
+            raise ValueError("Number of players does not match the snapshot.")
+        game = cls.__new__(cls)
+        game.players = players
+        game.rng = None
+        game.deck = Deck.from_cards(())
+        game.recorder = None
+        game.metrics_sink = None
+        game.metrics = None
+        game.observers = []
+        game.restore(snapshot)
+        return game
+
+    def add_observer(self, observer: GameObserver) -> None:
+        """Let `observer` follow the game from its current state on."""
+        self.observers.append(observer)
+        observer.start(self)
+
+    def notify_observers(self, event: str, *args) -> None:
+        """Call the method `event` of every observer with the index of the current
+        player and `args`."""
+        for observer in self.observers:
+            getattr(observer, event)(self.current_player_index, *args)
+
+    @property
+    def recording(self) -> Optional[bytes]:
+        """The recording of the game so far, or None if the game is not recorded."""
+        return None if self.recorder is None else bytes(self.recorder.data)
+
+    def play_turn(self) -> Optional[GameResult]:
+        """Let the current player take a turn.
+
+        Returns the result of the game if it ended with this turn, None otherwise.
+        If the game continues, the next player becomes the current player."""
+        num_discards = len(self.discard_pile)
+        if self.metrics is None:
+            action_taken = self.current_player.take_turn(self)
+        else:
+            start = time.perf_counter()
+            action_taken = self.current_player.take_turn(self)
+            self.metrics.add_time(
+                "turn_seconds", self.current_player, time.perf_counter() - start
+            )
+        return self.end_turn(action_taken, num_discards)
+
+    def end_turn(
+        self, action_taken: TurnAction, num_discards: int
+    ) -> Optional[GameResult]:
+        """Finish a turn in which the current player took `action_taken`.
+
+        `num_discards` is the size of the discard pile before the turn. This is the
+        part of `play_turn` after the player's move; it is used by drivers that let
+        players take their turns in other ways, e.g., asynchronously."""
+        self.num_turns += 1
+        if self.recorder is not None or self.metrics is not None:
+            played_card = (
+                self.top_discard if len(self.discard_pile) > num_discards else None
+            )
+            if self.recorder is not None:
+                self.recorder.record_turn(action_taken, played_card, self.active_suit)
+            if self.metrics is not None:
+                self.metrics.count_turn(action_taken, played_card, len(self.deck))
+
+        if action_taken == TurnAction.FAILED_DRAW:
+            self.num_players_skipped += 1
+            if self.num_players_skipped == len(self.players):
+                return GameResult.NO_PLAYABLE_CARDS
+        else:
+            self.num_players_skipped = 0
+
+        # Check for win
+        if self.current_player.has_won():
+            return GameResult.CURRENT_PLAYER_WON
+
+        self.pick_next_player()
+        return None
+
     def play(self) -> GameResult:
         if len(self.players) < 2:
             print("Must have at least two players to play.")
             return GameResult.NOT_ENOUGH_PLAYERS
 
-        num_players_skipped = 0
-
-        while True:
-            action_taken = self.current_player.take_turn(self)
-            if action_taken == TurnAction.FAILED_DRAW:
-                num_players_skipped += 1
-                if num_players_skipped == len(self.players):
-                    return GameResult.NO_PLAYABLE_CARDS
-            else:
-                num_players_skipped = 0
-
-            # Check for win
-            if self.current_player.has_won():
-                return GameResult.CURRENT_PLAYER_WON
+        try:
+            while True:
+                result = self.play_turn()
+                if result is not None:
+                    self.report_metrics(result)
+                    return result
+        finally:
+            for player in self.players:
+                player.notifier.flush()
 
-            self.pick_next_player()
+    def report_metrics(self, result: GameResult) -> None:
+        """Pass the metrics of the finished game to the metrics sink, if any."""
+        if self.metrics is not None:
+            self.metrics.end_game(result)
+            self.metrics_sink.record_game(self.metrics)
 
-    def print_result(self, reason: GameResult):
+    def print_result(self, reason: GameResult, file: Optional[TextIO] = None):
         if reason == GameResult.NO_PLAYABLE_CARDS:
+            top_discard = self.top_discard
+            if self.active_suit:
+                top_discard = Card(self.active_suit, top_discard.rank)
             print(
-                "Deck is empty and no players can match "
-                f"{self.top_discard.shorthand}."
+                f"Deck is empty and no players can match {top_discard.shorthand}.",
+                file=file,
             )
-            print("No one wins!")
+            print("No one wins!", file=file)
         else:
-            print(f"\n{self.current_player.name} wins!")
+            print(f"\n{self.current_player.name} wins!", file=file)
@@ -0,0 +1,235 @@
+from typing import Iterable, Optional
+
+from crazyeights.deck import Card
+
+# Hands with fewer cards are scanned; for them, a scan is cheaper than keeping the
+# buckets up to date.
+INDEX_THRESHOLD = 16
+
+
+class _HandIndex:
+    """The cards of a hand bucketed by suit and by rank, and its mask.
+
+    Every card gets a sequence number that increases with its position in the
+    hand. The buckets map sequence numbers to cards; this identifies cards even
+    if the hand contains equal cards, and since dicts keep their insertion order
+    the cards in each bucket are in hand order."""
+
+    __slots__ = ("seqs", "next_seq", "by_suit", "by_rank", "mask")
+
+    def __init__(self, cards: list[Card]):
+        self.seqs: list[int] = []
+        self.next_seq = 0
+        self.by_suit: dict[str, dict[int, Card]] = {}
+        self.by_rank: dict[str, dict[int, Card]] = {}
+        self.mask = 0
+        for card in cards:
+            self.append(card)
+
+    def append(self, card: Card) -> None:
+        seq = self.next_seq
+        self.next_seq = seq + 1
+        self.seqs.append(seq)
+        self.by_suit.setdefault(card.suit, {})[seq] = card
+        self.by_rank.setdefault(card.rank, {})[seq] = card
+        self.mask |= 1 << card.index
+
+    def pop(self, index: int, card: Card) -> None:
+        seq = self.seqs.pop(index)
+        del self.by_suit[card.suit][seq]
+        rank_bucket = self.by_rank[card.rank]
+        del rank_bucket[seq]
+        if card not in rank_bucket.values():
+            self.mask &= ~(1 << card.index)
+
+
+class Hand(list):
+    """The cards in a player's hand.
+
+    A `Hand` is a list of cards with queries by suit and by rank. Once a hand holds
+    `INDEX_THRESHOLD` cards, its first query buckets the cards by suit and by rank;
+    the buckets are then updated when cards are added or removed, so that queries
+    only look at the cards they return instead of scanning the whole hand. Smaller
+    hands, like the hands of a normal game, are simply scanned. Either way, the
+    cards returned are in hand order. The hand also has a `mask`, the set of its
+    cards as a bitmask of their indices.
+
+    Examples:
+    >>> hand = Hand([Card("Hearts", "Ace"), Card("Clubs", "8"), Card("Hearts", "2")])
+    >>> hand.cards_of_suit("Hearts")
+    [Card(Hearts, Ace), Card(Hearts, 2)]
+    >>> hand.count_suit("Hearts")
+    2
+    >>> hand.remove(Card("Hearts", "Ace"))
+    >>> hand.cards_of_suit("Hearts")
+    [Card(Hearts, 2)]
+    >>> hand.matching(Card("Diamonds", "2"))
+    [Card(Clubs, 8), Card(Hearts, 2)]
+    >>> hand
+    [Card(Clubs, 8), Card(Hearts, 2)]
+    >>> hand.mask == 1 << Card("Clubs", "8").index | 1 << Card("Hearts", "2").index
+    True
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        super().__init__(cards)
+        self._index: Optional[_HandIndex] = None
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def _get_index(self) -> Optional[_HandIndex]:
+        """Return the index of the hand, creating it if the hand is large enough,
+        or None if the hand is scanned."""
+        index = self._index
+        if index is None and len(self) >= INDEX_THRESHOLD:
+            index = self._index = _HandIndex(self)
+        return index
+
+    @property
+    def mask(self) -> int:
+        """The cards in the hand as a bitmask with bit `card.index` set for each
+        card; this is a canonical encoding of the hand that ignores the order of
+        the cards."""
+        index = self._get_index()
+        if index is not None:
+            return index.mask
+        mask = 0
+        for card in self:
+            mask |= 1 << card.index
+        return mask
+
+    def append(self, card: Card) -> None:
+        super().append(card)
+        if self._index is not None:
+            self._index.append(card)
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        if self._index is None:
+            super().extend(cards)
+        else:
+            for card in cards:
+                self.append(card)
+
+    def __iadd__(self, cards: Iterable[Card]) -> "Hand":
+        self.extend(cards)
+        return self
+
+    def pop(self, index: int = -1) -> Card:
+        card = super().pop(index)
+        if self._index is not None:
+            self._index.pop(index, card)
+        return card
+
+    def remove(self, card: Card) -> None:
+        if self._index is None:
+            super().remove(card)
+        else:
+            self.pop(self.index(card))
+
+    # Operations that move cards around are rare; they drop the index, which is
+    # rebuilt by the next query.
+
+    def clear(self) -> None:
+        super().clear()
+        self._index = None
+
+    def insert(self, index: int, card: Card) -> None:
+        super().insert(index, card)
+        self._index = None
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._index = None
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._index = None
+
+    def __imul__(self, n: int) -> "Hand":
+        super().__imul__(n)
+        self._index = None
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._index = None
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._index = None
+
+    def cards_of_suit(self, suit: str) -> list[Card]:
+        """Return the cards of the given suit."""
+        index = self._get_index()
+        if index is None:
+            return [card for card in self if card.suit == suit]
+        return list(index.by_suit.get(suit, {}).values())
+
+    def cards_of_rank(self, rank: str) -> list[Card]:
+        """Return the cards of the given rank."""
+        index = self._get_index()
+        if index is None:
+            return [card for card in self if card.rank == rank]
+        return list(index.by_rank.get(rank, {}).values())
+
+    def first_of_rank(self, rank: str) -> Card | None:
+        """Return the first card of the given rank, or None if there is none."""
+        index = self._get_index()
+        if index is None:
+            for card in self:
+                if card.rank == rank:
+                    return card
+            return None
+        bucket = index.by_rank.get(rank)
+        return next(iter(bucket.values())) if bucket else None
+
+    def count_suit(self, suit: str) -> int:
+        """Return the number of cards of the given suit."""
+        index = self._get_index()
+        if index is None:
+            return sum(card.suit == suit for card in self)
+        return len(index.by_suit.get(suit, ()))
+
+    def count_rank(self, rank: str) -> int:
+        """Return the number of cards of the given rank."""
+        index = self._get_index()
+        if index is None:
+            return sum(card.rank == rank for card in self)
+        return len(index.by_rank.get(rank, ()))
+
+    def matching(
+        self, top_discard: Card, active_suit: Optional[str] = None
+    ) -> list[Card]:
+        """Return the cards that match `top_discard`, in hand order.
+
+        This returns the same cards as checking `card.matches(top_discard,
+        active_suit)` for every card in the hand."""
+        suit = active_suit or top_discard.suit
+        rank = top_discard.rank
+        index = self._get_index()
+        if index is None:
+            return [
+                card
+                for card in self
+                if card.suit == suit or card.rank == rank or card.rank == "8"
+            ]
+        buckets = [
+            bucket
+            for bucket in (
+                index.by_suit.get(suit),
+                index.by_rank.get(rank),
+                index.by_rank.get("8") if rank != "8" else None,
+            )
+            if bucket
+        ]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+        entries = {}
+        for bucket in buckets:
+            entries.update(bucket)
+        return [entries[seq] for seq in sorted(entries)]
@@ -1,21 +1,33 @@
+from typing import Callable, Optional
+
 from crazyeights.deck import Card, SUITS
 from crazyeights.interactive.notifier import InteractivePlayerNotifier
-from crazyeights.player import Player
+from crazyeights.notifier import Notifier
+from crazyeights.player import Player, TurnContext
 
 
 class InteractivePlayer(Player):
-    """A player that inputs its moves from the console."""
+    """A player that inputs its moves from the console.
+
+    The notifier is created by calling `notifier_factory` with the player; by default
+    an `InteractivePlayerNotifier` is used that prints to the console."""
 
-    def __init__(self, name):
-        notifier = InteractivePlayerNotifier(self)
+    def __init__(
+        self,
+        name,
+        notifier_factory: Optional[Callable[[Player], Notifier]] = None,
+    ):
+        if notifier_factory is None:
+            notifier_factory = InteractivePlayerNotifier
+        notifier = notifier_factory(self)
         super().__init__(name, notifier)
 
-    def pick_card_to_play(self, top_discard: Card) -> Card | None:
+    def pick_card_to_play(self, context: TurnContext) -> Card | None:
         """Pick a card to play from the given list of playable cards.
 
         Returns the card the player wants to play, or None if the player cannot play
         any of the cards."""
-        playable_cards = self.get_playable_cards(top_discard)
+        playable_cards = context.playable_cards
         if playable_cards:
             for i, card in enumerate(playable_cards, 1):
                 print(f"{i}: {card.shorthand}")
@@ -0,0 +1,255 @@
+"""Metrics of played games and sinks that export them.
+
+A game that is created with a `MetricsSink` collects `GameMetrics` while it is
+played: counts of turns, draws, failed draws, eights played and games in which the
+deck ran out, and the wall-clock time of every turn and every call of
+`Player.pick_card_to_play`, broken down by player class. When the game ends, the
+metrics are passed to the sink. Games without a sink do not collect anything.
+
+Every game imports this module, therefore the modules needed only by the sinks
+are imported when they are used.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, TextIO
+
+from crazyeights.player import TurnAction
+
+if TYPE_CHECKING:
+    from crazyeights.deck import Card
+    from crazyeights.player import Player
+
+COUNTERS = {
+    "games": "Games played.",
+    "turns": "Turns played.",
+    "draws": "Turns in which a card was drawn.",
+    "failed_draws": "Turns in which a player could neither play nor draw.",
+    "eights_played": "Crazy 8s played.",
+    "deck_exhausted": "Games in which the deck ran out of cards.",
+}
+# Seconds between two writes of a `PrometheusTextSink`; the node exporter reads the
+# file when it is scraped, typically every 15 seconds or more.
+DEFAULT_WRITE_INTERVAL = 10.0
+TIMINGS = {
+    "turn_seconds": "Wall-clock time per turn.",
+    "pick_seconds": "Wall-clock time per call of pick_card_to_play.",
+}
+
+
+class Timing:
+    """The number, total and maximum of a series of durations in seconds.
+
+    Examples:
+    >>> timing = Timing()
+    >>> timing.add(0.5)
+    >>> timing.add(1.5)
+    >>> timing.count, timing.total, timing.max, timing.mean
+    (2, 2.0, 1.5, 1.0)
+    """
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self, count: int = 0, total: float = 0.0, max: float = 0.0):
+        self.count = count
+        self.total = total
+        self.max = max
+
+    def __repr__(self) -> str:
+        return f"Timing({self.count}, {self.total}, {self.max})"
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "Timing") -> None:
+        self.count += other.count
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "total": self.total, "max": self.max}
+
+
+class GameMetrics:
+    """The metrics collected while a single game is played.
+
+    `counters` maps the names in `COUNTERS` to counts; `timings` maps the names in
+    `TIMINGS` to dicts from the names of player classes to `Timing`s."""
+
+    def __init__(self):
+        self.result: Optional[str] = None
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.timings: dict[str, dict[str, Timing]] = {name: {} for name in TIMINGS}
+
+    def __repr__(self) -> str:
+        return f"<GameMetrics: {self.counters['turns']} turns>"
+
+    def add_time(self, name: str, player: "Player", seconds: float) -> None:
+        """Add a duration of the timing `name` for the class of `player`."""
+        timings = self.timings[name]
+        player_class = type(player).__name__
+        timing = timings.get(player_class)
+        if timing is None:
+            timing = timings[player_class] = Timing()
+        timing.add(seconds)
+
+    def count_turn(
+        self,
+        action_taken: TurnAction,
+        played_card: Optional["Card"],
+        deck_size: int,
+    ) -> None:
+        counters = self.counters
+        counters["turns"] += 1
+        if action_taken == TurnAction.DREW_CARD:
+            counters["draws"] += 1
+        elif action_taken == TurnAction.FAILED_DRAW:
+            counters["failed_draws"] += 1
+        if played_card is not None and played_card.rank == "8":
+            counters["eights_played"] += 1
+        if not deck_size:
+            counters["deck_exhausted"] = 1
+
+    def end_game(self, result: str) -> None:
+        self.result = str(result)
+        self.counters["games"] = 1
+
+    def to_dict(self) -> dict:
+        return {
+            "result": self.result,
+            **self.counters,
+            **{
+                name: {
+                    player_class: timing.to_dict()
+                    for player_class, timing in timings.items()
+                }
+                for name, timings in self.timings.items()
+            },
+        }
+
+
+class MetricsSink(ABC):
+    """Receives the metrics of each game when it ends."""
+
+    @abstractmethod
+    def record_game(self, metrics: GameMetrics) -> None: ...
+
+    def close(self) -> None:
+        """Write any outstanding output. Called when no more games are recorded."""
+        pass
+
+
+class MetricsRegistry(MetricsSink):
+    """A sink that adds up the metrics of all games in memory.
+
+    Examples:
+    >>> registry = MetricsRegistry()
+    >>> metrics = GameMetrics()
+    >>> metrics.add_time("turn_seconds", object(), 0.25)
+    >>> metrics.end_game("Current player won")
+    >>> registry.record_game(metrics)
+    >>> registry.counters["games"], registry.results
+    (1, {'Current player won': 1})
+    >>> registry.timings["turn_seconds"]["object"]
+    Timing(1, 0.25, 0.25)
+    """
+
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.results: dict[str, int] = {}
+        self.timings: dict[str, dict[str, Timing]] = {name: {} for name in TIMINGS}
+
+    def __repr__(self) -> str:
+        return f"<MetricsRegistry: {self.counters['games']} games>"
+
+    def record_game(self, metrics: GameMetrics) -> None:
+        for name, count in metrics.counters.items():
+            self.counters[name] += count
+        if metrics.result is not None:
+            self.results[metrics.result] = self.results.get(metrics.result, 0) + 1
+        for name, timings in metrics.timings.items():
+            for player_class, timing in timings.items():
+                self.timings[name].setdefault(player_class, Timing()).merge(timing)
+
+    def to_prometheus(self, prefix: str = "crazyeights") -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, description in COUNTERS.items():
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter"]
+            if name == "games":
+                for result, count in sorted(self.results.items()):
+                    lines.append(f'{metric}{{result="{result}"}} {count}')
+            else:
+                lines.append(f"{metric} {self.counters[name]}")
+        for name, description in TIMINGS.items():
+            metric = f"{prefix}_{name}"
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} summary"]
+            for player_class, timing in sorted(self.timings[name].items()):
+                labels = f'{{player_class="{player_class}"}}'
+                lines.append(f"{metric}_count{labels} {timing.count}")
+                lines.append(f"{metric}_sum{labels} {timing.total!r}")
+            lines += [f"# HELP {metric}_max Maximum of {metric}."]
+            lines += [f"# TYPE {metric}_max gauge"]
+            for player_class, timing in sorted(self.timings[name].items()):
+                labels = f'{{player_class="{player_class}"}}'
+                lines.append(f"{metric}_max{labels} {timing.max!r}")
+        return "\n".join(lines) + "\n"
+
+
+class JsonLinesSink(MetricsSink):
+    """A sink that writes the metrics of each game as one line of JSON."""
+
+    def __init__(self, file: TextIO):
+        self.file = file
+
+    def __repr__(self) -> str:
+        return f"<JsonLinesSink: {getattr(self.file, 'name', self.file)}>"
+
+    def record_game(self, metrics: GameMetrics) -> None:
+        import json
+
+        self.file.write(json.dumps(metrics.to_dict()) + "\n")
+
+    def close(self) -> None:
+        self.file.flush()
+
+
+class PrometheusTextSink(MetricsRegistry):
+    """A registry that writes its metrics to a file in the Prometheus text format.
+
+    The file is replaced atomically after a game is recorded if at least
+    `write_interval` seconds have passed since it was last written, and always
+    when the sink is closed, so that it can be read at any time, e.g., by the
+    textfile collector of the Prometheus node exporter."""
+
+    def __init__(self, path: str, write_interval: float = DEFAULT_WRITE_INTERVAL):
+        super().__init__()
+        self.path = path
+        self.write_interval = write_interval
+        self.last_write_time = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<PrometheusTextSink: {self.path}>"
+
+    def record_game(self, metrics: GameMetrics) -> None:
+        super().record_game(metrics)
+        if time.monotonic() - self.last_write_time >= self.write_interval:
+            self.write()
+
+    def write(self) -> None:
+        from crazyeights.files import write_atomically
+
+        write_atomically(self.path, self.to_prometheus())
+        self.last_write_time = time.monotonic()
+
+    def close(self) -> None:
+        self.write()
@@ -1,9 +1,11 @@
+import io
+import sys
 from abc import ABC, abstractmethod
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TextIO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from crazyeights.deck import Card
-    from crazyeights.player import Player
+    from crazyeights.player import Player, TurnContext
 
 
 class Notifier(ABC):
@@ -18,8 +20,11 @@ class Notifier(ABC):
         ...
 
     @abstractmethod
-    def notify_turn(self, top_discard: "Card") -> None:
-        """Notify the player that it is their turn."""
+    def notify_turn(self, context: "TurnContext") -> None:
+        """Notify the player that it is their turn.
+
+        `context` holds the top discard, the suit picked if it is a crazy 8, and the
+        playable cards."""
         ...
 
     @abstractmethod
@@ -37,28 +42,112 @@ class Notifier(ABC):
         """Notify the player that a suit was picked."""
         ...
 
+    def flush(self) -> None:
+        """Output anything the notifier has buffered. Called when the game ends."""
+        pass
+
 
 class TerminalNotifier(Notifier, ABC):
-    """Superclass for notifiers that print to the terminal."""
+    """Superclass for notifiers that print to the terminal.
+
+    If `file` is given, the output is written to it instead of standard output.
+    The notifier prints to `output`, which is `file` unless a subclass redirects
+    it."""
+
+    def __init__(self, player: "Player", file: Optional[TextIO] = None):
+        super().__init__(player)
+        self.file = file
+        self.output = file
 
     def notify(self, message: str) -> None:
-        print(message)
+        print(message, file=self.output)
 
-    def notify_turn(self, top_discard: "Card", **kwargs) -> None:
-        from crazyeights.deck import short_string
+    def notify_turn(self, context: "TurnContext") -> None:
+        from crazyeights.deck import Card, short_string
 
+        top_discard, active_suit = context.top_discard, context.active_suit
+        # A crazy 8 is shown with the suit that was picked for it.
+        shown_card = Card(active_suit, top_discard.rank) if active_suit else top_discard
         print(
-            f"\n{self.player.name}'s turn. Top of discard pile: {top_discard.shorthand}"
+            f"\n{self.player.name}'s turn. Top of discard pile: {shown_card.shorthand}",
+            file=self.output,
+        )
+        print(
+            f"{self.player.name}'s hand: {short_string(self.player.hand)}",
+            file=self.output,
         )
-        print(f"{self.player.name}'s hand: {short_string(self.player.hand)}")
 
-        playable_cards = self.player.get_playable_cards(top_discard)
+        playable_cards = context.playable_cards
         if playable_cards:
-            print(f"Playable cards: {short_string(playable_cards)}")
+            print(f"Playable cards: {short_string(playable_cards)}", file=self.output)
 
     def notify_card_drawn(self, card_drawn: Optional["Card"]) -> None:
-        print("No playable card.", end=" ")
+        print("No playable card.", end=" ", file=self.output)
         if card_drawn:
-            print(f"{self.player.name} draws {card_drawn.shorthand}")
+            print(f"{self.player.name} draws {card_drawn.shorthand}", file=self.output)
         else:
-            print(f"{self.player.name} cannot draw. Deck is empty.")
+            print(f"{self.player.name} cannot draw. Deck is empty.", file=self.output)
+
+
+class AnnouncingTerminalNotifier(TerminalNotifier):
+    """A terminal notifier that also prints the cards played and suits picked.
+
+    Used for players whose moves are not typed in, so the output shows what they
+    did."""
+
+    def notify_card_played(self, card_played: "Card") -> None:
+        print(f"{self.player.name} plays {card_played.shorthand}", file=self.output)
+
+    def notify_suit_picked(self, suit: str) -> None:
+        print(f"{self.player.name} picks {suit} for crazy 8", file=self.output)
+
+
+class BufferedTerminalNotifier(AnnouncingTerminalNotifier):
+    """A notifier that collects the terminal output of a game in memory.
+
+    All events, including the cards played and suits picked, are written into
+    `buffer`, and `flush` writes the buffer to `file` (or standard output) with a
+    single call. If all notifiers of a game share the same buffer, e.g., by using
+    `functools.partial(BufferedTerminalNotifier, buffer=buffer, file=file)` as
+    notifier factory, each game is written in one piece when it ends.
+    """
+
+    def __init__(
+        self,
+        player: "Player",
+        buffer: Optional[io.StringIO] = None,
+        file: Optional[TextIO] = None,
+    ):
+        super().__init__(player, file)
+        self.buffer = io.StringIO() if buffer is None else buffer
+        self.output = self.buffer
+
+    def flush(self) -> None:
+        output = self.buffer.getvalue()
+        if output:
+            (self.file or sys.stdout).write(output)
+            self.buffer.seek(0)
+            self.buffer.truncate()
+
+
+class NullNotifier(Notifier):
+    """A notifier that ignores all events.
+
+    Used for headless games, e.g., in simulations, where no output is wanted. All
+    methods return immediately; in particular, no strings are formatted and the
+    playable cards are not computed."""
+
+    def notify(self, message: str) -> None:
+        pass
+
+    def notify_turn(self, context: "TurnContext") -> None:
+        pass
+
+    def notify_card_played(self, card_played: "Card") -> None:
+        pass
+
+    def notify_card_drawn(self, card_drawn: Optional["Card"]) -> None:
+        pass
+
+    def notify_suit_picked(self, suit: str) -> None:
+        pass
@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from crazyeights.deck import Card
+    from crazyeights.game import CrazyEightsGame
+
+
+class GameObserver:
+    """Interface for objects that follow the events of a game.
+
+    Observers are added with `CrazyEightsGame.add_observer`. Unlike notifiers,
+    which are told about the actions of their own player, observers are told
+    about the actions of all players, identified by their index. The methods do
+    nothing by default; subclasses override the events they are interested in.
+
+    Every event is passed to every observer, including the cards drawn by other
+    players; observers that model what a player knows have to ignore them."""
+
+    def start(self, game: "CrazyEightsGame") -> None:
+        """Called when the observer is added to `game`."""
+        pass
+
+    def card_played(self, player_index: int, card: "Card") -> None:
+        """Called when a player has played `card`."""
+        pass
+
+    def suit_picked(self, player_index: int, suit: str) -> None:
+        """Called when a player has picked `suit` for a crazy 8."""
+        pass
+
+    def card_drawn(self, player_index: int, card: Optional["Card"]) -> None:
+        """Called when a player who could not play has drawn `card`, or None if the
+        deck was empty."""
+        pass
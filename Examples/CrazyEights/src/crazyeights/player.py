@@ -1,8 +1,10 @@
+import time
 from abc import ABC, abstractmethod
 from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 
 from crazyeights.deck import Card, Deck
+from crazyeights.hand import Hand
 from crazyeights.notifier import Notifier
 
 if TYPE_CHECKING:
@@ -17,6 +19,71 @@ class TurnAction(StrEnum):
     FAILED_DRAW = "draw failed"
 
 
+class TurnContext:
+    """The situation in which a player has to pick a card in one turn.
+
+    `Player.take_turn` creates one context per turn and passes it to the notifier
+    and to `Player.pick_card_to_play`. The playable cards and the eights in the hand
+    are computed when they are first needed and then shared by everyone who uses
+    the context. When the player draws a card, `add_drawn_card` updates them
+    instead of computing them again.
+
+    Examples:
+    >>> hand = Hand([Card("Hearts", "2"), Card("Clubs", "8"), Card("Spades", "4")])
+    >>> context = TurnContext(hand, Card("Hearts", "King"))
+    >>> context.playable_cards
+    [Card(Hearts, 2), Card(Clubs, 8)]
+    >>> hand.append(Card("Hearts", "5"))
+    >>> context.add_drawn_card(Card("Hearts", "5"))
+    >>> context.playable_cards
+    [Card(Hearts, 2), Card(Clubs, 8), Card(Hearts, 5)]
+    >>> context.eights
+    [Card(Clubs, 8)]
+    """
+
+    __slots__ = ("hand", "top_discard", "active_suit", "game", "_playable", "_eights")
+
+    def __init__(
+        self,
+        hand: Hand,
+        top_discard: Card,
+        active_suit: Optional[str] = None,
+        game: Optional["CrazyEightsGame"] = None,
+    ):
+        self.hand = hand
+        self.top_discard = top_discard
+        self.active_suit = active_suit
+        self.game = game
+        self._playable: Optional[list[Card]] = None
+        self._eights: Optional[list[Card]] = None
+
+    def __repr__(self) -> str:
+        return f"TurnContext({self.top_discard!r}, {self.active_suit!r})"
+
+    @property
+    def playable_cards(self) -> list[Card]:
+        """The cards in the hand that can be played, in hand order."""
+        if self._playable is None:
+            self._playable = self.hand.matching(self.top_discard, self.active_suit)
+        return self._playable
+
+    @property
+    def eights(self) -> list[Card]:
+        """The 8s in the hand, in hand order."""
+        if self._eights is None:
+            self._eights = self.hand.cards_of_rank("8")
+        return self._eights
+
+    def add_drawn_card(self, card: Card) -> None:
+        """Update the context after `card` was drawn into the hand."""
+        if self._playable is not None and card.matches(
+            self.top_discard, self.active_suit
+        ):
+            self._playable.append(card)
+        if self._eights is not None and card.rank == "8":
+            self._eights.append(card)
+
+
 class Player(ABC):
     def __init__(
         self, name: str, notifier: Notifier, hand: Optional[list["Card"]] = None
@@ -25,6 +92,17 @@ class Player(ABC):
         self.hand = [] if hand is None else hand
         self.notifier = notifier
 
+    @property
+    def hand(self) -> Hand:
+        """The cards in the player's hand.
+
+        Any list of cards can be assigned; it is converted into a `Hand`."""
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards: list[Card]) -> None:
+        self._hand = cards if isinstance(cards, Hand) else Hand(cards)
+
     def __repr__(self) -> str:
         return f"Player({self.name!r}, {self.hand!r})"
 
@@ -50,15 +128,18 @@ class Player(ABC):
         for _ in range(n):
             self.draw_card(deck)
 
-    def get_playable_cards(self, top_discard: Card) -> list[Card]:
+    def get_playable_cards(
+        self, top_discard: Card, active_suit: Optional[str] = None
+    ) -> list[Card]:
         """Return a list of cards that can be played on the given discard.
 
+        If the top discard is a crazy 8, `active_suit` is the suit picked for it.
         If the player has no playable cards, an empty list is returned."""
-        return [card for card in self.hand if card.matches(top_discard)]
+        return self.hand.matching(top_discard, active_suit)
 
     @abstractmethod
-    def pick_card_to_play(self, top_discard: Card) -> Card | None:
-        """Pick a card to play from the given list of playable cards.
+    def pick_card_to_play(self, context: TurnContext) -> Card | None:
+        """Pick a card to play from the playable cards of the turn's context.
 
         Returns the card the player wants to play, or None if the player cannot play
         any of the cards."""
@@ -73,36 +154,53 @@ class Player(ABC):
         """Returns an 8 (of any suit) if the player has one in their hand.
 
         Returns None if the player does not have an 8 in their hand."""
-        for card in self.hand:
-            if card.rank == "8":
-                return card
-        return None
+        return self.hand.first_of_rank("8")
 
     def all_eights(self) -> list[Card]:
         """Returns all 8s in the player's hand."""
-        return [card for card in self.hand if card.rank == "8"]
+        return self.hand.cards_of_rank("8")
 
-    def try_to_play_card(self, game: "CrazyEightsGame") -> bool:
+    def create_turn_context(self, game: "CrazyEightsGame") -> TurnContext:
+        """Return the context for a turn of this player in `game`."""
+        return TurnContext(self.hand, game.top_discard, game.active_suit, game)
+
+    def try_to_play_card(
+        self, game: "CrazyEightsGame", context: Optional[TurnContext] = None
+    ) -> bool:
         """Try to play a card from the player's hand.
 
         Returns True if a card was played, False otherwise."""
-
-        card_to_play = self.pick_card_to_play(game.top_discard)
+        if context is None:
+            context = self.create_turn_context(game)
+        if game.metrics is None:
+            card_to_play = self.pick_card_to_play(context)
+        else:
+            start = time.perf_counter()
+            card_to_play = self.pick_card_to_play(context)
+            game.metrics.add_time("pick_seconds", self, time.perf_counter() - start)
         if card_to_play is None:
             return False
 
         self.play_card(game, card_to_play)
         return True
 
-    def draw_and_play_card(self, game: "CrazyEightsGame") -> bool:
+    def draw_and_play_card(
+        self, game: "CrazyEightsGame", context: Optional[TurnContext] = None
+    ) -> bool:
         """Draw a card from the deck and play it if possible.
 
         Returns True if a card could be drawn, False otherwise."""
         drawn_card = self.draw_card(game.deck)
         self.notifier.notify_card_drawn(drawn_card)
+        if game.observers:
+            game.notify_observers("card_drawn", drawn_card)
 
         if drawn_card:
-            self.try_to_play_card(game)
+            if context is None:
+                context = self.create_turn_context(game)
+            else:
+                context.add_drawn_card(drawn_card)
+            self.try_to_play_card(game, context)
             return True
         return False
 
@@ -113,16 +211,21 @@ class Player(ABC):
         self.hand.remove(card)
         game.discard(card)
         self.notifier.notify_card_played(card)
+        if game.observers:
+            game.notify_observers("card_played", card)
         if card.rank == "8":
-            card.suit = self.pick_suit()
-            self.notifier.notify_suit_picked(card.suit)
+            game.active_suit = self.pick_suit()
+            self.notifier.notify_suit_picked(game.active_suit)
+            if game.observers:
+                game.notify_observers("suit_picked", game.active_suit)
 
     def take_turn(self, game: "CrazyEightsGame") -> TurnAction:
-        self.notifier.notify_turn(game.top_discard)
+        context = self.create_turn_context(game)
+        self.notifier.notify_turn(context)
 
-        played_card = self.try_to_play_card(game)
+        played_card = self.try_to_play_card(game, context)
         if not played_card:
-            drawn_card = self.draw_and_play_card(game)
+            drawn_card = self.draw_and_play_card(game, context)
             return TurnAction.DREW_CARD if drawn_card else TurnAction.FAILED_DRAW
         return TurnAction.PLAYED_CARD
 
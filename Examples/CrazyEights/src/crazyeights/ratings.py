@@ -0,0 +1,199 @@
+"""Elo ratings for strategies, updated incrementally from a stream of games.
+
+Every game is reduced to the strategy in each seat and the finishing order of
+the seats; only one `Rating` per strategy is stored, not the games. A game
+between more than two players counts as one two-player game between every pair
+of seats, with the K-factor divided by the number of opponents, so that a game
+moves a rating by about as much as a two-player game would.
+
+New strategies start with a larger K-factor for their first
+`provisional_games` games, so that their ratings quickly move close to their
+strength and then settle.
+"""
+
+import itertools
+import json
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from crazyeights.game import GameResult
+
+if TYPE_CHECKING:
+    from crazyeights.game import CrazyEightsGame
+
+INITIAL_RATING = 1500.0
+DEFAULT_K_FACTOR = 16.0
+DEFAULT_PROVISIONAL_K_FACTOR = 64.0
+DEFAULT_PROVISIONAL_GAMES = 30
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """Return the expected score of a player with `rating` against an opponent.
+
+    Examples:
+    >>> expected_score(1500, 1500)
+    0.5
+    >>> round(expected_score(1900, 1500), 3)
+    0.909
+    """
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def finishing_ranks(
+    result: GameResult, winner: Optional[int], cards_left: Sequence[int]
+) -> list[int]:
+    """Return the rank of each seat at the end of a game, 0 being the best.
+
+    The winner comes first, the other seats follow by the number of cards left in
+    their hands; seats with the same number of cards share their rank.
+
+    Examples:
+    >>> finishing_ranks(GameResult.CURRENT_PLAYER_WON, 2, (3, 5, 0, 3))
+    [1, 3, 0, 1]
+    >>> finishing_ranks(GameResult.NO_PLAYABLE_CARDS, None, (2, 1, 2))
+    [1, 0, 1]
+    """
+    won = result == GameResult.CURRENT_PLAYER_WON
+    keys = [
+        (not won or seat != winner, num_cards)
+        for seat, num_cards in enumerate(cards_left)
+    ]
+    return [sum(other < key for other in keys) for key in keys]
+
+
+class Rating:
+    """The rating of a strategy and the number of games it played and won."""
+
+    __slots__ = ("rating", "games", "wins")
+
+    def __init__(self, rating: float = INITIAL_RATING, games: int = 0, wins: int = 0):
+        self.rating = rating
+        self.games = games
+        self.wins = wins
+
+    def __repr__(self) -> str:
+        return f"<Rating {self.rating:.1f} after {self.games} games>"
+
+    def to_dict(self) -> dict:
+        return {"rating": self.rating, "games": self.games, "wins": self.wins}
+
+
+class EloRatings:
+    """Elo ratings of strategies that play against each other.
+
+    Examples:
+    >>> ratings = EloRatings()
+    >>> ratings.add_game(["greedy", "random"], [0, 1])
+    >>> ratings.add_game(["random", "greedy", "greedy"], [2, 0, 1])
+    >>> [(name, round(r.rating, 1), r.games) for name, r in ratings.leaderboard()]
+    [('greedy', 1558.2, 2), ('random', 1441.8, 2)]
+    """
+
+    def __init__(
+        self,
+        k_factor: float = DEFAULT_K_FACTOR,
+        provisional_k_factor: float = DEFAULT_PROVISIONAL_K_FACTOR,
+        provisional_games: int = DEFAULT_PROVISIONAL_GAMES,
+    ):
+        self.k_factor = k_factor
+        self.provisional_k_factor = provisional_k_factor
+        self.provisional_games = provisional_games
+        self.ratings: dict[str, Rating] = {}
+        self.num_games = 0
+
+    def __repr__(self) -> str:
+        return f"<EloRatings: {len(self.ratings)} strategies, {self.num_games} games>"
+
+    def __getitem__(self, strategy: str) -> Rating:
+        return self.ratings[strategy]
+
+    def k(self, rating: Rating) -> float:
+        """Return the K-factor for the next game of a strategy."""
+        if rating.games < self.provisional_games:
+            return self.provisional_k_factor
+        return self.k_factor
+
+    def add_game(self, strategies: Sequence[str], ranks: Sequence[int]) -> None:
+        """Update the ratings with a game in which seat `i` was played by
+        `strategies[i]` and finished with rank `ranks[i]` (0 being the best).
+
+        All pairs of seats are scored against the ratings before the game. Seats
+        played by the same strategy are not compared with each other."""
+        if len(strategies) != len(ranks) or len(strategies) < 2:
+            raise ValueError("Need a strategy and a rank for at least two seats.")
+        ratings = [self.ratings.setdefault(name, Rating()) for name in strategies]
+        before = [rating.rating for rating in ratings]
+        factors = [self.k(rating) / (len(ratings) - 1) for rating in ratings]
+        deltas = [0.0] * len(ratings)
+        for i, j in itertools.combinations(range(len(ratings)), 2):
+            if ratings[i] is ratings[j]:
+                continue
+            score = 1.0 if ranks[i] < ranks[j] else 0.5 if ranks[i] == ranks[j] else 0.0
+            surprise = score - expected_score(before[i], before[j])
+            deltas[i] += factors[i] * surprise
+            deltas[j] -= factors[j] * surprise
+        for rating, delta in zip(ratings, deltas):
+            rating.rating += delta
+        # A strategy in several seats plays (and wins) the game once.
+        best = min(ranks)
+        winners = {id(r) for r, rank in zip(ratings, ranks) if rank == best}
+        for rating in {id(rating): rating for rating in ratings}.values():
+            rating.games += 1
+            rating.wins += id(rating) in winners
+        self.num_games += 1
+
+    def add_result(
+        self,
+        strategies: Sequence[str],
+        result: GameResult,
+        winner: Optional[int],
+        cards_left: Sequence[int],
+    ) -> None:
+        """Update the ratings with the outcome of a game, as returned by
+        `crazyeights.simulation.play_headless_game`."""
+        self.add_game(strategies, finishing_ranks(result, winner, cards_left))
+
+    def add_finished_game(self, game: "CrazyEightsGame", result: GameResult) -> None:
+        """Update the ratings with a game that ended with `result`; the strategy of
+        each player is the name of its class."""
+        if result == GameResult.NOT_ENOUGH_PLAYERS:
+            return
+        winner = (
+            game.current_player_index
+            if result == GameResult.CURRENT_PLAYER_WON
+            else None
+        )
+        self.add_result(
+            [type(player).__name__ for player in game.players],
+            result,
+            winner,
+            [len(player.hand) for player in game.players],
+        )
+
+    def leaderboard(self) -> list[tuple[str, Rating]]:
+        """Return the strategies and their ratings, best first."""
+        return sorted(self.ratings.items(), key=lambda item: -item[1].rating)
+
+    def to_dict(self) -> dict:
+        """Return a snapshot of the leaderboard as a JSON-compatible dict."""
+        return {
+            "games": self.num_games,
+            "leaderboard": [
+                {"strategy": name, **rating.to_dict()}
+                for name, rating in self.leaderboard()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, **kwargs) -> "EloRatings":
+        """Restore ratings from a snapshot, e.g., to continue rating; `kwargs` are
+        passed to the constructor."""
+        ratings = cls(**kwargs)
+        ratings.num_games = data["games"]
+        for entry in data["leaderboard"]:
+            ratings.ratings[entry["strategy"]] = Rating(
+                entry["rating"], entry["games"], entry["wins"]
+            )
+        return ratings
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
@@ -0,0 +1,195 @@
+"""Compact binary recordings of games and their deterministic replay.
+
+A recording starts with a header of 54 bytes: the format version, the number of
+players, and the order of the 52 cards in the shuffled deck (as `Card.index`
+values, drawn from the end). This is followed by the turns of the game, each of
+which takes one to three bytes:
+
+- a played card is recorded as its index (0..51),
+- `DRAW` means that the player drew a card and did not play it,
+- `DRAW_AND_PLAY` means that the player drew a card and then played the card
+  recorded in the next byte,
+- `FAILED_DRAW` means that the player could neither play nor draw,
+- a crazy 8 is followed by the index of the picked suit in `SUITS` (0..3).
+
+The cards drawn are not recorded since they follow from the order of the deck.
+"""
+
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Optional
+
+from crazyeights.deck import CARDS_BY_INDEX, SUITS, Card, Deck
+from crazyeights.notifier import NullNotifier
+from crazyeights.player import Player, TurnAction, TurnContext
+
+if TYPE_CHECKING:
+    from crazyeights.game import CrazyEightsGame
+
+FORMAT_VERSION = 1
+NUM_CARDS = len(CARDS_BY_INDEX)
+HEADER_SIZE = 2 + NUM_CARDS
+
+DRAW = NUM_CARDS
+DRAW_AND_PLAY = NUM_CARDS + 1
+FAILED_DRAW = NUM_CARDS + 2
+
+
+class RecordingError(ValueError):
+    """Raised if a recording is malformed or does not match the replayed game."""
+
+
+class GameRecorder:
+    """Records the turns of a game in the binary format."""
+
+    def __init__(self, num_players: int, deck_cards: Iterable[Card]):
+        self.data = bytearray((FORMAT_VERSION, num_players))
+        self.data += bytes(card.index for card in deck_cards)
+        if len(self.data) != HEADER_SIZE:
+            raise RecordingError("Only games with a full deck can be recorded.")
+
+    def __repr__(self) -> str:
+        return f"<GameRecorder: {len(self.data)} bytes>"
+
+    def record_turn(
+        self,
+        action: TurnAction,
+        played_card: Optional[Card],
+        active_suit: Optional[str],
+    ) -> None:
+        """Record a turn that ended with `action`.
+
+        `played_card` is the card played in the turn (if any), `active_suit` is the
+        suit picked if the card is a crazy 8."""
+        if action == TurnAction.FAILED_DRAW:
+            self.data.append(FAILED_DRAW)
+            return
+        if action == TurnAction.DREW_CARD:
+            if played_card is None:
+                self.data.append(DRAW)
+                return
+            self.data.append(DRAW_AND_PLAY)
+        self.data.append(played_card.index)
+        if played_card.rank == "8":
+            self.data.append(SUITS.index(active_suit))
+
+
+class RecordingReader:
+    """Reads the moves from a recording, one decision at a time."""
+
+    def __init__(self, data: bytes):
+        data = bytes(data)
+        if len(data) < HEADER_SIZE or data[0] != FORMAT_VERSION:
+            raise RecordingError("Not a recording of a game.")
+        self.data = data
+        self.position = HEADER_SIZE
+        # Set after a draw: True if the drawn card was played, False otherwise.
+        self.played_after_draw: Optional[bool] = None
+
+    def __repr__(self) -> str:
+        return f"<RecordingReader at byte {self.position} of {len(self.data)}>"
+
+    @property
+    def num_players(self) -> int:
+        return self.data[1]
+
+    @property
+    def deck_cards(self) -> list[Card]:
+        return [CARDS_BY_INDEX[index] for index in self.data[2:HEADER_SIZE]]
+
+    @property
+    def at_end(self) -> bool:
+        return self.position >= len(self.data)
+
+    def read_byte(self) -> int:
+        if self.at_end:
+            raise RecordingError("Unexpected end of recording.")
+        byte = self.data[self.position]
+        self.position += 1
+        return byte
+
+    def read_card(self) -> Card:
+        code = self.read_byte()
+        if code >= NUM_CARDS:
+            raise RecordingError(f"Expected a card, found {code}.")
+        return CARDS_BY_INDEX[code]
+
+    def pick_card(self) -> Optional[Card]:
+        """Return the card the player decided to play, or None.
+
+        After a draw the player picks a card a second time; this returns the card
+        played after the draw, if any."""
+        if self.played_after_draw is not None:
+            played_after_draw = self.played_after_draw
+            self.played_after_draw = None
+            return self.read_card() if played_after_draw else None
+        code = self.read_byte()
+        if code < NUM_CARDS:
+            return CARDS_BY_INDEX[code]
+        if code == DRAW:
+            self.played_after_draw = False
+        elif code == DRAW_AND_PLAY:
+            self.played_after_draw = True
+        elif code != FAILED_DRAW:
+            raise RecordingError(f"Invalid move {code}.")
+        return None
+
+    def pick_suit(self) -> str:
+        code = self.read_byte()
+        if code >= len(SUITS):
+            raise RecordingError(f"Invalid suit {code}.")
+        return SUITS[code]
+
+
+class ReplayPlayer(Player):
+    """A player that repeats the moves recorded in a recording.
+
+    All players of a replayed game share the same reader."""
+
+    def __init__(self, name: str, reader: RecordingReader):
+        super().__init__(name, NullNotifier(self))
+        self.reader = reader
+
+    def pick_card_to_play(self, context: TurnContext) -> Card | None:
+        card = self.reader.pick_card()
+        if card is not None and card not in self.hand:
+            raise RecordingError(f"{self.name} does not hold {card}.")
+        return card
+
+    def pick_suit(self) -> str:
+        return self.reader.pick_suit()
+
+
+def replay(data: bytes, num_turns: Optional[int] = None) -> "CrazyEightsGame":
+    """Rebuild the game in a recording.
+
+    Returns the game after `num_turns` turns have been played, or at the end of
+    the recording if `num_turns` is None or greater than the number of turns in
+    the recording."""
+    from crazyeights.game import CrazyEightsGame
+
+    reader = RecordingReader(data)
+    players = [
+        ReplayPlayer(f"Player {i + 1}", reader) for i in range(reader.num_players)
+    ]
+    game = CrazyEightsGame(players, deck=Deck.from_cards(reader.deck_cards))
+    while not reader.at_end and (num_turns is None or game.num_turns < num_turns):
+        if game.play_turn() is not None:
+            break
+    return game
+
+
+def write_recording(file: BinaryIO, data: bytes) -> None:
+    """Append a recording to an archive file.
+
+    Each recording is stored with a two-byte length prefix."""
+    file.write(len(data).to_bytes(2, "big"))
+    file.write(data)
+
+
+def read_recordings(file: BinaryIO) -> Iterator[bytes]:
+    """Return the recordings stored in an archive file by `write_recording`."""
+    while prefix := file.read(2):
+        size = int.from_bytes(prefix, "big")
+        data = file.read(size)
+        if len(data) != size:
+            raise RecordingError("Truncated archive.")
+        yield data
@@ -0,0 +1,7 @@
+"""Playing games over the network; see `crazyeights.remote.server`, and
+distributing tournaments over many machines; see `crazyeights.remote.cluster`."""
+
+# Defined here so that the command line interface can use it without importing
+# `asyncio`.
+DEFAULT_PORT = 8888
+DEFAULT_COORDINATOR_PORT = 8889
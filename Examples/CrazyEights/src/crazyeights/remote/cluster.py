@@ -0,0 +1,290 @@
+"""Tournaments distributed over many machines with a small work-queue protocol.
+
+A `Coordinator` splits the games of a tournament into chunks, like
+`crazyeights.tournament.run_tournament`, and hands them out to workers that
+connect over TCP. Workers (see `run_worker`) play each chunk with
+`crazyeights.tournament.play_chunk` and send back its statistics, which the
+coordinator merges as they arrive. The statistics are exact integer sums, so they
+are the same as those of `run_tournament` with the same seed, for any number of
+workers.
+
+The protocol exchanges one JSON object per line:
+
+- the worker connects and sends `{"type": "hello", "version": 1, "name": ...}`,
+- the coordinator answers with a chunk, `{"type": "chunk", "index": ..., "seed":
+  ..., "start": ..., "stop": ..., "num_players": ..., "engine": ...}`, or with
+  `{"type": "done"}` if all games have been played,
+- the worker plays the games and sends `{"type": "result", "index": ..., "stats":
+  ...}` with `SimulationStats.to_dict()`, and the coordinator answers with the
+  next chunk.
+
+A chunk goes back to the front of the queue if its worker disconnects, sends an
+invalid message, or does not answer within `timeout` seconds (e.g., because its
+machine lost power); it is then played by the next worker that asks for work.
+Since every game has its own seed, a chunk can be played any number of times and
+always gives the same statistics.
+"""
+
+import asyncio
+import json
+import random
+import socket
+import time
+from collections import deque
+from typing import Optional
+
+from crazyeights.remote import DEFAULT_COORDINATOR_PORT
+from crazyeights.remote.connection import Connection
+from crazyeights.simulation import SimulationStats, get_engine
+from crazyeights.tournament import DEFAULT_CHUNK_SIZE, chunk_ranges, play_chunk
+
+PROTOCOL_VERSION = 1
+DEFAULT_TIMEOUT = 600.0
+# Statistics are sent in a single line; they are a few kilobytes long.
+LINE_LIMIT = 2**20
+
+
+class ProtocolError(ValueError):
+    """Raised if a message does not follow the protocol."""
+
+
+def encode_message(message: dict) -> str:
+    return json.dumps(message) + "\n"
+
+
+def decode_message(line: str, expected_type: str) -> dict:
+    """Parse a line of the protocol and check the type of the message.
+
+    Examples:
+    >>> decode_message('{"type": "done"}', "done")
+    {'type': 'done'}
+    >>> decode_message('{"type": "done"}', "chunk")
+    Traceback (most recent call last):
+    ...
+    crazyeights.remote.cluster.ProtocolError: Expected a chunk message, got done.
+    """
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError as error:
+        raise ProtocolError(f"Invalid message: {line[:80]!r}") from error
+    if not isinstance(message, dict):
+        raise ProtocolError(f"Invalid message: {line[:80]!r}")
+    if message.get("type") != expected_type:
+        raise ProtocolError(
+            f"Expected a {expected_type} message, got {message.get('type')}."
+        )
+    return message
+
+
+class Coordinator:
+    """Hands out the games of a tournament to workers and merges their results.
+
+    The tournament has the same parameters as `run_tournament`; `timeout` is the
+    number of seconds a worker has to play a chunk before it is given to another
+    worker."""
+
+    def __init__(
+        self,
+        num_games: int,
+        seed: int = -1,
+        num_players: int = 2,
+        engine: str = "object",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_COORDINATOR_PORT,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        if num_players < 2:
+            raise ValueError("Must have at least two players to play.")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive.")
+        get_engine(engine)
+        self.seed = seed if seed >= 0 else random.randrange(2**32)
+        self.num_players = num_players
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.ranges = chunk_ranges(num_games, chunk_size)
+        self.pending = deque(range(len(self.ranges)))
+        self.finished: set[int] = set()
+        self.stats = SimulationStats(num_players)
+        self.num_reassigned = 0
+        self.chunks_by_worker: dict[str, int] = {}
+        self.work_available = asyncio.Event()
+        self.done = asyncio.Event()
+        self.server: Optional[asyncio.Server] = None
+        self.workers: set[asyncio.Task] = set()
+        if not self.ranges:
+            self.done.set()
+
+    def __repr__(self) -> str:
+        return (
+            f"<Coordinator on {self.host}:{self.port}: "
+            f"{len(self.finished)} of {len(self.ranges)} chunks>"
+        )
+
+    async def start(self) -> None:
+        """Start accepting workers.
+
+        If the coordinator was created with port 0, `port` is set to the port that
+        the operating system picked."""
+        self.server = await asyncio.start_server(
+            self.handle_worker, self.host, self.port, limit=LINE_LIMIT
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def run(self) -> SimulationStats:
+        """Wait until all games have been played and return their statistics.
+
+        Only `elapsed_time` is measured for the whole tournament."""
+        if self.server is None:
+            await self.start()
+        start_time = time.perf_counter()
+        try:
+            await self.done.wait()
+        finally:
+            await self.close()
+        self.stats.elapsed_time = time.perf_counter() - start_time
+        return self.stats
+
+    async def close(self) -> None:
+        """Stop accepting workers and tell the connected ones that there is no more
+        work."""
+        self.work_available.set()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.workers:
+            await asyncio.wait(self.workers)
+
+    async def next_chunk(self) -> Optional[int]:
+        """Return the index of the next chunk to play, or None when all chunks have
+        been played.
+
+        If all chunks are assigned, this waits until one is given back or all of
+        them are finished."""
+        while not self.done.is_set():
+            if self.pending:
+                return self.pending.popleft()
+            self.work_available.clear()
+            await self.work_available.wait()
+            if self.server is not None and not self.server.is_serving():
+                return None
+        return None
+
+    def reassign(self, index: int) -> None:
+        if index not in self.finished:
+            self.pending.appendleft(index)
+            self.num_reassigned += 1
+            self.work_available.set()
+
+    def add_result(self, index: int, stats: SimulationStats) -> None:
+        """Merge the statistics of a chunk, unless the chunk was already finished
+        by another worker."""
+        if index in self.finished:
+            return
+        self.finished.add(index)
+        self.stats.merge(stats)
+        if len(self.finished) == len(self.ranges):
+            self.done.set()
+            self.work_available.set()
+
+    async def handle_worker(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        self.workers.add(task)
+        connection = Connection(reader, writer, self.timeout)
+        index = None
+        try:
+            line = await connection.readline()
+            if line is None:
+                return
+            hello = decode_message(line, "hello")
+            if hello.get("version") != PROTOCOL_VERSION:
+                raise ProtocolError(f"Unsupported version {hello.get('version')}.")
+            while (index := await self.next_chunk()) is not None:
+                start, stop = self.ranges[index]
+                connection.write(
+                    encode_message(
+                        {
+                            "type": "chunk",
+                            "index": index,
+                            "seed": self.seed,
+                            "start": start,
+                            "stop": stop,
+                            "num_players": self.num_players,
+                            "engine": self.engine,
+                        }
+                    )
+                )
+                line = await connection.readline()
+                if line is None:
+                    return
+                result = decode_message(line, "result")
+                if result.get("index") != index:
+                    raise ProtocolError(f"Expected the result of chunk {index}.")
+                try:
+                    stats = SimulationStats.from_dict(result["stats"])
+                except (KeyError, TypeError) as error:
+                    raise ProtocolError(f"Invalid statistics: {error!r}") from error
+                if stats.num_games != stop - start:
+                    raise ProtocolError(f"Wrong number of games in chunk {index}.")
+                self.add_result(index, stats)
+                index = None
+                name = str(hello.get("name"))
+                self.chunks_by_worker[name] = self.chunks_by_worker.get(name, 0) + 1
+            connection.write(encode_message({"type": "done"}))
+        except ProtocolError as error:
+            connection.write(encode_message({"type": "error", "message": str(error)}))
+        finally:
+            if index is not None:
+                self.reassign(index)
+            await connection.close()
+            self.workers.discard(task)
+
+
+def run_worker(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_COORDINATOR_PORT,
+    name: Optional[str] = None,
+    max_chunks: Optional[int] = None,
+) -> int:
+    """Play chunks handed out by the coordinator at `host` and `port` until it has
+    no more work, or until `max_chunks` chunks have been played.
+
+    Returns the number of chunks played."""
+    if name is None:
+        name = socket.gethostname()
+    num_chunks = 0
+    with socket.create_connection((host, port)) as sock:
+        file = sock.makefile("rwb")
+        hello = {"type": "hello", "version": PROTOCOL_VERSION, "name": name}
+        file.write(encode_message(hello).encode())
+        file.flush()
+        while max_chunks is None or num_chunks < max_chunks:
+            line = file.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            if message.get("type") == "error":
+                raise ProtocolError(message.get("message"))
+            if message.get("type") != "chunk":
+                break
+            stats, _ = play_chunk(
+                message["seed"],
+                message["start"],
+                message["stop"],
+                message["num_players"],
+                message["engine"],
+            )
+            result = {
+                "type": "result",
+                "index": message["index"],
+                "stats": stats.to_dict(),
+            }
+            file.write(encode_message(result).encode())
+            file.flush()
+            num_chunks += 1
+    return num_chunks
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Optional
+
+
+class Connection:
+    """A client connected to the game server.
+
+    The server sends text to the client and reads its answers line by line. A
+    connection can be used as a file for `print`. Writes never block: they are
+    buffered and sent when the server waits for the client's next answer."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        timeout: float,
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+        self.connected = True
+
+    def __repr__(self) -> str:
+        state = "connected" if self.connected else "disconnected"
+        return f"<Connection {state}>"
+
+    def write(self, text: str) -> None:
+        if self.connected and not self.writer.is_closing():
+            self.writer.write(text.encode())
+
+    async def readline(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Return the next line sent by the client, without the line ending.
+
+        Returns None if the client does not answer within `timeout` seconds (by
+        default the timeout of the connection) or has disconnected."""
+        if not self.connected:
+            return None
+        if timeout is None:
+            timeout = self.timeout
+        try:
+            async with asyncio.timeout(timeout):
+                await self.writer.drain()
+                line = await self.reader.readline()
+        except TimeoutError:
+            return None
+        except ConnectionError:
+            line = b""
+        if not line:
+            self.connected = False
+            return None
+        return line.decode(errors="replace").strip()
+
+    async def prompt(self, text: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Send `text` to the client and return its answer (see `readline`)."""
+        self.write(text)
+        return await self.readline(timeout)
+
+    async def close(self) -> None:
+        """Send any buffered output and close the connection."""
+        if not self.writer.is_closing():
+            try:
+                async with asyncio.timeout(self.timeout):
+                    await self.writer.drain()
+            except (TimeoutError, ConnectionError):
+                pass
+            self.writer.close()
+        self.connected = False
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
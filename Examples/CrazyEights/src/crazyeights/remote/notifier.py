@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING, Optional
+
+from crazyeights.deck import Card, short_string
+from crazyeights.notifier import Notifier
+
+if TYPE_CHECKING:
+    from crazyeights.player import Player, TurnContext
+    from crazyeights.remote.connection import Connection
+    from crazyeights.remote.server import Table
+
+
+class TableNotifier(Notifier):
+    """A notifier that sends the events of a player to the clients at a table.
+
+    Public events, such as the cards played, are sent to every client at the table.
+    The player's hand and the cards they draw are only sent to the player's own
+    `connection`, which is None for computer players."""
+
+    def __init__(
+        self,
+        player: "Player",
+        table: "Table",
+        connection: Optional["Connection"] = None,
+    ):
+        super().__init__(player)
+        self.table = table
+        self.connection = connection
+
+    def notify(self, message: str) -> None:
+        if self.connection is not None:
+            print(message, file=self.connection)
+
+    def notify_turn(self, context: "TurnContext") -> None:
+        top_discard = context.top_discard
+        if context.active_suit:
+            top_discard = Card(context.active_suit, top_discard.rank)
+        self.table.broadcast(
+            f"\n{self.player.name}'s turn. Top of discard pile: {top_discard.shorthand}"
+        )
+        self.notify(f"Your hand: {short_string(self.player.hand)}")
+
+    def notify_card_played(self, card_played: Card) -> None:
+        self.table.broadcast(f"{self.player.name} plays {card_played.shorthand}")
+
+    def notify_card_drawn(self, card_drawn: Optional[Card]) -> None:
+        if card_drawn is None:
+            self.table.broadcast(f"{self.player.name} cannot draw. Deck is empty.")
+            return
+        self.notify(f"You draw {card_drawn.shorthand}")
+        self.table.broadcast(
+            f"{self.player.name} draws a card.", exclude=self.connection
+        )
+
+    def notify_suit_picked(self, suit: str) -> None:
+        self.table.broadcast(f"{self.player.name} picks {suit} for crazy 8")
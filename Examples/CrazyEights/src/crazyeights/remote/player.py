@@ -0,0 +1,182 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Optional
+
+from crazyeights.deck import Card, RANKS, SUITS
+from crazyeights.notifier import NullNotifier, Notifier
+from crazyeights.player import Player, TurnAction, TurnContext
+from crazyeights.remote.connection import Connection
+
+if TYPE_CHECKING:
+    from crazyeights.game import CrazyEightsGame
+
+SUIT_ANSWERS = {
+    "h": "Hearts",
+    "hearts": "Hearts",
+    "♥": "Hearts",
+    "d": "Diamonds",
+    "diamonds": "Diamonds",
+    "♦": "Diamonds",
+    "c": "Clubs",
+    "clubs": "Clubs",
+    "♣": "Clubs",
+    "s": "Spades",
+    "spades": "Spades",
+    "♠": "Spades",
+}
+
+
+class AsyncPlayer(Player, ABC):
+    """A player whose decisions are made asynchronously, e.g., by a remote client.
+
+    Subclasses implement the coroutines `pick_card_to_play_async` and
+    `pick_suit_async`. The game server awaits `take_turn_async` instead of calling
+    `take_turn`; apart from that a turn is played exactly like the turn of any
+    other player. An asynchronous player cannot take part in a synchronous game:
+    its synchronous methods raise a TypeError."""
+
+    @abstractmethod
+    async def pick_card_to_play_async(self, context: TurnContext) -> Card | None: ...
+
+    @abstractmethod
+    async def pick_suit_async(self) -> str: ...
+
+    def pick_card_to_play(self, context: TurnContext) -> Card | None:
+        raise self.sync_error()
+
+    def pick_suit(self) -> str:
+        raise self.sync_error()
+
+    def take_turn(self, game: "CrazyEightsGame") -> TurnAction:
+        raise self.sync_error()
+
+    def sync_error(self) -> TypeError:
+        return TypeError(
+            f"{type(self).__name__} is an asynchronous player; its turns must be "
+            "played with `crazyeights.remote.server.play_game`."
+        )
+
+    async def try_to_play_card_async(
+        self, game: "CrazyEightsGame", context: Optional[TurnContext] = None
+    ) -> bool:
+        if context is None:
+            context = self.create_turn_context(game)
+        if game.metrics is None:
+            card_to_play = await self.pick_card_to_play_async(context)
+        else:
+            start = time.perf_counter()
+            card_to_play = await self.pick_card_to_play_async(context)
+            game.metrics.add_time("pick_seconds", self, time.perf_counter() - start)
+        if card_to_play is None:
+            return False
+
+        await self.play_card_async(game, card_to_play)
+        return True
+
+    async def draw_and_play_card_async(
+        self, game: "CrazyEightsGame", context: Optional[TurnContext] = None
+    ) -> bool:
+        drawn_card = self.draw_card(game.deck)
+        self.notifier.notify_card_drawn(drawn_card)
+        if game.observers:
+            game.notify_observers("card_drawn", drawn_card)
+
+        if drawn_card:
+            if context is None:
+                context = self.create_turn_context(game)
+            else:
+                context.add_drawn_card(drawn_card)
+            await self.try_to_play_card_async(game, context)
+            return True
+        return False
+
+    async def play_card_async(self, game: "CrazyEightsGame", card: Card) -> None:
+        self.hand.remove(card)
+        game.discard(card)
+        self.notifier.notify_card_played(card)
+        if game.observers:
+            game.notify_observers("card_played", card)
+        if card.rank == "8":
+            game.active_suit = await self.pick_suit_async()
+            self.notifier.notify_suit_picked(game.active_suit)
+            if game.observers:
+                game.notify_observers("suit_picked", game.active_suit)
+
+    async def take_turn_async(self, game: "CrazyEightsGame") -> TurnAction:
+        context = self.create_turn_context(game)
+        self.notifier.notify_turn(context)
+
+        played_card = await self.try_to_play_card_async(game, context)
+        if not played_card:
+            drawn_card = await self.draw_and_play_card_async(game, context)
+            return TurnAction.DREW_CARD if drawn_card else TurnAction.FAILED_DRAW
+        return TurnAction.PLAYED_CARD
+
+
+class RemotePlayer(AsyncPlayer):
+    """A player that picks their moves in a client connected to the game server.
+
+    Each decision has to be made within the timeout of the connection. If the
+    client does not answer in time or has disconnected, the move is made for them
+    the way `GreedyPlayer` would make it."""
+
+    def __init__(
+        self,
+        name: str,
+        connection: Connection,
+        notifier_factory: Optional[Callable[[Player], Notifier]] = None,
+    ):
+        self.connection = connection
+        if notifier_factory is None:
+            notifier_factory = NullNotifier
+        super().__init__(name, notifier_factory(self))
+
+    async def ask(self, question: str, deadline: float) -> Optional[str]:
+        """Ask the client a question that has to be answered before `deadline`.
+
+        Returns None if the client did not answer in time."""
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            return None
+        answer = await self.connection.prompt(question, remaining)
+        if answer is None and self.connection.connected:
+            self.connection.write("Time is up.\n")
+        return answer
+
+    def deadline(self) -> float:
+        return asyncio.get_running_loop().time() + self.connection.timeout
+
+    async def pick_card_to_play_async(self, context: TurnContext) -> Card | None:
+        """Let the client pick one of the playable cards."""
+        playable_cards = context.playable_cards
+        if not playable_cards:
+            return None
+        choices = "".join(
+            f"{i}: {card.shorthand}\n" for i, card in enumerate(playable_cards, 1)
+        )
+        deadline = self.deadline()
+        while (
+            answer := await self.ask(
+                choices + "Pick a card to play (-1 to skip): ", deadline
+            )
+        ) is not None:
+            if answer == "-1":
+                return None
+            if answer.isdigit() and 1 <= int(answer) <= len(playable_cards):
+                return playable_cards[int(answer) - 1]
+            self.connection.write("Invalid input. Try again.\n")
+        return max(playable_cards, key=lambda card: RANKS.index(card.rank))
+
+    async def pick_suit_async(self) -> str:
+        """Let the client pick a suit after playing an 8."""
+        deadline = self.deadline()
+        while (
+            answer := await self.ask("Pick a suit (h♥/d♦/c♣/s♠): ", deadline)
+        ) is not None:
+            if answer.lower() in SUIT_ANSWERS:
+                return SUIT_ANSWERS[answer.lower()]
+            if answer in SUITS:
+                return answer
+            self.connection.write("Invalid suit. Try again.\n")
+        return max(SUITS, key=self.hand.count_suit)
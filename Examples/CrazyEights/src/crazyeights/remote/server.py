@@ -0,0 +1,217 @@
+"""An asyncio server that hosts many games over TCP.
+
+Clients connect with a line-based text protocol (e.g., with `nc` or `telnet`),
+enter their name and are seated at the next table. A table starts as soon as
+enough clients are waiting; the remaining seats are taken by computer players.
+All tables are played in the event loop of a single process: each table runs in
+its own task, human players are awaited, and computer players take their turns
+inline, followed by a yield to the event loop.
+"""
+
+import asyncio
+import functools
+import random
+import time
+from typing import Optional
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.game import CrazyEightsGame, GameResult
+from crazyeights.metrics import MetricsSink
+from crazyeights.player import Player
+from crazyeights.remote import DEFAULT_PORT
+from crazyeights.remote.connection import Connection
+from crazyeights.remote.notifier import TableNotifier
+from crazyeights.remote.player import AsyncPlayer, RemotePlayer
+from crazyeights.simulation import game_seed
+
+# Many clients may connect at the same time; with the default backlog of 100 the
+# operating system drops their connection attempts, and they retry only after
+# increasingly long delays.
+BACKLOG = 4096
+
+
+async def play_turn(game: CrazyEightsGame) -> Optional[GameResult]:
+    """Let the current player take a turn; the async version of
+    `CrazyEightsGame.play_turn`."""
+    player = game.current_player
+    num_discards = len(game.discard_pile)
+    start = time.perf_counter()
+    if isinstance(player, AsyncPlayer):
+        action_taken = await player.take_turn_async(game)
+    else:
+        action_taken = player.take_turn(game)
+    if game.metrics is not None:
+        game.metrics.add_time("turn_seconds", player, time.perf_counter() - start)
+    return game.end_turn(action_taken, num_discards)
+
+
+async def play_game(game: CrazyEightsGame) -> GameResult:
+    """Play a game with synchronous and asynchronous players to the end.
+
+    Yields to the event loop after every turn, so that games between computer
+    players do not keep other tasks from running."""
+    if len(game.players) < 2:
+        return GameResult.NOT_ENOUGH_PLAYERS
+    try:
+        while (result := await play_turn(game)) is None:
+            await asyncio.sleep(0)
+        game.report_metrics(result)
+        return result
+    finally:
+        for player in game.players:
+            player.notifier.flush()
+
+
+class Table:
+    """A game at the server between remote and computer players."""
+
+    def __init__(
+        self,
+        number: int,
+        clients: list[tuple[str, Connection]],
+        num_computers: int,
+        rng: Optional[random.Random] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+    ):
+        self.number = number
+        self.connections = [connection for _, connection in clients]
+        self.players: list[Player] = [
+            RemotePlayer(name, connection, self.notifier_factory(connection))
+            for name, connection in clients
+        ]
+        self.players += [
+            GreedyPlayer(f"Computer {i + 1}", self.notifier_factory())
+            for i in range(num_computers)
+        ]
+        self.game = CrazyEightsGame(self.players, rng, metrics_sink=metrics_sink)
+
+    def __repr__(self) -> str:
+        return f"<Table {self.number}: {', '.join(p.name for p in self.players)}>"
+
+    def notifier_factory(self, connection: Optional[Connection] = None):
+        return functools.partial(TableNotifier, table=self, connection=connection)
+
+    def write(self, text: str) -> None:
+        """Send `text` to all clients at the table."""
+        for connection in self.connections:
+            connection.write(text)
+
+    def broadcast(self, message: str, exclude: Optional[Connection] = None) -> None:
+        """Send a line to all clients at the table, except `exclude`."""
+        for connection in self.connections:
+            if connection is not exclude:
+                print(message, file=connection)
+
+    async def play(self) -> GameResult:
+        """Play the game, send the result to the clients and disconnect them."""
+        try:
+            names = ", ".join(player.name for player in self.players)
+            self.broadcast(f"Table {self.number + 1}: {names}")
+            result = await play_game(self.game)
+            self.game.print_result(result, file=self)
+            return result
+        finally:
+            await asyncio.gather(*(c.close() for c in self.connections))
+
+
+class GameServer:
+    """A server that hosts any number of concurrent tables.
+
+    Each table has `num_humans` remote players and `num_computers` greedy players.
+    Clients have `timeout` seconds for each decision. If `seed` is non-negative,
+    the deck of table `i` is shuffled with `game_seed(seed, i)`. The metrics of
+    all games are passed to `metrics_sink`, if given."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        num_humans: int = 1,
+        num_computers: int = 1,
+        timeout: float = 60.0,
+        seed: int = -1,
+        metrics_sink: Optional[MetricsSink] = None,
+    ):
+        if num_humans < 1:
+            raise ValueError("Each table needs at least one human player.")
+        if num_humans + num_computers < 2:
+            raise ValueError("Must have at least two players to play.")
+        self.host = host
+        self.port = port
+        self.num_humans = num_humans
+        self.num_computers = num_computers
+        self.timeout = timeout
+        self.seed = seed
+        self.metrics_sink = metrics_sink
+        self.server: Optional[asyncio.Server] = None
+        self.waiting: list[tuple[str, Connection]] = []
+        self.tables: set[asyncio.Task] = set()
+        self.num_tables = 0
+        self.result_counts = {result: 0 for result in GameResult}
+
+    def __repr__(self) -> str:
+        return f"<GameServer on {self.host}:{self.port}, {len(self.tables)} tables>"
+
+    async def start(self) -> None:
+        """Start accepting clients.
+
+        If the server was created with port 0, `port` is set to the port that the
+        operating system picked."""
+        self.server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, backlog=BACKLOG
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+        await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting clients and wait for the running tables to finish."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.tables:
+            await asyncio.wait(self.tables)
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = Connection(reader, writer, self.timeout)
+        name = await connection.prompt("Welcome to Crazy Eights! Your name: ")
+        if not connection.connected:
+            await connection.close()
+            return
+        self.waiting.append((name or f"Player {len(self.waiting) + 1}", connection))
+        if len(self.waiting) < self.num_humans:
+            connection.write("Waiting for other players...\n")
+            return
+        clients, self.waiting = self.waiting, []
+        self.start_table(clients)
+
+    def start_table(self, clients: list[tuple[str, Connection]]) -> Table:
+        rng = random.Random(game_seed(self.seed, self.num_tables))
+        table = Table(
+            self.num_tables,
+            clients,
+            self.num_computers,
+            rng if self.seed >= 0 else None,
+            self.metrics_sink,
+        )
+        self.num_tables += 1
+        task = asyncio.create_task(table.play())
+        self.tables.add(task)
+        task.add_done_callback(self.table_done)
+        return table
+
+    def table_done(self, task: asyncio.Task) -> None:
+        self.tables.discard(task)
+        if task.cancelled():
+            return
+        if (exception := task.exception()) is not None:
+            task.get_loop().call_exception_handler(
+                {"message": "Table failed", "exception": exception, "task": task}
+            )
+        else:
+            self.result_counts[task.result()] += 1
@@ -0,0 +1,487 @@
+"""A binary columnar file format for the outcomes of many games.
+
+A results file starts with a 16-byte header (the magic bytes `C8RESULT`, the format
+version and the number of players), followed by blocks of games. Each block has an
+8-byte header holding the number of games `n` in the block, followed by its
+columns, each of which stores `n` fixed-width little-endian values:
+
+- `seed`: the seed of the game's random number generator (unsigned, 8 bytes),
+- `turns`: the number of turns played (unsigned, 4 bytes),
+- `winner`: the index of the winner, or -1 if no one won (signed, 1 byte),
+- `result`: the index of the `GameResult` in `RESULTS` (unsigned, 1 byte),
+- `hand_0`, `hand_1`, ...: the number of cards left in each player's hand
+  (unsigned, 1 byte each).
+
+Blocks are padded to a multiple of 8 bytes. Writers append whole blocks, so a
+file can be extended at any time, and readers `mmap` the file and access the
+columns of each block without copying or parsing them.
+"""
+
+import array
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+from crazyeights.game import GameResult
+from crazyeights.stats import IntegerStats
+
+MAGIC = b"C8RESULT"
+FORMAT_VERSION = 1
+FILE_HEADER = struct.Struct("<8sHHI")
+BLOCK_HEADER = struct.Struct("<II")
+DEFAULT_BLOCK_SIZE = 65536
+
+RESULTS = list(GameResult)
+# The fixed columns with their `array` type codes; the hand sizes follow.
+FIXED_COLUMNS = {"seed": "Q", "turns": "I", "winner": "b", "result": "B"}
+HAND_TYPECODE = "B"
+
+
+def column_names(num_players: int) -> list[str]:
+    """Return the names of the columns of a file for `num_players` players.
+
+    Examples:
+    >>> column_names(2)
+    ['seed', 'turns', 'winner', 'result', 'hand_0', 'hand_1']
+    """
+    return [*FIXED_COLUMNS, *(f"hand_{i}" for i in range(num_players))]
+
+
+def column_typecodes(num_players: int) -> dict[str, str]:
+    return {
+        **FIXED_COLUMNS,
+        **{f"hand_{i}": HAND_TYPECODE for i in range(num_players)},
+    }
+
+
+def padding(size: int) -> int:
+    return -size % 8
+
+
+class ResultsError(ValueError):
+    """Raised if a file is not a results file or does not match the game."""
+
+
+class ResultsBuffer:
+    """The outcomes of games held in memory, column by column, until they are
+    encoded as a block of a results file.
+
+    Buffers can be filled in worker processes and sent to the process that writes
+    the file; see `crazyeights.tournament.run_tournament`."""
+
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+        self.columns = {
+            name: array.array(typecode)
+            for name, typecode in column_typecodes(num_players).items()
+        }
+
+    def __repr__(self) -> str:
+        return f"<ResultsBuffer: {len(self)} games>"
+
+    def __len__(self) -> int:
+        return len(self.columns["seed"])
+
+    def add_game(
+        self,
+        seed: int,
+        result: GameResult,
+        winner: Optional[int],
+        num_turns: int,
+        cards_left: Sequence[int],
+    ) -> None:
+        columns = self.columns
+        columns["seed"].append(seed)
+        columns["turns"].append(num_turns)
+        columns["winner"].append(-1 if winner is None else winner)
+        columns["result"].append(RESULTS.index(result))
+        for i in range(self.num_players):
+            columns[f"hand_{i}"].append(cards_left[i])
+
+    def clear(self) -> None:
+        for column in self.columns.values():
+            del column[:]
+
+    def to_bytes(self) -> bytes:
+        """Return the games as a block of a results file."""
+        parts = [BLOCK_HEADER.pack(len(self), 0)]
+        for column in self.columns.values():
+            if sys.byteorder == "big" and column.itemsize > 1:
+                column = array.array(column.typecode, column)
+                column.byteswap()
+            parts.append(column.tobytes())
+        data = b"".join(parts)
+        return data + bytes(padding(len(data)))
+
+
+class ResultsWriter:
+    """Appends the outcomes of games to a results file.
+
+    Games are buffered and written in blocks of `block_size` games; call `close`
+    (or use the writer as a context manager) to write the last block."""
+
+    def __init__(
+        self, path: str, num_players: int, block_size: int = DEFAULT_BLOCK_SIZE
+    ):
+        self.path = path
+        self.num_players = num_players
+        self.block_size = block_size
+        self.buffer = ResultsBuffer(num_players)
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(FILE_HEADER.pack(MAGIC, FORMAT_VERSION, num_players, 0))
+        elif read_header(path) != num_players:
+            self.file.close()
+            raise ResultsError(f"{path} holds games with a different player count.")
+
+    def __repr__(self) -> str:
+        return f"<ResultsWriter: {self.path}>"
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add_game(
+        self,
+        seed: int,
+        result: GameResult,
+        winner: Optional[int],
+        num_turns: int,
+        cards_left: Sequence[int],
+    ) -> None:
+        self.buffer.add_game(seed, result, winner, num_turns, cards_left)
+        if len(self.buffer) >= self.block_size:
+            self.flush()
+
+    def add_buffer(self, buffer: ResultsBuffer) -> None:
+        """Write the games in `buffer` (after any games added before)."""
+        if buffer.num_players != self.num_players:
+            raise ResultsError("The buffer holds games with a different player count.")
+        self.flush()
+        if len(buffer):
+            self.file.write(buffer.to_bytes())
+
+    def flush(self) -> None:
+        if len(self.buffer):
+            self.file.write(self.buffer.to_bytes())
+            self.buffer.clear()
+        self.file.flush()
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def read_header(path: str) -> int:
+    """Return the number of players of a results file."""
+    with open(path, "rb") as file:
+        header = file.read(FILE_HEADER.size)
+    if len(header) < FILE_HEADER.size:
+        raise ResultsError(f"{path} is not a results file.")
+    magic, version, num_players, _ = FILE_HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ResultsError(f"{path} is not a results file.")
+    return num_players
+
+
+Filter = Any
+"""A condition on a column: a value, a collection of values (e.g., a `range`), or
+a function that returns True for the values to keep."""
+
+
+def value_test(value: Filter) -> Callable[[Any], bool]:
+    if callable(value):
+        return value
+    if isinstance(value, (range, set, frozenset, list, tuple)):
+        return value.__contains__
+    return value.__eq__
+
+
+def value_mask(values, value: Filter):
+    """Return a boolean NumPy array that is True for the `values` (a NumPy array)
+    that match the filter. Functions are called with one value at a time."""
+    import numpy as np
+
+    if callable(value):
+        return np.fromiter(map(value, values.tolist()), bool, len(values))
+    if isinstance(value, range) and value.step == 1:
+        return (values >= value.start) & (values < value.stop)
+    if isinstance(value, (range, set, frozenset, list, tuple)):
+        return np.isin(values, list(value))
+    return values == value
+
+
+def integer_stats(values) -> IntegerStats:
+    """Return the exact statistics of a NumPy array of integers.
+
+    The sums are computed in 64-bit integers if they cannot overflow, and with
+    Python integers otherwise, e.g., for the seeds."""
+    import numpy as np
+
+    stats = IntegerStats()
+    if not len(values):
+        return stats
+    stats.count = len(values)
+    stats.min, stats.max = int(values.min()), int(values.max())
+    if max(-stats.min, stats.max) ** 2 * len(values) < 2**63:
+        values = values.astype(np.int64)
+        stats.total, stats.total_squares = int(values.sum()), int(values @ values)
+    else:
+        values = values.tolist()
+        stats.total = sum(values)
+        stats.total_squares = sum(value * value for value in values)
+    return stats
+
+
+def import_numpy():
+    """Return the `numpy` module, or None if NumPy is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class ResultsStore:
+    """Read access to a results file through `mmap`.
+
+    The columns of each block are exposed as `memoryview`s of the mapped file, so
+    the operating system loads only the pages that are accessed. The query methods
+    filter games with `where`, a dict that maps column names to conditions (see
+    `Filter`), and visit one block at a time. If NumPy is installed, `count`,
+    `stats` and `value_counts` work on NumPy views of the blocks instead of
+    visiting the games one by one in Python; set `use_numpy` to False to use the
+    pure-Python implementation.
+
+    Examples:
+    >>> import tempfile, os
+    >>> path = os.path.join(tempfile.mkdtemp(), "results.c8r")
+    >>> with ResultsWriter(path, num_players=2) as writer:
+    ...     writer.add_game(1, GameResult.CURRENT_PLAYER_WON, 0, 30, (0, 4))
+    ...     writer.add_game(2, GameResult.CURRENT_PLAYER_WON, 1, 41, (2, 0))
+    ...     writer.add_game(3, GameResult.NO_PLAYABLE_CARDS, None, 80, (3, 5))
+    >>> with ResultsStore(path) as store:
+    ...     print(len(store), store.count(where={"winner": 0}))
+    ...     print(store.value_counts("winner"))
+    ...     print(store.stats("turns", where={"result": GameResult.CURRENT_PLAYER_WON}).mean)
+    ...     print(list(store.select(["seed", "hand_1"], where={"turns": range(40, 100)})))
+    3 1
+    {None: 1, 0: 1, 1: 1}
+    35.5
+    [(2, 0), (3, 5)]
+    """
+
+    use_numpy = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self.num_players = read_header(path)
+        self.columns = column_typecodes(self.num_players)
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size > FILE_HEADER.size:
+                self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.map = None
+        self.blocks = self.index_blocks()
+
+    def __repr__(self) -> str:
+        return f"<ResultsStore: {self.path}, {len(self)} games>"
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(num_games for _, num_games in self.blocks)
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def block_size(self, num_games: int) -> int:
+        size = BLOCK_HEADER.size + num_games * sum(
+            array.array(typecode).itemsize for typecode in self.columns.values()
+        )
+        return size + padding(size)
+
+    def index_blocks(self) -> list[tuple[int, int]]:
+        """Return the offset and number of games of each complete block."""
+        blocks = []
+        if self.map is None:
+            return blocks
+        offset = FILE_HEADER.size
+        while offset + BLOCK_HEADER.size <= len(self.map):
+            num_games, _ = BLOCK_HEADER.unpack_from(self.map, offset)
+            size = self.block_size(num_games)
+            if offset + size > len(self.map):
+                # An incomplete block at the end, e.g., from a writer that crashed.
+                break
+            blocks.append((offset, num_games))
+            offset += size
+        return blocks
+
+    def iter_blocks(
+        self, columns: Optional[Iterable[str]] = None
+    ) -> Iterator[dict[str, Sequence[int]]]:
+        """Yield the requested columns (by default all) of each block.
+
+        The columns are `memoryview`s of the mapped file; on big-endian machines
+        they are converted into arrays."""
+        wanted = set(self.columns if columns is None else columns)
+        unknown = wanted - set(self.columns)
+        if unknown:
+            raise ResultsError(f"Unknown columns: {', '.join(sorted(unknown))}")
+        view = memoryview(self.map) if self.map is not None else None
+        for block_offset, num_games in self.blocks:
+            offset = block_offset + BLOCK_HEADER.size
+            block = {}
+            for name, typecode in self.columns.items():
+                itemsize = array.array(typecode).itemsize
+                size = num_games * itemsize
+                if name in wanted:
+                    column = view[offset : offset + size].cast(typecode)
+                    if sys.byteorder == "big" and itemsize > 1:
+                        column = array.array(typecode, column)
+                        column.byteswap()
+                    block[name] = column
+                offset += size
+            yield block
+
+    def iter_numpy_blocks(self, columns: Optional[Iterable[str]] = None):
+        """Yield the requested columns of each block as NumPy arrays that share the
+        memory of the mapped file. Requires NumPy."""
+        import numpy as np
+
+        for block in self.iter_blocks(columns):
+            yield {name: np.asarray(column) for name, column in block.items()}
+
+    def encode(self, column: str, value: Filter) -> Filter:
+        """Translate a filter value into the encoding of the column."""
+        if column == "result" and isinstance(value, GameResult):
+            return RESULTS.index(value)
+        if column == "winner" and value is None:
+            return -1
+        return value
+
+    @staticmethod
+    def decode(column: str, value: int):
+        if column == "result":
+            return RESULTS[value]
+        if column == "winner" and value < 0:
+            return None
+        return value
+
+    def select(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[dict[str, Filter]] = None,
+    ) -> Iterator[tuple]:
+        """Yield the values of `columns` (by default all) of the games that match
+        `where`."""
+        columns = list(self.columns if columns is None else columns)
+        where = where or {}
+        tests = {name: value_test(self.encode(name, v)) for name, v in where.items()}
+        for block in self.iter_blocks({*columns, *tests}):
+            rows = zip(*(block[name] for name in columns))
+            if tests:
+                mask = self.matching_rows(block, tests)
+                rows = (row for row, keep in zip(rows, mask) if keep)
+            for row in rows:
+                yield tuple(self.decode(name, v) for name, v in zip(columns, row))
+
+    @staticmethod
+    def matching_rows(block, tests) -> Iterator[bool]:
+        masks = [map(test, block[name]) for name, test in tests.items()]
+        return masks[0] if len(masks) == 1 else map(all, zip(*masks))
+
+    def values(
+        self, column: str, where: Optional[dict[str, Filter]] = None
+    ) -> Iterator[int]:
+        """Yield the encoded values of one column of the games that match `where`."""
+        where = where or {}
+        tests = {name: value_test(self.encode(name, v)) for name, v in where.items()}
+        for block in self.iter_blocks({column, *tests}):
+            if not tests:
+                yield from block[column]
+            else:
+                mask = self.matching_rows(block, tests)
+                yield from (v for v, keep in zip(block[column], mask) if keep)
+
+    def numpy_masks(self, columns: Iterable[str], where: dict[str, Filter]):
+        """Yield the requested columns of each block as NumPy arrays, together with
+        a boolean array that is True for the games that match `where` (None if
+        `where` is empty). Requires NumPy."""
+        where = {name: self.encode(name, v) for name, v in where.items()}
+        for block in self.iter_numpy_blocks({*columns, *where}):
+            mask = None
+            for name, value in where.items():
+                column_mask = value_mask(block[name], value)
+                mask = column_mask if mask is None else mask & column_mask
+            yield block, mask
+
+    def numpy_values(self, column: str, where: Optional[dict[str, Filter]] = None):
+        """Yield the encoded values of one column of the games that match `where`
+        as a NumPy array per block. Requires NumPy."""
+        for block, mask in self.numpy_masks([column], where or {}):
+            yield block[column] if mask is None else block[column][mask]
+
+    def count(self, where: Optional[dict[str, Filter]] = None) -> int:
+        """Return the number of games that match `where`."""
+        if not where:
+            return len(self)
+        if self.use_numpy and (np := import_numpy()) is not None:
+            return sum(
+                int(np.count_nonzero(mask)) for _, mask in self.numpy_masks([], where)
+            )
+        return sum(1 for _ in self.values("seed", where))
+
+    def stats(
+        self, column: str, where: Optional[dict[str, Filter]] = None
+    ) -> IntegerStats:
+        """Return count, mean, variance, minimum and maximum of a column."""
+        stats = IntegerStats()
+        if self.use_numpy and import_numpy() is not None:
+            for values in self.numpy_values(column, where):
+                stats.merge(integer_stats(values))
+        else:
+            for value in self.values(column, where):
+                stats.add(value)
+        return stats
+
+    def value_counts(
+        self, column: str, where: Optional[dict[str, Filter]] = None
+    ) -> dict:
+        """Return how often each value of a column occurs in the matching games."""
+        counts: dict[int, int] = {}
+        if self.use_numpy and (np := import_numpy()) is not None:
+            for values in self.numpy_values(column, where):
+                if not len(values):
+                    continue
+                low, high = int(values.min()), int(values.max())
+                if high - low < 2**16:
+                    # A small range of values, e.g., a hand size or the winner. The
+                    # offsets are computed in the column's type, which may be
+                    # unsigned 64-bit.
+                    if values.dtype.kind == "i":
+                        values = values.astype(np.int64)
+                    offsets = (values - values.min()).astype(np.intp)
+                    block_counts = np.bincount(offsets)
+                    pairs = zip(range(low, high + 1), block_counts.tolist())
+                else:
+                    unique, block_counts = np.unique(values, return_counts=True)
+                    pairs = zip(unique.tolist(), block_counts.tolist())
+                for value, n in pairs:
+                    if n:
+                        counts[value] = counts.get(value, 0) + n
+        else:
+            for value in self.values(column, where):
+                counts[value] = counts.get(value, 0) + 1
+        return {self.decode(column, v): n for v, n in sorted(counts.items())}
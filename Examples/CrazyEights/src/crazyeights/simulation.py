@@ -0,0 +1,341 @@
+import functools
+import hashlib
+import io
+import random
+import time
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, TextIO
+
+from crazyeights.ai.notifier import ComputerPlayerNotifier
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.game import CrazyEightsGame, GameResult
+from crazyeights.notifier import NullNotifier
+from crazyeights.stats import Histogram, IntegerStats
+
+if TYPE_CHECKING:
+    from crazyeights.results import ResultsBuffer, ResultsWriter
+
+
+class SimulationStats:
+    """Aggregated results of a number of simulated games.
+
+    The games are added one at a time and only counts, exact integer sums and
+    histograms are stored, so the memory needed is independent of the number of
+    games. Statistics collected in different processes can be merged; the result
+    does not depend on how the games were split up or in which order the parts
+    are merged.
+
+    Examples:
+    >>> stats = SimulationStats(2)
+    >>> stats.add_game(GameResult.CURRENT_PLAYER_WON, 1, 20, (5, 0))
+    >>> stats.add_game(GameResult.NO_PLAYABLE_CARDS, None, 40, (3, 4))
+    >>> stats.num_games
+    2
+    >>> stats.win_rates
+    [0.0, 0.5]
+    >>> stats.mean_turns
+    30.0
+    >>> stats.mean_cards_left
+    [4.0, 2.0]
+    """
+
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+        self.num_games = 0
+        self.result_counts = {result: 0 for result in GameResult}
+        self.wins = [0] * num_players
+        self.turns = IntegerStats()
+        self.turn_histogram = Histogram(bin_width=10, num_bins=50)
+        self.cards_left = [IntegerStats() for _ in range(num_players)]
+        self.elapsed_time = 0.0
+
+    def __repr__(self) -> str:
+        return f"<SimulationStats for {self.num_games} games>"
+
+    def add_game(
+        self,
+        result: GameResult,
+        winner: Optional[int],
+        num_turns: int,
+        cards_left: Sequence[int] = (),
+    ) -> None:
+        """Add the outcome of a single game to the statistics.
+
+        `cards_left` holds the number of cards left in the hand of each seat at the
+        end of the game; it may be omitted."""
+        self.num_games += 1
+        self.result_counts[result] += 1
+        if winner is not None:
+            self.wins[winner] += 1
+        self.turns.add(num_turns)
+        self.turn_histogram.add(num_turns)
+        for seat_stats, num_cards in zip(self.cards_left, cards_left):
+            seat_stats.add(num_cards)
+
+    def merge(self, other: "SimulationStats") -> None:
+        """Add the statistics of `other` to these statistics."""
+        if other.num_players != self.num_players:
+            raise ValueError("Cannot merge statistics for different player counts.")
+        self.num_games += other.num_games
+        for result, count in other.result_counts.items():
+            self.result_counts[result] += count
+        for seat, wins in enumerate(other.wins):
+            self.wins[seat] += wins
+        self.turns.merge(other.turns)
+        self.turn_histogram.merge(other.turn_histogram)
+        for seat_stats, other_seat_stats in zip(self.cards_left, other.cards_left):
+            seat_stats.merge(other_seat_stats)
+        self.elapsed_time += other.elapsed_time
+
+    def to_dict(self) -> dict:
+        """Return the complete state of the statistics as a JSON-compatible dict."""
+        return {
+            "num_players": self.num_players,
+            "num_games": self.num_games,
+            "result_counts": {
+                result.name: count for result, count in self.result_counts.items()
+            },
+            "wins": list(self.wins),
+            "turns": self.turns.to_dict(),
+            "turn_histogram": self.turn_histogram.to_dict(),
+            "cards_left": [seat_stats.to_dict() for seat_stats in self.cards_left],
+            "elapsed_time": self.elapsed_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimulationStats":
+        """Restore statistics saved with `to_dict`.
+
+        Examples:
+        >>> stats = SimulationStats(2)
+        >>> stats.add_game(GameResult.CURRENT_PLAYER_WON, 0, 31, (0, 6))
+        >>> SimulationStats.from_dict(stats.to_dict()).to_dict() == stats.to_dict()
+        True
+        """
+        stats = cls(data["num_players"])
+        stats.num_games = data["num_games"]
+        stats.result_counts = {
+            GameResult[name]: count for name, count in data["result_counts"].items()
+        }
+        stats.wins = list(data["wins"])
+        stats.turns = IntegerStats.from_dict(data["turns"])
+        stats.turn_histogram = Histogram.from_dict(data["turn_histogram"])
+        stats.cards_left = [IntegerStats.from_dict(d) for d in data["cards_left"]]
+        stats.elapsed_time = data["elapsed_time"]
+        return stats
+
+    @property
+    def win_rates(self) -> list[float]:
+        """Return the fraction of games won by the player in each seat."""
+        if not self.num_games:
+            return [0.0] * self.num_players
+        return [wins / self.num_games for wins in self.wins]
+
+    @property
+    def mean_turns(self) -> float:
+        """Return the mean number of turns per game."""
+        return self.turns.mean
+
+    @property
+    def stdev_turns(self) -> float:
+        """Return the (population) standard deviation of the number of turns."""
+        return self.turns.stdev
+
+    @property
+    def min_turns(self) -> Optional[int]:
+        return self.turns.min
+
+    @property
+    def max_turns(self) -> Optional[int]:
+        return self.turns.max
+
+    def turn_percentiles(self) -> dict[str, Optional[int]]:
+        """Return the median, 90th and 99th percentile of the number of turns, each
+        as the lower bound of its histogram bin."""
+        return {
+            name: self.turn_histogram.quantile(q)
+            for name, q in [("median", 0.5), ("p90", 0.9), ("p99", 0.99)]
+        }
+
+    @property
+    def mean_cards_left(self) -> list[float]:
+        """Return the mean number of cards left in the hand of each seat."""
+        return [seat_stats.mean for seat_stats in self.cards_left]
+
+    @property
+    def games_per_second(self) -> float:
+        """Return the number of games simulated per second."""
+        return self.num_games / self.elapsed_time if self.elapsed_time else 0.0
+
+    def report(self) -> str:
+        """Return a human-readable summary of the statistics."""
+        lines = [f"Games played: {self.num_games}"]
+        for result, count in self.result_counts.items():
+            lines.append(f"  {result}: {count}")
+        for seat, rate in enumerate(self.win_rates):
+            lines.append(f"Seat {seat + 1} win rate: {rate:.2%}")
+        lines.append(
+            f"Turns per game: mean {self.mean_turns:.2f}, "
+            f"stdev {self.stdev_turns:.2f}, "
+            f"min {self.min_turns}, max {self.max_turns}"
+        )
+        if self.num_games:
+            percentiles = ", ".join(
+                f"{name} {self.turn_histogram.bin_label(lower)}"
+                for name, lower in self.turn_percentiles().items()
+            )
+            lines.append(f"Turns per game percentiles: {percentiles}")
+        if any(seat_stats.count for seat_stats in self.cards_left):
+            cards_left = ", ".join(f"{mean:.2f}" for mean in self.mean_cards_left)
+            lines.append(f"Cards left in hand per seat: {cards_left}")
+        lines.append(
+            f"Time: {self.elapsed_time:.2f}s ({self.games_per_second:.0f} games/s)"
+        )
+        return "\n".join(lines)
+
+
+def create_headless_players(
+    num_players: int,
+    log_buffer: Optional[io.StringIO] = None,
+) -> list[GreedyPlayer]:
+    """Create greedy players that do not produce any terminal output.
+
+    If `log_buffer` is given, the players write their output into this shared
+    in-memory buffer instead, which the caller writes out when the game is over."""
+    if log_buffer is None:
+        notifier_factory = NullNotifier
+    else:
+        notifier_factory = functools.partial(ComputerPlayerNotifier, file=log_buffer)
+    return [
+        GreedyPlayer(f"Computer {i + 1}", notifier_factory=notifier_factory)
+        for i in range(num_players)
+    ]
+
+
+GameOutcome = tuple[GameResult, Optional[int], int, tuple[int, ...]]
+"""The result, winner index (or None), number of turns and number of cards left in
+each player's hand of a single game."""
+
+
+def game_seed(master_seed: int, game_index: int) -> int:
+    """Return the seed for the game with the given index in a simulation.
+
+    The seed depends only on the master seed and the index of the game, therefore
+    each game can be played independently of all others, e.g., in a different
+    process, and will always be the same.
+
+    Examples:
+    >>> game_seed(42, 0) == game_seed(42, 0)
+    True
+    >>> game_seed(42, 0) == game_seed(42, 1)
+    False
+    """
+    data = f"{master_seed}:{game_index}".encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def play_headless_game(
+    num_players: int,
+    rng: Optional[random.Random] = None,
+    log_file: Optional[TextIO] = None,
+) -> GameOutcome:
+    """Play a single game between greedy players without any terminal output.
+
+    If `log_file` is given, the game is written to it as it would be printed, with
+    a single write when the game is over.
+    Returns the result of the game, the index of the winner (or None if no one
+    won), the number of turns played and the number of cards left in each hand."""
+    log_buffer = None if log_file is None else io.StringIO()
+    players = create_headless_players(num_players, log_buffer)
+    game = CrazyEightsGame(players, rng)
+    result = game.play()
+    if log_buffer is not None:
+        game.print_result(result, file=log_buffer)
+        log_file.write(log_buffer.getvalue())
+    winner = (
+        game.current_player_index if result == GameResult.CURRENT_PLAYER_WON else None
+    )
+    cards_left = tuple(len(player.hand) for player in game.players)
+    return result, winner, game.num_turns, cards_left
+
+
+def get_engine(engine: str) -> Callable[[int, Optional[random.Random]], GameOutcome]:
+    """Return the function that plays a single game with the given engine.
+
+    The `"object"` engine plays `CrazyEightsGame`s, the `"fast"` engine plays the
+    same games on bitmasks, and the `"numpy"` engine plays them with the vectorized
+    simulator (which requires NumPy)."""
+    if engine == "object":
+        return play_headless_game
+    if engine == "fast":
+        from crazyeights.fast import play_fast_game
+
+        return play_fast_game
+    if engine == "numpy":
+        from crazyeights.vectorized import play_vectorized_game
+
+        return play_vectorized_game
+    raise ValueError(f"Unknown engine: {engine!r}")
+
+
+def play_games(
+    master_seed: int,
+    start: int,
+    stop: int,
+    num_players: int,
+    engine: str,
+    log_file: Optional[TextIO] = None,
+    results: "ResultsBuffer | ResultsWriter | None" = None,
+) -> SimulationStats:
+    """Play the games with indices `start` up to (excluding) `stop`.
+
+    Game `i` is shuffled with its own random number generator seeded with
+    `game_seed(master_seed, i)`. With the `"numpy"` engine all games are played
+    in lockstep. Only the `"object"` engine can write the games to `log_file`.
+    If `results` is given, the outcome of every game is added to it."""
+    play_game = get_engine(engine)
+    if log_file is not None:
+        if engine != "object":
+            raise ValueError("Only the object engine can log games.")
+        play_game = functools.partial(play_headless_game, log_file=log_file)
+    if engine == "numpy":
+        from crazyeights.vectorized import play_games_vectorized
+
+        start_time = time.perf_counter()
+        stats = play_games_vectorized(
+            master_seed, start, stop, num_players, results=results
+        )
+        stats.elapsed_time = time.perf_counter() - start_time
+        return stats
+    stats = SimulationStats(num_players)
+    start_time = time.perf_counter()
+    for game_index in range(start, stop):
+        seed = game_seed(master_seed, game_index)
+        outcome = play_game(num_players, random.Random(seed))
+        stats.add_game(*outcome)
+        if results is not None:
+            results.add_game(seed, *outcome)
+    stats.elapsed_time = time.perf_counter() - start_time
+    return stats
+
+
+def simulate(
+    num_games: int,
+    seed: int = -1,
+    num_players: int = 2,
+    engine: str = "object",
+    log_file: Optional[TextIO] = None,
+    results: "ResultsWriter | None" = None,
+) -> SimulationStats:
+    """Simulate `num_games` games between greedy players.
+
+    If `seed` is non-negative the simulation is reproducible: it always produces
+    the same statistics for the same seed, for every engine and independent of
+    whether the games are played in a single process or by
+    `crazyeights.tournament.run_tournament`. If `log_file` is given, the games
+    are written to it; if `results` is given, the outcomes of the games are
+    written to this results file."""
+    if num_players < 2:
+        raise ValueError("Must have at least two players to play.")
+    if seed < 0:
+        seed = random.randrange(2**32)
+    return play_games(seed, 0, num_games, num_players, engine, log_file, results)
@@ -0,0 +1,185 @@
+"""Online statistics that use constant memory and can be merged.
+
+Both classes can be updated one value at a time and merged with statistics that
+were collected elsewhere, e.g., in other processes, so that arbitrarily long
+simulations can be summarized with a fixed amount of memory. They only store
+integers, so merging them gives exactly the same result in any order and for any
+grouping of the values.
+"""
+
+import math
+from typing import Optional
+
+
+class IntegerStats:
+    """Count, sum, sum of squares, minimum and maximum of a stream of integers.
+
+    The sums are exact Python integers, so statistics merged from any number of
+    parts, in any order, are identical to those of a single stream. The mean and
+    variance are derived from the sums when they are read.
+
+    Examples:
+    >>> stats = IntegerStats()
+    >>> for value in [2, 4, 4, 4]:
+    ...     stats.add(value)
+    >>> other = IntegerStats()
+    >>> for value in [5, 5, 7, 9]:
+    ...     other.add(value)
+    >>> stats.merge(other)
+    >>> stats.count, stats.total, stats.mean, stats.variance, stats.stdev
+    (8, 40, 5.0, 4.0, 2.0)
+    >>> stats.min, stats.max
+    (2, 9)
+    """
+
+    __slots__ = ("count", "total", "total_squares", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.total_squares = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"<IntegerStats: count={self.count}, mean={self.mean:.4g}>"
+
+    def add(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        self.total_squares += value * value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "IntegerStats") -> None:
+        """Add the values summarized by `other` to these statistics."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "total_squares": self.total_squares,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IntegerStats":
+        stats = cls()
+        stats.count, stats.total = data["count"], data["total"]
+        stats.total_squares = data["total_squares"]
+        stats.min, stats.max = data["min"], data["max"]
+        return stats
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """The population variance of the values."""
+        if not self.count:
+            return 0.0
+        # n² times the variance, computed exactly before the single division.
+        return (self.count * self.total_squares - self.total**2) / self.count**2
+
+    @property
+    def sample_variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return (self.count * self.total_squares - self.total**2) / (
+            self.count * (self.count - 1)
+        )
+
+    @property
+    def stdev(self) -> float:
+        """The population standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+
+class Histogram:
+    """Counts of non-negative values in bins of equal width.
+
+    Values of at least `bin_width * num_bins` are counted in a final overflow bin,
+    so the memory needed does not depend on the values.
+
+    Examples:
+    >>> histogram = Histogram(bin_width=10, num_bins=3)
+    >>> for value in [0, 5, 12, 29, 30, 100]:
+    ...     histogram.add(value)
+    >>> histogram.counts
+    [2, 1, 1, 2]
+    >>> histogram.quantile(0.5)
+    20
+    """
+
+    __slots__ = ("bin_width", "counts")
+
+    def __init__(self, bin_width: int = 10, num_bins: int = 50):
+        if bin_width < 1 or num_bins < 1:
+            raise ValueError("Bin width and number of bins must be positive.")
+        self.bin_width = bin_width
+        self.counts = [0] * (num_bins + 1)
+
+    def __repr__(self) -> str:
+        return f"<Histogram: {self.num_bins} bins of width {self.bin_width}>"
+
+    @property
+    def num_bins(self) -> int:
+        """The number of bins, not counting the overflow bin."""
+        return len(self.counts) - 1
+
+    def add(self, value: int, count: int = 1) -> None:
+        self.counts[min(value // self.bin_width, self.num_bins)] += count
+
+    def merge(self, other: "Histogram") -> None:
+        if other.bin_width != self.bin_width or other.num_bins != self.num_bins:
+            raise ValueError("Cannot merge histograms with different bins.")
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+
+    def to_dict(self) -> dict:
+        return {"bin_width": self.bin_width, "counts": list(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Histogram":
+        histogram = cls(data["bin_width"], len(data["counts"]) - 1)
+        histogram.counts = list(data["counts"])
+        return histogram
+
+    def bin_label(self, lower: int) -> str:
+        """Return the range of values counted in the bin starting at `lower`.
+
+        Examples:
+        >>> histogram = Histogram(bin_width=10, num_bins=3)
+        >>> histogram.bin_label(20), histogram.bin_label(30)
+        ('20-29', '30+')
+        """
+        if lower >= self.bin_width * self.num_bins:
+            return f"{lower}+"
+        return f"{lower}-{lower + self.bin_width - 1}"
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Return the lower bound of the bin that contains the `q`-quantile, or None
+        if the histogram is empty."""
+        total = sum(self.counts)
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative > rank or cumulative == total:
+                return i * self.bin_width
+        return None
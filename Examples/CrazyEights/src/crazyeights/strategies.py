@@ -0,0 +1,113 @@
+"""The registry of player strategies.
+
+A strategy is a `Player` subclass (or any callable) that creates a player from
+its name, e.g., `GreedyPlayer`. Strategies are registered as entry points in the
+group `crazyeights.strategies`, so other packages can add their own:
+
+    [project.entry-points."crazyeights.strategies"]
+    cautious = "mypackage.players:CautiousPlayer"
+
+The strategies of this package are always available, even if it is not
+installed. Entry points are only loaded when their strategy is selected.
+
+Strategies may provide batched decisions for engines that play many games at
+once, such as `crazyeights.vectorized`: a classmethod `pick_cards_batch(hands,
+playable, hand_order)` that receives Boolean arrays of shape `(n, 52)` with the
+cards in the hands and the playable cards of `n` players, and an integer array
+of the same shape with the position of each card in its hand (smaller positions
+come first), and returns the index of the card each player plays, or -1; and a
+classmethod `pick_suits_batch(hands)` that returns the index in `SUITS` of the
+suit each player picks after playing a crazy 8. Arrays use the card indices of
+`crazyeights.fast`.
+"""
+
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+    from crazyeights.player import Player
+
+ENTRY_POINT_GROUP = "crazyeights.strategies"
+
+BUILTIN_STRATEGIES = {
+    "greedy": "crazyeights.ai.player:GreedyPlayer",
+    "interactive": "crazyeights.interactive.player:InteractivePlayer",
+    "montecarlo": "crazyeights.ai.player:MonteCarloPlayer",
+}
+
+StrategyFactory = Callable[[str], "Player"]
+
+
+class UnknownStrategyError(LookupError):
+    """Raised if no strategy is registered under a name."""
+
+
+def available_strategies() -> dict[str, "EntryPoint"]:
+    """Return the entry points of all strategies by name, without loading them.
+
+    Installed entry points take precedence over the built-in strategies."""
+    from importlib.metadata import EntryPoint, entry_points
+
+    strategies = {
+        name: EntryPoint(name, value, ENTRY_POINT_GROUP)
+        for name, value in BUILTIN_STRATEGIES.items()
+    }
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        strategies[entry_point.name] = entry_point
+    return strategies
+
+
+def load_strategy(name: str) -> StrategyFactory:
+    """Import and return the strategy registered under `name`.
+
+    Examples:
+    >>> load_strategy("greedy").__name__
+    'GreedyPlayer'
+    >>> load_strategy("reckless")
+    Traceback (most recent call last):
+    ...
+    crazyeights.strategies.UnknownStrategyError: Unknown strategy 'reckless'...
+    """
+    strategies = available_strategies()
+    entry_point = strategies.get(name)
+    if entry_point is None:
+        raise UnknownStrategyError(
+            f"Unknown strategy {name!r}; available: {', '.join(sorted(strategies))}"
+        )
+    return entry_point.load()
+
+
+def parse_player_spec(spec: str) -> tuple[str, str]:
+    """Split a player specification `name:strategy` into name and strategy.
+
+    Examples:
+    >>> parse_player_spec("Alice:greedy")
+    ('Alice', 'greedy')
+    >>> parse_player_spec("Dr. No: interactive")
+    ('Dr. No', 'interactive')
+    """
+    name, separator, strategy = spec.rpartition(":")
+    if not separator or not name.strip() or not strategy.strip():
+        raise ValueError(f"Expected NAME:STRATEGY, got {spec!r}.")
+    return name.strip(), strategy.strip()
+
+
+def create_players(specs: list[tuple[str, str]]) -> list["Player"]:
+    """Create a player for each (name, strategy) pair.
+
+    Each strategy is loaded once, however many players use it."""
+    factories: dict[str, StrategyFactory] = {}
+    players = []
+    for name, strategy in specs:
+        if strategy not in factories:
+            factories[strategy] = load_strategy(strategy)
+        players.append(factories[strategy](name))
+    return players
+
+
+def supports_batches(strategy: StrategyFactory) -> bool:
+    """Return True if the strategy provides batched decisions."""
+    return hasattr(strategy, "pick_cards_batch") and hasattr(
+        strategy, "pick_suits_batch"
+    )
@@ -0,0 +1,316 @@
+import itertools
+import json
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from crazyeights.files import write_atomically
+from crazyeights.results import ResultsBuffer, ResultsWriter
+from crazyeights.simulation import SimulationStats, get_engine, play_games
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_CHECKPOINT_INTERVAL = 60.0
+# Chunks per worker process that are submitted to the pool but not yet merged:
+# enough to keep every worker busy while the results of the oldest chunk are
+# merged, without queuing the whole tournament up front.
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+CHECKPOINT_VERSION = 2
+
+
+def chunk_ranges(num_games: int, chunk_size: int) -> list[tuple[int, int]]:
+    """Split the game indices `0..num_games` into ranges of `chunk_size` games.
+
+    Examples:
+    >>> chunk_ranges(25, 10)
+    [(0, 10), (10, 20), (20, 25)]
+    >>> chunk_ranges(0, 10)
+    []
+    """
+    return [
+        (start, min(start + chunk_size, num_games))
+        for start in range(0, num_games, chunk_size)
+    ]
+
+
+class CheckpointError(ValueError):
+    """Raised if a checkpoint cannot be read or belongs to a different tournament."""
+
+
+class TournamentCheckpoint:
+    """The progress of a tournament: its settings, the number of games completed
+    and the merged statistics of these games.
+
+    The games are always completed in order, and game `i` is played with a random
+    number generator seeded with `game_seed(seed, i)`, so the master seed and
+    `games_completed` are the positions of the random number streams: the
+    remaining games can be played as if the tournament had never stopped. If the
+    tournament writes a results file, `results_size` is the size of the file when
+    the checkpoint was written.
+
+    The statistics only hold integer sums, so a resumed tournament may use a
+    different chunk size or number of workers and still comes out the same.
+
+    Examples:
+    >>> checkpoint = TournamentCheckpoint(42, 1000, 3, "fast")
+    >>> checkpoint.games_completed = 200
+    >>> restored = TournamentCheckpoint.from_dict(checkpoint.to_dict())
+    >>> restored.settings() == checkpoint.settings(), restored.games_completed
+    (True, 200)
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        num_games: int,
+        num_players: int,
+        engine: str,
+        games_completed: int = 0,
+        stats: Optional[SimulationStats] = None,
+        results_size: Optional[int] = None,
+    ):
+        self.seed = seed
+        self.num_games = num_games
+        self.num_players = num_players
+        self.engine = engine
+        self.games_completed = games_completed
+        self.stats = SimulationStats(num_players) if stats is None else stats
+        self.results_size = results_size
+
+    def __repr__(self) -> str:
+        return (
+            f"<TournamentCheckpoint: {self.games_completed} of {self.num_games} games>"
+        )
+
+    def settings(self) -> dict:
+        """Return the settings that must be the same when the tournament
+        resumes."""
+        return {
+            "seed": self.seed,
+            "num_games": self.num_games,
+            "num_players": self.num_players,
+            "engine": self.engine,
+        }
+
+    def check_settings(self, **settings) -> None:
+        """Raise `CheckpointError` if `settings` differ from those of the
+        checkpoint."""
+        own_settings = self.settings()
+        for name, value in settings.items():
+            if own_settings[name] != value:
+                raise CheckpointError(
+                    f"The checkpoint is for a tournament with {name} "
+                    f"{own_settings[name]!r}, not {value!r}."
+                )
+
+    def to_dict(self) -> dict:
+        return {
+            "version": CHECKPOINT_VERSION,
+            **self.settings(),
+            "games_completed": self.games_completed,
+            "results_size": self.results_size,
+            "stats": self.stats.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TournamentCheckpoint":
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            raise CheckpointError("Unsupported checkpoint version.")
+        try:
+            return cls(
+                data["seed"],
+                data["num_games"],
+                data["num_players"],
+                data["engine"],
+                data["games_completed"],
+                SimulationStats.from_dict(data["stats"]),
+                data["results_size"],
+            )
+        except (KeyError, TypeError) as error:
+            raise CheckpointError(f"Malformed checkpoint: {error!r}") from error
+
+    def save(self, path: str) -> None:
+        """Write the checkpoint to `path`, atomically replacing any previous one,
+        so that `path` always holds a complete checkpoint."""
+        write_atomically(path, json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: str) -> "TournamentCheckpoint":
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError as error:
+            raise CheckpointError(f"{path} is not a checkpoint.") from error
+        return cls.from_dict(data)
+
+
+def play_chunk(
+    master_seed: int,
+    start: int,
+    stop: int,
+    num_players: int,
+    engine: str,
+    keep_results: bool = False,
+) -> tuple[SimulationStats, Optional[ResultsBuffer]]:
+    """Play a chunk of games in a worker process.
+
+    Returns the statistics of the games and, if `keep_results` is True, a buffer
+    with the outcomes of the games for the results file."""
+    results = ResultsBuffer(num_players) if keep_results else None
+    stats = play_games(master_seed, start, stop, num_players, engine, results=results)
+    return stats, results
+
+
+def run_tournament(
+    num_games: int,
+    seed: int = -1,
+    num_players: int = 2,
+    engine: str = "object",
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    results_path: Optional[str] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+) -> SimulationStats:
+    """Play `num_games` games between greedy players in a pool of processes.
+
+    The games are split into chunks of `chunk_size` games that are handed out to
+    `workers` processes (by default one per CPU); at most
+    `CHUNKS_IN_FLIGHT_PER_WORKER` chunks per worker are submitted at a time. Every game uses its own random
+    number generator derived from `seed` and the index of the game, and the
+    statistics are exact integer sums. Therefore, the statistics are the same as
+    those of `simulate` with the same seed, independent of the number of workers
+    and the chunk size. Only `elapsed_time` is measured for the whole tournament.
+
+    If `results_path` is given, the outcomes of the games are appended to this
+    results file (see `crazyeights.results`), one block per chunk. The file is the
+    same for any number of workers.
+
+    If `checkpoint_path` is given, a `TournamentCheckpoint` is written to it before
+    the first chunk, after the chunk that completes every `checkpoint_interval`
+    seconds, and at the end. Each checkpoint is written before the next chunk is
+    submitted, so at most the chunks of the submission window are played past the
+    last checkpoint.
+    If the file exists, the tournament resumes from it (with its seed if `seed` is
+    negative): the results file is truncated to its size at the checkpoint, and
+    the statistics are identical to those of an uninterrupted tournament."""
+    if num_players < 2:
+        raise ValueError("Must have at least two players to play.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    get_engine(engine)
+    checkpoint = None
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        checkpoint = TournamentCheckpoint.load(checkpoint_path)
+        if seed < 0:
+            seed = checkpoint.seed
+        checkpoint.check_settings(
+            seed=seed,
+            num_games=num_games,
+            num_players=num_players,
+            engine=engine,
+        )
+        if (results_path is None) != (checkpoint.results_size is None):
+            raise CheckpointError(
+                "A results file must be written if and only if the checkpointed "
+                "tournament wrote one."
+            )
+    if seed < 0:
+        seed = random.randrange(2**32)
+    if checkpoint is None:
+        checkpoint = TournamentCheckpoint(seed, num_games, num_players, engine)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    done = checkpoint.games_completed
+    ranges = [
+        (done + start, done + stop)
+        for start, stop in chunk_ranges(num_games - done, chunk_size)
+    ]
+
+    keep_results = results_path is not None
+    if keep_results and checkpoint.results_size is not None:
+        # Drop the games written after the checkpoint; they are played again.
+        if not os.path.exists(results_path):
+            raise CheckpointError(f"The results file {results_path} is missing.")
+        os.truncate(results_path, checkpoint.results_size)
+    writer = ResultsWriter(results_path, num_players) if keep_results else None
+
+    stats = checkpoint.stats
+    previous_time = stats.elapsed_time
+    start_time = last_save_time = time.perf_counter()
+
+    def save_checkpoint() -> None:
+        stats.elapsed_time = previous_time + time.perf_counter() - start_time
+        if writer is not None:
+            writer.flush()
+            os.fsync(writer.file.fileno())
+            checkpoint.results_size = writer.file.tell()
+        checkpoint.save(checkpoint_path)
+
+    def add_chunk(
+        stop: int, chunk: tuple[SimulationStats, Optional[ResultsBuffer]]
+    ) -> None:
+        nonlocal last_save_time
+        chunk_stats, results = chunk
+        stats.merge(chunk_stats)
+        if writer is not None:
+            writer.add_buffer(results)
+        checkpoint.games_completed = stop
+        if (
+            checkpoint_path is not None
+            and time.perf_counter() - last_save_time >= checkpoint_interval
+        ):
+            save_checkpoint()
+            last_save_time = time.perf_counter()
+
+    try:
+        if checkpoint_path is not None:
+            # Record the seed and the size of the results file before any game is
+            # played, so that even an interruption in the first chunk can resume.
+            save_checkpoint()
+        if workers == 1:
+            for start, stop in ranges:
+                add_chunk(
+                    stop,
+                    play_chunk(seed, start, stop, num_players, engine, keep_results),
+                )
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = iter(ranges)
+                in_flight = deque()
+
+                def submit(num_chunks: int) -> None:
+                    for start, stop in itertools.islice(chunks, num_chunks):
+                        future = executor.submit(
+                            play_chunk,
+                            seed,
+                            start,
+                            stop,
+                            num_players,
+                            engine,
+                            keep_results,
+                        )
+                        in_flight.append((stop, future))
+
+                try:
+                    submit(CHUNKS_IN_FLIGHT_PER_WORKER * workers)
+                    while in_flight:
+                        stop, future = in_flight.popleft()
+                        # Merge (and maybe checkpoint) a chunk before the next
+                        # one is dispatched, so that an interruption only loses
+                        # the chunks in the window.
+                        add_chunk(stop, future.result())
+                        submit(1)
+                except BaseException:
+                    # Do not wait for the chunks that have not started yet.
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        if checkpoint_path is not None:
+            save_checkpoint()
+    finally:
+        if writer is not None:
+            writer.close()
+    stats.elapsed_time = previous_time + time.perf_counter() - start_time
+    return stats
@@ -0,0 +1,333 @@
+"""A simulator that plays many games between greedy players in lockstep.
+
+The state of all games is stored in NumPy arrays, and every call to `step` plays
+one turn in each game that is still running. Cards use the indices of
+`crazyeights.fast`. For decks shuffled in the same way the simulator plays exactly
+the same games as `CrazyEightsGame` with `GreedyPlayer`s.
+
+This module requires NumPy, which can be installed with the `numpy` extra.
+"""
+
+import random
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import numpy as np
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.fast import (
+    DECK_ORDER,
+    EIGHT,
+    HAND_SIZE,
+    MATCH_MASKS,
+    NUM_CARDS,
+    NUM_SUITS,
+)
+from crazyeights.game import GameResult
+from crazyeights.simulation import SimulationStats, game_seed
+from crazyeights.strategies import StrategyFactory, supports_batches
+
+if TYPE_CHECKING:
+    from crazyeights.results import ResultsBuffer, ResultsWriter
+
+DEFAULT_BATCH_SIZE = 100_000
+
+# `MATCH[i, j]` is True if card j can be played on card i.
+MATCH = np.array(
+    [[mask >> card & 1 for card in range(NUM_CARDS)] for mask in MATCH_MASKS],
+    dtype=bool,
+)
+RANK_OF = np.arange(NUM_CARDS) // NUM_SUITS
+
+RUNNING = 0
+RESULT_CODES = [None, GameResult.CURRENT_PLAYER_WON, GameResult.NO_PLAYABLE_CARDS]
+WON = RESULT_CODES.index(GameResult.CURRENT_PLAYER_WON)
+NO_PLAYABLE_CARDS = RESULT_CODES.index(GameResult.NO_PLAYABLE_CARDS)
+
+
+def shuffled_decks(seeds) -> np.ndarray:
+    """Return one deck per seed, shuffled like `Deck` shuffles its cards.
+
+    Each deck is shuffled with a `random.Random` seeded with the corresponding seed,
+    so the games are the same as those played by the object-based engines."""
+    decks = np.empty((len(seeds), NUM_CARDS), dtype=np.int8)
+    for row, seed in enumerate(seeds):
+        deck = DECK_ORDER.copy()
+        random.Random(seed).shuffle(deck)
+        decks[row] = deck
+    return decks
+
+
+def random_decks(num_games: int, generator: np.random.Generator) -> np.ndarray:
+    """Return `num_games` decks shuffled with a NumPy random number generator.
+
+    This is much faster than `shuffled_decks`, but the games differ from those of
+    the object-based engines for the same seed."""
+    return generator.random((num_games, NUM_CARDS)).argsort(axis=1).astype(np.int8)
+
+
+class VectorizedGames:
+    """The state of many games between greedy players, stored in arrays.
+
+    Cards are drawn from the end of each row of `decks`; `deck_sizes` holds the
+    number of cards remaining in each deck. Hands are stored as a boolean matrix
+    with one row per player and game (row `game * num_players + player`) and one
+    column per card. As in `FastCrazyEightsGame`, the top of the discard pile is
+    the 8 of the picked suit after a crazy 8 was played.
+
+    All players use `strategy` (by default `GreedyPlayer`), which must provide
+    batched decisions as described in `crazyeights.strategies`."""
+
+    def __init__(
+        self,
+        decks: np.ndarray,
+        num_players: int,
+        strategy: Optional[StrategyFactory] = None,
+    ):
+        if num_players < 2:
+            raise ValueError("Must have at least two players to play.")
+        if strategy is None:
+            strategy = GreedyPlayer
+        if not supports_batches(strategy):
+            raise ValueError(f"{strategy!r} does not provide batched decisions.")
+        self.strategy = strategy
+        num_games = len(decks)
+        self.num_games = num_games
+        self.num_players = num_players
+        self.decks = np.empty((num_games, NUM_CARDS), dtype=np.int8)
+        self.hand_order = np.empty((num_games, NUM_CARDS), dtype=np.int64)
+        self.deck_sizes = np.empty(num_games, dtype=np.int64)
+        self.hands = np.empty((num_games * num_players, NUM_CARDS), dtype=bool)
+        self.tops = np.empty(num_games, dtype=np.int64)
+        self.current_players = np.empty(num_games, dtype=np.int64)
+        self.num_turns = np.empty(num_games, dtype=np.int64)
+        self.num_players_skipped = np.empty(num_games, dtype=np.int64)
+        self.results = np.empty(num_games, dtype=np.int8)
+        self.winners = np.empty(num_games, dtype=np.int64)
+        self.deal(np.arange(num_games), decks)
+
+    def __repr__(self) -> str:
+        return f"<VectorizedGames: {self.num_games} games, {self.num_live} running>"
+
+    def deal(self, games: np.ndarray, decks: np.ndarray) -> None:
+        """Start new games with `decks` in place of `games`."""
+        self.decks[games] = decks
+        # Cards are added to the end of a hand when they are drawn, so the order of
+        # the cards in a hand is the order of the deck, from its end.
+        positions = np.empty((len(games), NUM_CARDS), dtype=np.int64)
+        np.put_along_axis(
+            positions, self.decks[games].astype(np.int64), np.arange(NUM_CARDS), axis=1
+        )
+        self.hand_order[games] = NUM_CARDS - 1 - positions
+        self.deck_sizes[games] = NUM_CARDS
+        rows = (games[:, None] * self.num_players + np.arange(self.num_players)).ravel()
+        self.hands[rows] = False
+        self.current_players[games] = 0
+        self.num_turns[games] = 0
+        self.num_players_skipped[games] = 0
+        self.results[games] = RUNNING
+        self.winners[games] = -1
+
+        self.tops[games] = self.draw(games)
+        for player in range(self.num_players):
+            for _ in range(HAND_SIZE):
+                self.draw_into_hands(games, np.full(len(games), player))
+
+    @property
+    def live(self) -> np.ndarray:
+        """Return a boolean mask of the games that are still running."""
+        return self.results == RUNNING
+
+    @property
+    def num_live(self) -> int:
+        return int(np.count_nonzero(self.live))
+
+    def draw(self, games: np.ndarray) -> np.ndarray:
+        """Draw a card from the decks of `games`, which must not be empty."""
+        self.deck_sizes[games] -= 1
+        return self.decks[games, self.deck_sizes[games]].astype(np.int64)
+
+    def draw_into_hands(self, games: np.ndarray, players: np.ndarray) -> None:
+        """Let `players` draw a card in `games` if their deck is not empty."""
+        has_cards = self.deck_sizes[games] > 0
+        games = games[has_cards]
+        cards = self.draw(games)
+        self.hands[games * self.num_players + players[has_cards], cards] = True
+
+    def pick_cards(
+        self, games: np.ndarray, rows: np.ndarray, playable: np.ndarray
+    ) -> np.ndarray:
+        """Return the cards the strategy plays from the `playable` cards of the
+        hands in `rows`."""
+        return self.strategy.pick_cards_batch(
+            self.hands[rows], playable, self.hand_order[games]
+        )
+
+    def pick_suits(self, hands: np.ndarray) -> np.ndarray:
+        """Return the suits the strategy picks for `hands` after a crazy 8."""
+        return self.strategy.pick_suits_batch(hands)
+
+    def step(self, games: Optional[np.ndarray] = None) -> None:
+        """Play one turn in `games`, by default in every game that is still
+        running."""
+        if games is None:
+            games = np.flatnonzero(self.live)
+        players = self.current_players[games]
+        rows = games * self.num_players + players
+        match = MATCH[self.tops[games]]
+        playable = self.hands[rows] & match
+
+        must_draw = ~playable.any(axis=1)
+        failed = self.draw_for_turn(games, rows, must_draw, match, playable)
+
+        playing = np.flatnonzero(playable.any(axis=1))
+        if len(playing):
+            play_rows = rows[playing]
+            cards = self.pick_cards(games[playing], play_rows, playable[playing])
+            self.play_cards(games[playing], play_rows, cards)
+        self.end_turns(games, players, rows, failed)
+
+    def draw_for_turn(
+        self,
+        games: np.ndarray,
+        rows: np.ndarray,
+        must_draw: np.ndarray,
+        match: np.ndarray,
+        playable: np.ndarray,
+    ) -> np.ndarray:
+        """Let the players in `rows` who `must_draw` draw a card and add it to
+        their `playable` cards if it matches. Returns a mask of the players who
+        could not draw."""
+        can_draw = must_draw & (self.deck_sizes[games] > 0)
+        drawing = np.flatnonzero(can_draw)
+        if len(drawing):
+            cards = self.draw(games[drawing])
+            self.hands[rows[drawing], cards] = True
+            playable[drawing, cards] = match[drawing, cards]
+        return must_draw & ~can_draw
+
+    def play_cards(
+        self,
+        games: np.ndarray,
+        rows: np.ndarray,
+        cards: np.ndarray,
+        suits: Optional[np.ndarray] = None,
+    ) -> None:
+        """Play `cards` from the hands in `rows`. For crazy 8s the players pick
+        `suits`; where no suit is given (or it is -1) the strategy picks it."""
+        self.hands[rows, cards] = False
+        tops = cards.copy()
+        eights = RANK_OF[cards] == EIGHT
+        if eights.any():
+            if suits is None:
+                picked = self.pick_suits(self.hands[rows[eights]])
+            else:
+                picked = suits[eights]
+                by_strategy = picked < 0
+                if by_strategy.any():
+                    picked[by_strategy] = self.pick_suits(
+                        self.hands[rows[eights][by_strategy]]
+                    )
+            tops[eights] = EIGHT * NUM_SUITS + picked
+        self.tops[games] = tops
+
+    def end_turns(
+        self,
+        games: np.ndarray,
+        players: np.ndarray,
+        rows: np.ndarray,
+        failed: np.ndarray,
+    ) -> None:
+        """Finish the turns of `players` in `games`, of which those in `failed`
+        could neither play nor draw, and move on to the next players."""
+        self.num_turns[games] += 1
+        skipped = np.where(failed, self.num_players_skipped[games] + 1, 0)
+        self.num_players_skipped[games] = skipped
+
+        no_playable_cards = skipped == self.num_players
+        won = ~no_playable_cards & ~self.hands[rows].any(axis=1)
+        self.results[games[no_playable_cards]] = NO_PLAYABLE_CARDS
+        self.results[games[won]] = WON
+        self.winners[games[won]] = players[won]
+        running = ~(no_playable_cards | won)
+        self.current_players[games[running]] = (players[running] + 1) % (
+            self.num_players
+        )
+
+    def play(self) -> None:
+        """Play all games to the end."""
+        while self.live.any():
+            self.step()
+
+    def cards_left(self) -> np.ndarray:
+        """Return the number of cards in each hand, one row per game."""
+        return self.hands.reshape(self.num_games, self.num_players, -1).sum(axis=2)
+
+    def add_results_to(
+        self,
+        stats: SimulationStats,
+        results_file: "ResultsBuffer | ResultsWriter | None" = None,
+        seeds: Sequence[int] = (),
+    ) -> None:
+        """Add the results of all finished games to `stats`.
+
+        If `results_file` is given, the outcomes are also added to it, together with
+        the `seeds` the decks were shuffled with (one per game)."""
+        finished = ~self.live
+        results = self.results[finished].tolist()
+        winners = self.winners[finished].tolist()
+        num_turns = self.num_turns[finished].tolist()
+        cards_left = self.cards_left()[finished].tolist()
+        finished_seeds = [s for s, done in zip(seeds, finished.tolist()) if done]
+        for i, (result, winner, turns, cards) in enumerate(
+            zip(results, winners, num_turns, cards_left)
+        ):
+            outcome = (
+                RESULT_CODES[result],
+                winner if winner >= 0 else None,
+                turns,
+                cards,
+            )
+            stats.add_game(*outcome)
+            if results_file is not None:
+                results_file.add_game(finished_seeds[i], *outcome)
+
+
+def play_games_vectorized(
+    master_seed: int,
+    start: int,
+    stop: int,
+    num_players: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    results: "ResultsBuffer | ResultsWriter | None" = None,
+    strategy: Optional[StrategyFactory] = None,
+) -> SimulationStats:
+    """Play the games with indices `start` up to (excluding) `stop` in lockstep.
+
+    Produces the same statistics (and `results`) as
+    `crazyeights.simulation.play_games`. All players use `strategy`, by default
+    the greedy strategy."""
+    stats = SimulationStats(num_players)
+    for batch_start in range(start, stop, batch_size):
+        batch_stop = min(batch_start + batch_size, stop)
+        seeds = [game_seed(master_seed, i) for i in range(batch_start, batch_stop)]
+        games = VectorizedGames(shuffled_decks(seeds), num_players, strategy)
+        games.play()
+        games.add_results_to(stats, results, seeds)
+    return stats
+
+
+def play_vectorized_game(
+    num_players: int, rng: Optional[random.Random] = None
+) -> tuple[GameResult, Optional[int], int, tuple[int, ...]]:
+    """Play a single game with the vectorized simulator.
+
+    This is only useful to compare the simulator with the other engines; use
+    `play_games_vectorized` to play many games at once."""
+    deck = DECK_ORDER.copy()
+    (rng or random).shuffle(deck)
+    games = VectorizedGames(np.array([deck]), num_players)
+    games.play()
+    result = RESULT_CODES[games.results[0]]
+    winner = int(games.winners[0])
+    cards_left = tuple(games.cards_left()[0].tolist())
+    return result, winner if winner >= 0 else None, int(games.num_turns[0]), cards_left
@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from crazyeights.remote.cluster import Coordinator, run_worker
+from crazyeights.tournament import run_tournament
+
+
+def stats_without_time(stats):
+    data = stats.to_dict()
+    del data["elapsed_time"]
+    return data
+
+
+async def run_coordinator(coordinator, *clients):
+    await coordinator.start()
+    results = await asyncio.gather(
+        coordinator.run(), *(c(coordinator) for c in clients)
+    )
+    return results[0], results[1:]
+
+
+def worker(**kwargs):
+    async def client(coordinator):
+        return await asyncio.to_thread(
+            run_worker, "127.0.0.1", coordinator.port, **kwargs
+        )
+
+    return client
+
+
+def failing_worker(hang=0.0):
+    """A worker that takes a chunk and disconnects (after `hang` seconds) without
+    sending its result."""
+
+    async def client(coordinator):
+        reader, writer = await asyncio.open_connection("127.0.0.1", coordinator.port)
+        writer.write(b'{"type": "hello", "version": 1, "name": "failing"}\n')
+        message = json.loads(await reader.readline())
+        await asyncio.sleep(hang)
+        writer.close()
+        return message
+
+    return client
+
+
+def test_workers_play_the_same_games_as_a_local_tournament():
+    expected = run_tournament(95, 8, 3, workers=1, chunk_size=10)
+    coordinator = Coordinator(95, 8, 3, chunk_size=10, port=0)
+    stats, chunks = asyncio.run(
+        run_coordinator(coordinator, worker(name="a"), worker(name="b"), worker())
+    )
+    assert stats_without_time(stats) == stats_without_time(expected)
+    assert sum(chunks) == 10
+    assert sum(coordinator.chunks_by_worker.values()) == 10
+
+
+def test_chunks_of_disconnected_workers_are_reassigned():
+    expected = run_tournament(50, 3, engine="fast", workers=1, chunk_size=10)
+    coordinator = Coordinator(50, 3, engine="fast", chunk_size=10, port=0)
+    stats, (message, _) = asyncio.run(
+        run_coordinator(coordinator, failing_worker(), worker())
+    )
+    assert message["type"] == "chunk"
+    assert coordinator.num_reassigned == 1
+    assert stats_without_time(stats) == stats_without_time(expected)
+
+
+def test_chunks_of_silent_workers_are_reassigned_after_the_timeout():
+    expected = run_tournament(30, 4, engine="fast", workers=1, chunk_size=10)
+    coordinator = Coordinator(30, 4, engine="fast", chunk_size=10, port=0, timeout=0.1)
+    stats, (message, chunks) = asyncio.run(
+        run_coordinator(coordinator, failing_worker(hang=0.5), worker())
+    )
+    assert message["index"] == 0
+    assert chunks == 3
+    assert coordinator.num_reassigned == 1
+    assert stats_without_time(stats) == stats_without_time(expected)
+
+
+def test_worker_with_wrong_protocol_version():
+    async def client(coordinator):
+        reader, writer = await asyncio.open_connection("127.0.0.1", coordinator.port)
+        writer.write(b'{"type": "hello", "version": 99}\n')
+        message = json.loads(await reader.readline())
+        writer.close()
+        await asyncio.to_thread(run_worker, "127.0.0.1", coordinator.port)
+        return message
+
+    coordinator = Coordinator(10, 1, chunk_size=5, port=0)
+    _, (message,) = asyncio.run(run_coordinator(coordinator, client))
+    assert message == {"type": "error", "message": "Unsupported version 99."}
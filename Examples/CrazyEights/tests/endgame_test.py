@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.deck import CARDS, Deck
+from crazyeights.endgame import EndgameSolver, SearchLimitExceeded
+from crazyeights.fast import NUM_CARDS
+from crazyeights.game import CrazyEightsGame, GameResult
+from crazyeights.notifier import NullNotifier
+
+
+def random_position(rng, num_players, hand_size):
+    cards = list(range(NUM_CARDS))
+    rng.shuffle(cards)
+    hands = []
+    for i in range(num_players):
+        mask = 0
+        for card in cards[i * hand_size : (i + 1) * hand_size]:
+            mask |= 1 << card
+        hands.append(mask)
+    return tuple(hands), cards[-1]
+
+
+def naive_value(hands, top, skipped):
+    """Max-n without a transposition table."""
+    num_players = len(hands)
+    best = None
+    for move in [*EndgameSolver.moves(hands[0], top), None]:
+        if move is None:
+            if skipped + 1 == num_players:
+                value = (1 / num_players,) * num_players
+            else:
+                child = naive_value((*hands[1:], hands[0]), top, skipped + 1)
+                value = child[-1:] + child[:-1]
+        else:
+            card, new_top = move
+            hand = hands[0] & ~(1 << card)
+            if not hand:
+                value = (1.0,) + (0.0,) * (num_players - 1)
+            else:
+                child = naive_value((*hands[1:], hand), new_top, 0)
+                value = child[-1:] + child[:-1]
+        if best is None or value[0] > best[0]:
+            best = value
+    return best
+
+
+@pytest.mark.parametrize("num_players,hand_size", [(2, 3), (2, 4), (3, 2)])
+def test_solver_agrees_with_naive_search(num_players, hand_size):
+    rng = random.Random(num_players * 10 + hand_size)
+    solver = EndgameSolver()
+    for _ in range(20):
+        hands, top = random_position(rng, num_players, hand_size)
+        value, _ = solver.solve(hands, top)
+        assert value == naive_value(hands, top, 0)
+
+
+def test_small_table_gives_same_values():
+    rng = random.Random(5)
+    solver = EndgameSolver()
+    small_solver = EndgameSolver(max_entries=50)
+    for _ in range(20):
+        hands, top = random_position(rng, 2, 4)
+        assert small_solver.solve(hands, top) == solver.solve(hands, top)
+    assert len(small_solver.table) == 50
+
+
+def test_search_limit():
+    hands, top = random_position(random.Random(1), 2, 10)
+    with pytest.raises(SearchLimitExceeded):
+        EndgameSolver(max_nodes=10).solve(hands, top)
+
+
+def create_endgame(seed, solver=None, hand_size=5):
+    """Return a game between two greedy players in which the deck is empty."""
+    rng = random.Random(seed)
+    cards = list(CARDS)
+    rng.shuffle(cards)
+    player = GreedyPlayer("Player", NullNotifier, endgame_solver=solver)
+    opponent = GreedyPlayer("Opponent", NullNotifier)
+    game = CrazyEightsGame([player, opponent], rng)
+    player.hand = cards[:hand_size]
+    opponent.hand = cards[hand_size : 2 * hand_size]
+    game.discard_pile = cards[2 * hand_size :]
+    game.deck = Deck.from_cards([])
+    return game
+
+
+def test_computer_player_uses_solver_in_endgame():
+    solver = EndgameSolver()
+    num_improved = 0
+    for seed in range(100):
+        game = create_endgame(seed, solver)
+        mine = list(game.players[0].hand)
+        theirs = list(game.players[1].hand)
+        value, _ = solver.solve(
+            [sum(1 << c.index for c in mine), sum(1 << c.index for c in theirs)],
+            game.top_discard.index,
+        )
+        result = game.play()
+        solver_won = (
+            result == GameResult.CURRENT_PLAYER_WON and game.current_player_index == 0
+        )
+        if value[0] == 1.0:
+            assert solver_won
+            greedy_game = create_endgame(seed)
+            greedy_game.play()
+            if greedy_game.current_player_index != 0:
+                num_improved += 1
+    assert num_improved > 0
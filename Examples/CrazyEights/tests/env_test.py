@@ -0,0 +1,88 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from crazyeights.env import DRAW, EIGHTS, NUM_ACTIONS, VectorEnv  # noqa: E402
+from crazyeights.fast import MATCH_MASKS  # noqa: E402
+from crazyeights.vectorized import VectorizedGames, random_decks  # noqa: E402
+
+
+def play_first_episodes(env, seed, choose_actions):
+    """Step until every environment finished a game; return the rewards and the
+    lengths of these games."""
+    done = np.zeros(env.num_envs, dtype=bool)
+    rewards = np.zeros(env.num_envs)
+    lengths = np.zeros(env.num_envs, dtype=np.int64)
+    observations = env.reset(seed)
+    while not done.all():
+        observations, step_rewards, dones, infos = env.step(
+            choose_actions(observations)
+        )
+        first = dones & ~done
+        rewards[first] = step_rewards[first]
+        lengths[first] = infos["episode_length"][first]
+        done |= dones
+    return rewards, lengths
+
+
+@pytest.mark.parametrize("num_players, agent_seat", [(2, 0), (3, 0), (3, 2)])
+def test_greedy_agent_plays_like_the_vectorized_games(num_players, agent_seat):
+    env = VectorEnv(300, num_players, agent_seat)
+    rewards, lengths = play_first_episodes(env, 11, lambda _: env.greedy_actions())
+
+    games = VectorizedGames(random_decks(300, np.random.default_rng(11)), num_players)
+    games.play()
+    assert lengths.tolist() == games.num_turns.tolist()
+    expected = np.where(games.winners == agent_seat, 1.0, -1.0)
+    expected[games.winners < 0] = 0.0
+    assert rewards.tolist() == expected.tolist()
+
+
+def test_observations():
+    env = VectorEnv(50, 3, seed=2)
+    observations = env.reset()
+    assert observations["hand"].sum(axis=1).tolist() == [7] * 50
+    assert observations["opponent_hand_sizes"].tolist() == [[7, 7]] * 50
+    assert observations["deck_size"].tolist() == [52 - 1 - 21] * 50
+    for _ in range(10):
+        observations, *_ = env.step(env.greedy_actions())
+    for hand, top, suit, mask in zip(
+        observations["hand"],
+        observations["top"],
+        observations["active_suit"],
+        observations["action_mask"],
+    ):
+        playable = [c for c in range(52) if hand[c] and MATCH_MASKS[top] >> c & 1]
+        assert np.flatnonzero(mask[:52]).tolist() == sorted(
+            set(playable) | (set(EIGHTS.tolist()) if hand[EIGHTS].any() else set())
+        )
+        assert mask[DRAW] == (not playable)
+        assert suit == (top % 4 if top // 4 == 6 else -1)
+
+
+def test_invalid_actions_are_replaced_by_the_strategy():
+    env = VectorEnv(100, 2, seed=3)
+    expected = VectorEnv(100, 2, seed=3)
+    observations = env.reset()
+    actions = np.where(observations["action_mask"][:, DRAW], 0, DRAW)
+    actions[:10] = NUM_ACTIONS + 5
+    _, _, _, infos = env.step(actions)
+    assert infos["invalid"].all()
+    expected.reset()
+    expected.step(expected.greedy_actions())
+    assert np.array_equal(env.games.hands, expected.games.hands)
+
+
+def test_finished_games_are_reset():
+    env = VectorEnv(20, 2, seed=4)
+    observations = env.reset()
+    finished = 0
+    for _ in range(500):
+        observations, rewards, dones, infos = env.step(env.greedy_actions())
+        if dones.any():
+            finished += dones.sum()
+            assert (observations["deck_size"][dones] == 52 - 1 - 14).all()
+            assert (infos["episode_length"][dones] > 0).all()
+            assert (infos["episode_return"][dones] == rewards[dones]).all()
+        assert env.games.live.all()
+    assert finished > 20
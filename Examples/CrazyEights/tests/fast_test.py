@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from crazyeights.deck import Card
+from crazyeights.fast import (
+    FastCrazyEightsGame,
+    MATCH_MASKS,
+    card_index,
+    cards_to_mask,
+    index_card,
+    mask_to_cards,
+    play_fast_game,
+)
+from crazyeights.game import GameResult
+from crazyeights.simulation import play_headless_game, simulate
+
+
+def test_card_index_round_trip():
+    for index in range(52):
+        assert card_index(index_card(index)) == index
+
+
+@pytest.mark.parametrize(
+    "top",
+    [Card("Hearts", "Ace"), Card("Diamonds", "8"), Card("Spades", "2")],
+)
+def test_match_masks_agree_with_card_matches(top):
+    all_cards = mask_to_cards((1 << 52) - 1)
+    expected = [card for card in all_cards if card.matches(top)]
+    assert mask_to_cards(MATCH_MASKS[card_index(top)]) == expected
+
+
+def test_greedy_prefers_earliest_drawn_card_of_highest_rank():
+    random.seed(1)
+    game = FastCrazyEightsGame(2)
+    tens = [Card("Hearts", "10"), Card("Spades", "10")]
+    latest, earliest = sorted(map(card_index, tens), key=game.initial_deck.index)
+    playable = cards_to_mask(tens + [Card("Spades", "3")])
+    assert game.pick_card(playable) == earliest
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 4, 7])
+def test_fast_engine_plays_same_games_as_object_engine(num_players):
+    for seed in range(200):
+        random.seed(seed)
+        expected = play_headless_game(num_players)
+        random.seed(seed)
+        assert play_fast_game(num_players) == expected
+
+
+def test_simulate_with_fast_engine():
+    expected = simulate(100, seed=7, num_players=3)
+    stats = simulate(100, seed=7, num_players=3, engine="fast")
+    assert stats.wins == expected.wins
+    assert stats.result_counts == expected.result_counts
+    assert stats.turns.total == expected.turns.total
+
+
+def test_from_state_continues_game():
+    hands = [cards_to_mask([Card("Hearts", "3")]), cards_to_mask([Card("Clubs", "4")])]
+    deck = [card_index(Card("Spades", "5"))]
+    top = card_index(Card("Hearts", "9"))
+    game = FastCrazyEightsGame.from_state(hands, deck, top, current_player_index=1)
+    assert game.play() == GameResult.CURRENT_PLAYER_WON
+    assert game.current_player_index == 0
+    assert game.num_turns == 2
+    assert game.deck == []
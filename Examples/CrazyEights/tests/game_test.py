@@ -1,9 +1,12 @@
+import copy
+import pickle
 import random
 
 import pytest
 
 from crazyeights.ai.player import GreedyPlayer
-from crazyeights.deck import Card, Deck
+from crazyeights.deck import CARDS, Card, Deck
+from crazyeights.game import CrazyEightsGame
 
 
 @pytest.fixture
@@ -14,12 +17,22 @@ def deck():
 
 def test_deck_fixture(deck):
     assert len(deck) == 52
-    assert deck.cards[:4] == [
+    assert deck.cards[:4] == (
         Card("Hearts", "7"),
         Card("Spades", "Jack"),
         Card("Diamonds", "7"),
         Card("Clubs", "7"),
-    ]
+    )
+
+
+def test_deck_cards_cannot_be_modified_in_place(deck):
+    with pytest.raises(AttributeError):
+        deck.cards.pop()
+    deck.draw_card()
+    assert isinstance(deck.cards, tuple)
+    assert len(deck.cards) == 51
+    deck.cards = deck.cards[1:]
+    assert len(deck) == 50
 
 
 class TestCard:
@@ -67,12 +80,58 @@ class TestCard:
     def test_shorthand(self, suit, rank, expected):
         assert Card(suit, rank).shorthand == expected
 
+    def test_cards_are_shared(self):
+        card = Card("Hearts", "Ace")
+        assert Card("Hearts", "Ace") is card
+        assert copy.deepcopy(card) is card
+        assert pickle.loads(pickle.dumps(card)) is card
+
+    def test_cards_are_immutable(self):
+        with pytest.raises(AttributeError):
+            Card("Hearts", "8").suit = "Spades"
+
+    def test_cards_can_be_dict_keys(self):
+        counts = {card: 0 for card in CARDS}
+        counts[Card("Spades", "2")] += 1
+        assert len(counts) == 52
+        assert counts[Card("Spades", "2")] == 1
+
+    def test_indices(self):
+        assert sorted(card.index for card in CARDS) == list(range(52))
+
+    def test_decks_share_cards(self):
+        deck1, deck2 = Deck(), Deck()
+        assert {id(card) for card in deck1} == {id(card) for card in deck2}
+
 
 @pytest.fixture
 def player():
     return GreedyPlayer("Alice")
 
 
+class TestCrazyEight:
+    def test_playing_an_eight_sets_active_suit(self, player):
+        other = GreedyPlayer("Bob")
+        game = CrazyEightsGame([player, other])
+        eight = Card("Diamonds", "8")
+        player.hand = [eight, Card("Spades", "2"), Card("Spades", "3")]
+        player.play_card(game, eight)
+        assert game.top_discard is eight
+        assert eight.suit == "Diamonds"
+        assert game.active_suit == "Spades"
+
+    def test_active_suit_is_matched(self, player):
+        player.hand = [Card("Spades", "2"), Card("Hearts", "3")]
+        playable = player.get_playable_cards(Card("Diamonds", "8"), "Spades")
+        assert playable == [Card("Spades", "2")]
+
+    def test_discarding_resets_active_suit(self, player):
+        game = CrazyEightsGame([player, GreedyPlayer("Bob")])
+        game.active_suit = "Clubs"
+        game.discard(Card("Hearts", "4"))
+        assert game.active_suit is None
+
+
 class TestGreedyPlayer:
     def test_show_hand(self, player):
         assert player.hand_string == ""
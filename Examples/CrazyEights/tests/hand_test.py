@@ -0,0 +1,99 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.deck import Card, Deck
+from crazyeights.hand import INDEX_THRESHOLD, Hand
+
+
+@pytest.fixture
+def cards():
+    random.seed(2023)
+    return Deck().cards[:20]
+
+
+def assert_index_consistent(hand):
+    for suit in ["Hearts", "Diamonds", "Clubs", "Spades"]:
+        assert hand.cards_of_suit(suit) == [c for c in hand if c.suit == suit]
+    for rank in ["2", "8", "10", "Ace"]:
+        assert hand.cards_of_rank(rank) == [c for c in hand if c.rank == rank]
+    for top in [Card("Hearts", "7"), Card("Clubs", "8"), Card("Spades", "Ace")]:
+        assert hand.matching(top) == [c for c in hand if c.matches(top)]
+    assert hand.mask == sum({1 << c.index for c in hand})
+
+
+def test_index_after_appends_and_removes(cards):
+    hand = Hand()
+    for card in cards:
+        hand.append(card)
+        assert_index_consistent(hand)
+    for card in cards[::3]:
+        hand.remove(card)
+        assert_index_consistent(hand)
+    hand.pop()
+    hand.pop(0)
+    assert_index_consistent(hand)
+
+
+def test_index_after_reordering(cards):
+    hand = Hand(cards)
+    hand.sort(key=str)
+    assert_index_consistent(hand)
+    hand.insert(2, Card("Hearts", "8"))
+    assert_index_consistent(hand)
+    del hand[1:4]
+    assert_index_consistent(hand)
+    hand[0] = Card("Spades", "Ace")
+    assert_index_consistent(hand)
+    hand += [Card("Hearts", "7")]
+    assert_index_consistent(hand)
+
+
+def test_hand_with_equal_cards():
+    hand = Hand([Card("Hearts", "2"), Card("Clubs", "3"), Card("Hearts", "2")])
+    hand.remove(Card("Hearts", "2"))
+    assert hand.cards_of_suit("Hearts") == [Card("Hearts", "2")]
+    assert_index_consistent(hand)
+
+
+def test_copy_and_pickle(cards):
+    hand = Hand(cards)
+    for clone in [
+        copy.copy(hand),
+        copy.deepcopy(hand),
+        pickle.loads(pickle.dumps(hand)),
+    ]:
+        assert isinstance(clone, Hand)
+        assert clone == hand
+        assert_index_consistent(clone)
+
+
+def test_player_hand_is_converted():
+    player = GreedyPlayer("Alice")
+    player.hand = [Card("Hearts", "2"), Card("Hearts", "8")]
+    assert isinstance(player.hand, Hand)
+    assert player.get_eight() == Card("Hearts", "8")
+    assert player.pick_suit() == "Hearts"
+
+
+def test_mask_with_equal_cards():
+    hand = Hand([Card("Hearts", "2"), Card("Hearts", "2")])
+    hand.remove(Card("Hearts", "2"))
+    assert hand.mask == 1 << Card("Hearts", "2").index
+    hand.pop()
+    assert hand.mask == 0
+
+
+@pytest.mark.parametrize("size", [5, INDEX_THRESHOLD, 30])
+def test_small_and_large_hands_answer_the_same(size):
+    deck = Deck(random.Random(size)).cards
+    hand = Hand(deck[:size])
+    assert_index_consistent(hand)
+    for card in deck[size : size + 5]:
+        hand.append(card)
+    hand.remove(deck[0])
+    hand.pop(3)
+    assert_index_consistent(hand)
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import crazyeights
+
+SOURCE_DIR = os.path.dirname(os.path.dirname(crazyeights.__file__))
+
+
+def imported_modules(code: str) -> set[str]:
+    """Return the modules imported by a fresh interpreter that runs `code`."""
+    code += "\nimport sys\nprint(' '.join(sys.modules))"
+    env = {**os.environ, "PYTHONPATH": SOURCE_DIR}
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    )
+    assert process.returncode == 0, process.stderr
+    # The last line holds the modules; the lines before are the output of `code`.
+    return set(process.stdout.splitlines()[-1].split())
+
+
+def test_package_attributes_are_imported_lazily():
+    modules = imported_modules("import crazyeights")
+    assert "crazyeights" in modules
+    assert not {"crazyeights.deck", "crazyeights.game", "click"} & modules
+
+
+def test_lazy_attributes():
+    modules = imported_modules("from crazyeights import Card; assert Card.__name__")
+    assert "crazyeights.deck" in modules
+    assert "crazyeights.game" not in modules
+    assert crazyeights.CrazyEightsGame.__module__ == "crazyeights.game"
+    assert "GreedyPlayer" in dir(crazyeights)
+    with pytest.raises(AttributeError):
+        crazyeights.NoSuchAttribute
+
+
+@pytest.mark.parametrize(
+    "args", [["--help"], ["simulate", "--help"], ["serve", "--help"]]
+)
+def test_cli_defers_imports(args):
+    modules = imported_modules(
+        "import sys\n"
+        "from crazyeights.__main__ import app\n"
+        f"sys.argv = ['crazy-eights', *{args!r}]\n"
+        "try:\n"
+        "    app()\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert "click" in modules
+    heavy = {
+        "asyncio",
+        "concurrent.futures",
+        "crazyeights.game",
+        "crazyeights.simulation",
+        "json",
+        "numpy",
+    }
+    assert not heavy & modules
+
+
+def test_games_do_not_import_metrics_sinks():
+    modules = imported_modules(
+        "from crazyeights.simulation import simulate; simulate(1, seed=1)"
+    )
+    assert not {"json", "tempfile"} & modules
@@ -0,0 +1,82 @@
+import io
+import json
+import random
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.game import CrazyEightsGame
+from crazyeights.metrics import JsonLinesSink, MetricsRegistry, PrometheusTextSink
+from crazyeights.notifier import NullNotifier
+
+
+def play_game(seed, metrics_sink=None, num_players=2):
+    players = [GreedyPlayer(f"P{i}", NullNotifier) for i in range(num_players)]
+    game = CrazyEightsGame(players, random.Random(seed), metrics_sink=metrics_sink)
+    return game, game.play()
+
+
+def test_games_without_sink_collect_nothing():
+    game, _ = play_game(1)
+    assert game.metrics is None
+
+
+def test_metrics_do_not_change_games():
+    for seed in range(10):
+        expected_game, expected = play_game(seed)
+        game, result = play_game(seed, MetricsRegistry())
+        assert result == expected
+        assert game.num_turns == expected_game.num_turns
+
+
+def test_registry_counts_turns():
+    registry = MetricsRegistry()
+    num_turns = 0
+    for seed in range(20):
+        game, result = play_game(seed, registry, num_players=4)
+        num_turns += game.num_turns
+    counters = registry.counters
+    assert counters["games"] == 20
+    assert sum(registry.results.values()) == 20
+    assert counters["turns"] == num_turns
+    assert 0 < counters["draws"] < num_turns
+    assert counters["eights_played"] > 0
+    assert 0 < counters["deck_exhausted"] <= 20
+    turn_timing = registry.timings["turn_seconds"]["GreedyPlayer"]
+    pick_timing = registry.timings["pick_seconds"]["GreedyPlayer"]
+    assert turn_timing.count == num_turns
+    assert pick_timing.count >= num_turns - counters["failed_draws"]
+    assert 0 < pick_timing.total < turn_timing.total
+
+
+def test_json_lines_sink():
+    file = io.StringIO()
+    sink = JsonLinesSink(file)
+    games = [play_game(seed, sink)[0] for seed in range(3)]
+    lines = file.getvalue().splitlines()
+    assert len(lines) == 3
+    for line, game in zip(lines, games):
+        data = json.loads(line)
+        assert data["turns"] == game.num_turns
+        assert data["turn_seconds"]["GreedyPlayer"]["count"] == game.num_turns
+
+
+def test_prometheus_text_sink(tmp_path):
+    path = tmp_path / "crazyeights.prom"
+    sink = PrometheusTextSink(str(path), write_interval=0)
+    play_game(1, sink)
+    text = path.read_text()
+    assert "# TYPE crazyeights_turns_total counter" in text
+    assert 'crazyeights_games_total{result="' in text
+    assert 'crazyeights_pick_seconds_count{player_class="GreedyPlayer"}' in text
+    assert text == sink.to_prometheus()
+
+
+def test_prometheus_text_sink_writes_after_interval_and_on_close(tmp_path):
+    path = tmp_path / "crazyeights.prom"
+    sink = PrometheusTextSink(str(path), write_interval=3600)
+    for seed in range(5):
+        play_game(seed, sink)
+    assert not path.exists()
+    sink.close()
+    assert "crazyeights_games_total" in path.read_text()
+    assert sink.counters["games"] == 5
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from crazyeights.ai.player import GreedyPlayer, MonteCarloPlayer
+from crazyeights.deck import Card
+from crazyeights.game import CrazyEightsGame
+from crazyeights.notifier import NullNotifier
+from crazyeights.player import TurnContext
+
+
+def create_player(name="Monte", rollouts=50, seed=0):
+    return MonteCarloPlayer(
+        name, NullNotifier, rollouts=rollouts, rng=random.Random(seed)
+    )
+
+
+def test_rollouts_must_be_positive():
+    with pytest.raises(ValueError):
+        create_player(rollouts=0)
+
+
+def test_plays_like_greedy_player_without_game():
+    player = create_player()
+    player.hand = [Card("Hearts", "3"), Card("Hearts", "King"), Card("Clubs", "5")]
+    context = TurnContext(player.hand, Card("Hearts", "9"))
+    assert player.pick_card_to_play(context) == Card("Hearts", "King")
+
+
+def test_picks_only_legal_cards():
+    player = create_player()
+    game = CrazyEightsGame([player, GreedyPlayer("Greedy", NullNotifier)])
+    for _ in range(30):
+        if game.current_player is player:
+            playable = player.get_playable_cards(game.top_discard, game.active_suit)
+            card = player.pick_card_to_play(player.create_turn_context(game))
+            assert card in playable if playable else card is None
+        if game.play_turn() is not None:
+            break
+
+
+def test_plays_winning_card_and_picks_suit():
+    player = create_player()
+    opponent = GreedyPlayer("Greedy", NullNotifier)
+    game = CrazyEightsGame([player, opponent], random.Random(1))
+    eight = Card("Spades", "8")
+    player.hand = [Card("Hearts", "2"), eight]
+    opponent.hand = [Card("Clubs", "Ace")]
+    game.discard(Card("Clubs", "3"))
+    player.take_turn(game)
+    # Picking clubs would let the opponent win with their last card.
+    assert game.top_discard is eight
+    assert game.active_suit != "Clubs"
+
+
+def play_seeded_game(seed):
+    players = [
+        MonteCarloPlayer("Monte", NullNotifier, rollouts=20),
+        GreedyPlayer("Greedy", NullNotifier),
+    ]
+    game = CrazyEightsGame(players, random.Random(seed))
+    result = game.play()
+    return result, game.num_turns, [list(player.hand) for player in players]
+
+
+def test_rollouts_use_the_random_number_generator_of_the_game():
+    for seed in range(3):
+        assert play_seeded_game(seed) == play_seeded_game(seed)
+
+
+def test_ties_go_to_the_suit_with_most_cards(monkeypatch):
+    player = create_player()
+    game = CrazyEightsGame([player, GreedyPlayer("Greedy", NullNotifier)])
+    player.hand = [Card("Spades", "8"), Card("Clubs", "2"), Card("Clubs", "3")]
+    game.discard(Card("Hearts", "4"))
+    monkeypatch.setattr(player, "evaluate_moves", lambda game, moves: [1] * len(moves))
+    card = player.pick_card_to_play(player.create_turn_context(game))
+    assert card == Card("Spades", "8")
+    assert player.pick_suit() == "Clubs"
@@ -0,0 +1,90 @@
+import functools
+import io
+import random
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.game import CrazyEightsGame
+from crazyeights.hand import Hand
+from crazyeights.interactive.player import InteractivePlayer
+from crazyeights.notifier import BufferedTerminalNotifier, NullNotifier
+from crazyeights.simulation import simulate
+
+
+class CountingWriter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.num_writes = 0
+
+    def write(self, text):
+        self.num_writes += 1
+        return super().write(text)
+
+
+def test_buffered_notifiers_write_game_once(capsys, expected_game_output):
+    target = CountingWriter()
+    factory = functools.partial(
+        BufferedTerminalNotifier, buffer=io.StringIO(), file=target
+    )
+    random.seed(2023)
+    game = CrazyEightsGame(
+        [
+            GreedyPlayer("Alice", notifier_factory=factory),
+            GreedyPlayer("Bob", notifier_factory=factory),
+        ]
+    )
+    game.play()
+    assert capsys.readouterr().out == ""
+    assert target.num_writes == 1
+    assert target.getvalue() + "\nBob wins!\n" == expected_game_output
+
+
+def test_buffered_notifier_writes_to_stdout_by_default(capsys):
+    player = GreedyPlayer("Alice", notifier_factory=BufferedTerminalNotifier)
+    player.notifier.notify("Hello")
+    assert capsys.readouterr().out == ""
+    player.notifier.flush()
+    player.notifier.flush()
+    assert capsys.readouterr().out == "Hello\n"
+
+
+def test_null_notifier_for_all_player_types(capsys):
+    players = [
+        InteractivePlayer("Alice", notifier_factory=NullNotifier),
+        GreedyPlayer("Bob", notifier_factory=NullNotifier),
+    ]
+    for player in players:
+        notifier = player.notifier
+        notifier.notify("Hello")
+        notifier.notify_card_drawn(None)
+        notifier.notify_suit_picked("Hearts")
+    assert capsys.readouterr().out == ""
+
+
+def test_simulate_with_log_file():
+    log_file = CountingWriter()
+    stats = simulate(5, seed=1, log_file=log_file)
+    log = log_file.getvalue()
+    assert log.count("wins!") == stats.num_games
+    assert log_file.num_writes == stats.num_games
+    assert "Computer 1's turn." in log
+
+
+def test_playable_cards_are_computed_once_per_turn(monkeypatch):
+    calls = []
+    matching = Hand.matching
+
+    def counting_matching(hand, *args):
+        calls.append(args)
+        return matching(hand, *args)
+
+    monkeypatch.setattr(Hand, "matching", counting_matching)
+    buffer = io.StringIO()
+    notifier_factory = functools.partial(BufferedTerminalNotifier, buffer=buffer)
+    players = [GreedyPlayer(f"P{i}", notifier_factory) for i in range(2)]
+    game = CrazyEightsGame(players, random.Random(3))
+    for _ in range(20):
+        calls.clear()
+        if game.play_turn() is not None:
+            break
+        assert len(calls) == 1
+    assert "Playable cards" in buffer.getvalue()
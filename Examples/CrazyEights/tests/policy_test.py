@@ -0,0 +1,39 @@
+import random
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.ai.policy import greedy_card
+from crazyeights.deck import RANKS, SUITS, Card, Deck
+from crazyeights.hand import Hand
+from crazyeights.notifier import NullNotifier
+from crazyeights.player import TurnContext
+
+
+def random_situations(num_situations, max_hand_size=8, seed=2023):
+    rng = random.Random(seed)
+    for _ in range(num_situations):
+        cards = Deck(rng).cards
+        hand = Hand(cards[: rng.randint(1, max_hand_size)])
+        top = cards[-1]
+        active_suit = rng.choice(SUITS) if top.rank == "8" else None
+        yield hand, top, active_suit
+
+
+def test_greedy_decisions_play_the_highest_ranked_playable_card():
+    player = GreedyPlayer("Greedy", NullNotifier)
+    for hand, top, active_suit in random_situations(2000):
+        context = TurnContext(hand, top, active_suit)
+        playable_cards = context.playable_cards
+        expected = (
+            max(playable_cards, key=lambda card: RANKS.index(card.rank))
+            if playable_cards
+            else None
+        )
+        assert greedy_card(hand, top, active_suit) is expected
+        assert player.pick_card_to_play(context) is expected
+
+
+def test_ties_are_broken_by_hand_order():
+    cards = [Card("Hearts", "King"), Card("Spades", "King"), Card("Clubs", "8")]
+    top = Card("Diamonds", "King")
+    assert greedy_card(Hand(cards), top) == Card("Hearts", "King")
+    assert greedy_card(Hand(cards[::-1]), top) == Card("Spades", "King")
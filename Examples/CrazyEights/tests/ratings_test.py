@@ -0,0 +1,76 @@
+import json
+import random
+
+import pytest
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.game import CrazyEightsGame, GameResult
+from crazyeights.notifier import NullNotifier
+from crazyeights.ratings import EloRatings, expected_score
+
+
+def test_ratings_converge_to_win_rate():
+    rng = random.Random(1)
+    ratings = EloRatings()
+    for _ in range(3000):
+        strong_wins = rng.random() < 0.75
+        ratings.add_game(["strong", "weak"], [0, 1] if strong_wins else [1, 0])
+    difference = ratings["strong"].rating - ratings["weak"].rating
+    assert expected_score(difference, 0) == pytest.approx(0.75, abs=0.05)
+    assert ratings["strong"].games == ratings["weak"].games == 3000
+    assert ratings["strong"].wins + ratings["weak"].wins == 3000
+
+
+def test_two_player_updates_are_zero_sum():
+    ratings = EloRatings()
+    ratings.add_game(["a", "b"], [1, 0])
+    ratings.add_game(["a", "c"], [0, 0])
+    ratings.add_game(["b", "c"], [0, 1])
+    total = sum(rating.rating for _, rating in ratings.leaderboard())
+    assert total == pytest.approx(3 * 1500)
+
+
+def test_multi_player_games_are_scored_pairwise():
+    ratings = EloRatings(provisional_games=0, k_factor=30)
+    ratings.add_game(["a", "b", "c", "d"], [0, 1, 1, 3])
+    # Each pair moves the ratings by K / 3 times the surprise.
+    assert ratings["a"].rating == pytest.approx(1500 + 3 * 5)
+    assert ratings["b"].rating == ratings["c"].rating == pytest.approx(1500)
+    assert ratings["d"].rating == pytest.approx(1500 - 3 * 5)
+    assert [name for name, _ in ratings.leaderboard()][0] == "a"
+
+
+def test_seats_of_the_same_strategy_are_not_compared():
+    ratings = EloRatings()
+    ratings.add_game(["a", "a", "b"], [0, 1, 2])
+    assert ratings["a"].games == 1
+    assert ratings["a"].wins == 1
+    assert ratings["a"].rating > 1500 > ratings["b"].rating
+
+
+class CautiousPlayer(GreedyPlayer):
+    pass
+
+
+def test_finished_games_are_rated_by_player_class():
+    ratings = EloRatings()
+    for seed in range(20):
+        players = [
+            GreedyPlayer("A", NullNotifier),
+            CautiousPlayer("B", NullNotifier),
+            GreedyPlayer("C", NullNotifier),
+        ]
+        game = CrazyEightsGame(players, random.Random(seed))
+        ratings.add_finished_game(game, game.play())
+    assert ratings.num_games == 20
+    assert set(ratings.ratings) == {"GreedyPlayer", "CautiousPlayer"}
+    assert ratings["GreedyPlayer"].games == 20
+
+
+def test_leaderboard_snapshot_round_trips_through_json():
+    ratings = EloRatings()
+    ratings.add_result(["x", "y", "z"], GameResult.CURRENT_PLAYER_WON, 1, (4, 0, 2))
+    data = json.loads(ratings.to_json())
+    assert [entry["strategy"] for entry in data["leaderboard"]] == ["y", "z", "x"]
+    restored = EloRatings.from_dict(data)
+    assert restored.to_dict() == ratings.to_dict()
@@ -0,0 +1,88 @@
+import io
+import random
+
+import pytest
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.game import CrazyEightsGame, GameResult
+from crazyeights.notifier import NullNotifier
+from crazyeights.recording import (
+    HEADER_SIZE,
+    RecordingError,
+    read_recordings,
+    replay,
+    write_recording,
+)
+
+
+def play_recorded_game(seed, num_players=2):
+    players = [
+        GreedyPlayer(f"Player {i + 1}", notifier_factory=NullNotifier)
+        for i in range(num_players)
+    ]
+    game = CrazyEightsGame(players, random.Random(seed), record=True)
+    result = game.play()
+    return game, result
+
+
+def assert_same_state(game, expected):
+    assert game.deck.cards == expected.deck.cards
+    assert game.discard_pile == expected.discard_pile
+    assert game.active_suit == expected.active_suit
+    assert game.current_player_index == expected.current_player_index
+    for player, expected_player in zip(game.players, expected.players):
+        assert player.hand == expected_player.hand
+
+
+def test_recording_is_compact():
+    game, _ = play_recorded_game(2023)
+    recording = game.recording
+    assert len(recording) <= HEADER_SIZE + 3 * game.num_turns
+    assert sorted(recording[2:HEADER_SIZE]) == list(range(52))
+
+
+def test_games_are_not_recorded_by_default():
+    game = CrazyEightsGame([GreedyPlayer("Alice"), GreedyPlayer("Bob")])
+    assert game.recording is None
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 5])
+def test_replay_rebuilds_final_state(num_players):
+    for seed in range(30):
+        game, result = play_recorded_game(seed, num_players)
+        replayed = replay(game.recording)
+        assert replayed.num_turns == game.num_turns
+        assert_same_state(replayed, game)
+        if result == GameResult.CURRENT_PLAYER_WON:
+            assert replayed.current_player.has_won()
+
+
+def test_replay_to_turn():
+    game, _ = play_recorded_game(7, 3)
+    recording = game.recording
+    players = [
+        GreedyPlayer(f"Player {i + 1}", notifier_factory=NullNotifier) for i in range(3)
+    ]
+    live_game = CrazyEightsGame(players, random.Random(7))
+    for turn in range(game.num_turns):
+        assert_same_state(replay(recording, turn), live_game)
+        live_game.play_turn()
+
+
+def test_invalid_recordings():
+    with pytest.raises(RecordingError):
+        replay(b"\x01\x02")
+    game, _ = play_recorded_game(1)
+    data = bytearray(game.recording)
+    data[HEADER_SIZE] = 200
+    with pytest.raises(RecordingError):
+        replay(bytes(data))
+
+
+def test_archive_round_trip():
+    recordings = [play_recorded_game(seed)[0].recording for seed in range(5)]
+    archive = io.BytesIO()
+    for recording in recordings:
+        write_recording(archive, recording)
+    archive.seek(0)
+    assert list(read_recordings(archive)) == recordings
@@ -0,0 +1,167 @@
+import pytest
+from click.testing import CliRunner
+
+from crazyeights.__main__ import app
+from crazyeights.game import GameResult
+from crazyeights.results import ResultsError, ResultsStore, ResultsWriter
+from crazyeights.simulation import game_seed, simulate
+from crazyeights.tournament import run_tournament
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "results.c8r")
+
+
+def test_games_are_stored_column_by_column(path):
+    with ResultsWriter(path, num_players=3, block_size=2) as writer:
+        writer.add_game(2**64 - 1, GameResult.CURRENT_PLAYER_WON, 2, 70000, (1, 2, 0))
+        writer.add_game(5, GameResult.NO_PLAYABLE_CARDS, None, 12, (3, 4, 5))
+        writer.add_game(6, GameResult.CURRENT_PLAYER_WON, 0, 30, (0, 7, 8))
+    with ResultsStore(path) as store:
+        assert len(store.blocks) == 2
+        assert list(store.select()) == [
+            (2**64 - 1, 70000, 2, GameResult.CURRENT_PLAYER_WON, 1, 2, 0),
+            (5, 12, None, GameResult.NO_PLAYABLE_CARDS, 3, 4, 5),
+            (6, 30, 0, GameResult.CURRENT_PLAYER_WON, 0, 7, 8),
+        ]
+
+
+def test_filters_and_aggregates(path):
+    with ResultsWriter(path, num_players=2) as writer:
+        for turns in range(1, 101):
+            winner = turns % 2 if turns <= 90 else None
+            result = (
+                GameResult.CURRENT_PLAYER_WON
+                if winner is not None
+                else GameResult.NO_PLAYABLE_CARDS
+            )
+            writer.add_game(turns, result, winner, turns, (turns % 7, 0))
+    with ResultsStore(path) as store:
+        assert store.count() == 100
+        assert store.count(where={"result": GameResult.NO_PLAYABLE_CARDS}) == 10
+        assert store.count(where={"winner": None}) == 10
+        assert store.count(where={"winner": 1, "turns": range(10, 20)}) == 5
+        assert store.count(where={"hand_0": lambda n: n > 5}) == 14
+        stats = store.stats("turns", where={"winner": 0})
+        assert (stats.count, stats.mean, stats.min, stats.max) == (45, 46.0, 2, 90)
+        assert store.value_counts("result") == {
+            GameResult.NO_PLAYABLE_CARDS: 10,
+            GameResult.CURRENT_PLAYER_WON: 90,
+        }
+        assert list(store.select(["seed"], where={"turns": {3, 99}})) == [(3,), (99,)]
+        with pytest.raises(ResultsError):
+            store.count(where={"hand_2": 0})
+
+
+def test_appending_to_a_file(path):
+    with ResultsWriter(path, 2) as writer:
+        simulate(20, seed=1, results=writer)
+    with ResultsWriter(path, 2) as writer:
+        simulate(30, seed=2, results=writer)
+    with ResultsStore(path) as store:
+        seeds = [seed for seed, in store.select(["seed"])]
+    assert seeds[:20] == [game_seed(1, i) for i in range(20)]
+    assert seeds[20:] == [game_seed(2, i) for i in range(30)]
+    with pytest.raises(ResultsError):
+        ResultsWriter(path, 3)
+
+
+def test_incomplete_block_is_ignored(path):
+    with ResultsWriter(path, 2) as writer:
+        simulate(10, seed=1, results=writer)
+    with ResultsWriter(path, 2) as writer:
+        simulate(10, seed=2, results=writer)
+    with open(path, "rb+") as file:
+        file.truncate(file.seek(0, 2) - 1)
+    with ResultsStore(path) as store:
+        assert len(store) == 10
+
+
+def test_not_a_results_file(path):
+    with open(path, "wb") as file:
+        file.write(b"Crazy Eights")
+    with pytest.raises(ResultsError):
+        ResultsStore(path)
+
+
+def test_results_match_statistics(path):
+    with ResultsWriter(path, 3) as writer:
+        stats = simulate(100, seed=7, num_players=3, engine="fast", results=writer)
+    with ResultsStore(path) as store:
+        assert store.value_counts("result") == {
+            result: count for result, count in stats.result_counts.items() if count
+        }
+        assert [store.count(where={"winner": seat}) for seat in range(3)] == stats.wins
+        assert store.stats("turns").mean == pytest.approx(stats.mean_turns)
+        for seat in range(3):
+            mean = store.stats(f"hand_{seat}").mean
+            assert mean == pytest.approx(stats.mean_cards_left[seat])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_tournament_file_does_not_depend_on_worker_count(tmp_path, workers):
+    expected = tmp_path / "expected.c8r"
+    with ResultsWriter(str(expected), 2, block_size=10) as writer:
+        simulate(45, seed=3, engine="fast", results=writer)
+    path = tmp_path / "tournament.c8r"
+    run_tournament(
+        45, seed=3, engine="fast", workers=workers, chunk_size=10, results_path=path
+    )
+    assert path.read_bytes() == expected.read_bytes()
+
+
+def test_numpy_columns(path):
+    np = pytest.importorskip("numpy")
+    with ResultsWriter(path, 2) as writer:
+        simulate(50, seed=4, results=writer)
+        simulate(50, seed=4, engine="numpy", results=writer)
+    with ResultsStore(path) as store:
+        (block,) = store.iter_numpy_blocks(["seed", "turns"])
+        assert block["seed"].dtype == np.uint64
+        assert np.array_equal(block["seed"][:50], block["seed"][50:])
+        assert np.array_equal(block["turns"][:50], block["turns"][50:])
+        del block
+
+
+@pytest.mark.parametrize(
+    "where",
+    [
+        None,
+        {"winner": None},
+        {"winner": 1, "turns": range(10, 60)},
+        {"result": GameResult.CURRENT_PLAYER_WON, "hand_0": {0, 3, 5}},
+        {"hand_1": lambda n: n > 2, "turns": range(0, 200, 3)},
+        {"turns": 1000},
+    ],
+)
+def test_numpy_queries_match_pure_python(path, where):
+    pytest.importorskip("numpy")
+    with ResultsWriter(path, 2, block_size=64) as writer:
+        simulate(300, seed=9, engine="fast", results=writer)
+    with ResultsStore(path) as store:
+        answers = []
+        for use_numpy in [True, False]:
+            store.use_numpy = use_numpy
+            answers.append(
+                [
+                    store.count(where),
+                    store.value_counts("winner", where),
+                    store.value_counts("seed", where),
+                    *(
+                        store.stats(column, where).to_dict()
+                        for column in ["seed", "turns", "winner", "hand_0"]
+                    ),
+                ]
+            )
+    assert answers[0] == answers[1]
+
+
+def test_simulate_command_writes_results(tmp_path):
+    path = tmp_path / "results.c8r"
+    runner = CliRunner()
+    args = ["simulate", "-n", "25", "--seed", "1", "--results", str(path)]
+    assert runner.invoke(app, args).exit_code == 0
+    assert runner.invoke(app, args + ["-w", "2"]).exit_code == 0
+    with ResultsStore(str(path)) as store:
+        assert len(store) == 50
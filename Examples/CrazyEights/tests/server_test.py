@@ -0,0 +1,104 @@
+import asyncio
+import random
+
+import pytest
+
+from crazyeights.ai.player import GreedyPlayer
+from crazyeights.deck import RANKS, SUITS
+from crazyeights.game import CrazyEightsGame
+from crazyeights.notifier import NullNotifier
+from crazyeights.remote.player import AsyncPlayer
+from crazyeights.remote.server import GameServer, play_game
+
+ANSWERS = {
+    "Your name: ": "Tester",
+    "Pick a card to play (-1 to skip): ": "1",
+    "Pick a suit (h♥/d♦/c♣/s♠): ": "h",
+}
+
+
+class AsyncGreedyPlayer(AsyncPlayer):
+    def __init__(self, name):
+        super().__init__(name, NullNotifier(self))
+
+    async def pick_card_to_play_async(self, context):
+        await asyncio.sleep(0)
+        if context.playable_cards:
+            return max(context.playable_cards, key=lambda c: RANKS.index(c.rank))
+        return None
+
+    async def pick_suit_async(self):
+        return max(SUITS, key=self.hand.count_suit)
+
+
+def test_async_players_play_like_sync_players():
+    for seed in range(20):
+        players = [GreedyPlayer("A", NullNotifier), GreedyPlayer("B", NullNotifier)]
+        expected_game = CrazyEightsGame(players, random.Random(seed))
+        expected = expected_game.play()
+        game = CrazyEightsGame(
+            [AsyncGreedyPlayer("A"), GreedyPlayer("B", NullNotifier)],
+            random.Random(seed),
+        )
+        assert asyncio.run(play_game(game)) == expected
+        assert game.num_turns == expected_game.num_turns
+        assert game.current_player_index == expected_game.current_player_index
+
+
+def test_async_players_cannot_play_synchronous_games():
+    game = CrazyEightsGame(
+        [AsyncGreedyPlayer("A"), GreedyPlayer("B", NullNotifier)], random.Random(0)
+    )
+    with pytest.raises(TypeError, match="asynchronous player"):
+        game.play()
+
+
+async def run_client(port, answer=True):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    output = ""
+    while chunk := await reader.read(4096):
+        output += chunk.decode()
+        if answer:
+            for prompt, reply in ANSWERS.items():
+                if output.endswith(prompt):
+                    writer.write(f"{reply}\n".encode())
+    writer.close()
+    return output
+
+
+async def run_server(num_clients, answer=True, **kwargs):
+    server = GameServer(port=0, seed=1, **kwargs)
+    await server.start()
+    outputs = await asyncio.gather(
+        *(run_client(server.port, answer) for _ in range(num_clients))
+    )
+    await server.close()
+    return server, outputs
+
+
+def test_server_hosts_many_tables():
+    server, outputs = asyncio.run(run_server(50, timeout=5))
+    assert server.num_tables == 50
+    assert sum(server.result_counts.values()) == 50
+    for output in outputs:
+        assert "Tester's turn" in output
+        assert "Computer 1's turn" in output
+        assert "Your hand:" in output
+        assert "wins!" in output
+
+
+def test_tables_with_several_humans():
+    server, outputs = asyncio.run(
+        run_server(4, num_humans=2, num_computers=0, timeout=5)
+    )
+    assert server.num_tables == 2
+    for output in outputs:
+        assert output.count("Your hand:") < output.count("'s turn.")
+
+
+def test_slow_clients_time_out():
+    server, outputs = asyncio.run(run_server(2, answer=False, timeout=0.01))
+    assert sum(server.result_counts.values()) == 2
+    for output in outputs:
+        assert "Time is up." in output
+        assert "wins!" in output
@@ -0,0 +1,84 @@
+import pytest
+from click.testing import CliRunner
+
+from crazyeights.__main__ import app
+from crazyeights.game import GameResult
+from crazyeights.simulation import SimulationStats, play_games, simulate
+
+
+def test_simulate_produces_no_output(capsys):
+    simulate(20, seed=2023)
+    captured = capsys.readouterr()
+    assert captured.out == ""
+
+
+def test_simulate_counts_all_games():
+    stats = simulate(50, seed=2023, num_players=3)
+    assert stats.num_games == 50
+    assert sum(stats.result_counts.values()) == 50
+    assert sum(stats.wins) == stats.result_counts[GameResult.CURRENT_PLAYER_WON]
+    assert stats.min_turns <= stats.mean_turns <= stats.max_turns
+
+
+def test_simulate_is_reproducible():
+    stats1 = simulate(30, seed=42)
+    stats2 = simulate(30, seed=42)
+    assert stats1.wins == stats2.wins
+    assert stats1.turns.total == stats2.turns.total
+
+
+def test_simulate_needs_two_players():
+    with pytest.raises(ValueError):
+        simulate(1, num_players=1)
+
+
+def test_merge():
+    stats1 = SimulationStats(2)
+    stats1.add_game(GameResult.CURRENT_PLAYER_WON, 0, 10)
+    stats2 = SimulationStats(2)
+    stats2.add_game(GameResult.CURRENT_PLAYER_WON, 1, 30)
+    stats1.merge(stats2)
+    assert stats1.num_games == 2
+    assert stats1.wins == [1, 1]
+    assert stats1.min_turns == 10
+    assert stats1.max_turns == 30
+    assert stats1.stdev_turns == 10.0
+
+
+def test_turn_percentiles():
+    stats = SimulationStats(2)
+    for num_turns, num_games in [(5, 50), (25, 40), (75, 9), (600, 1)]:
+        for _ in range(num_games):
+            stats.add_game(GameResult.CURRENT_PLAYER_WON, 0, num_turns)
+    assert stats.turn_percentiles() == {"median": 20, "p90": 70, "p99": 500}
+    assert "percentiles: median 20-29, p90 70-79, p99 500+" in stats.report()
+
+
+def test_simulate_command():
+    result = CliRunner().invoke(app, ["simulate", "-n", "10", "--seed", "1"])
+    assert result.exit_code == 0
+    assert "Games played: 10" in result.output
+    assert "games/s" in result.output
+
+
+def test_streaming_statistics():
+    stats = simulate(200, seed=7, num_players=3)
+    assert sum(stats.turn_histogram.counts) == 200
+    assert stats.turns.count == 200
+    assert stats.mean_turns == stats.turns.total / 200
+    variance = stats.turns.total_squares / 200 - (stats.turns.total / 200) ** 2
+    assert stats.turns.variance == pytest.approx(variance)
+    assert all(seat_stats.count == 200 for seat_stats in stats.cards_left)
+    # Someone wins most games with an empty hand.
+    assert min(stats.mean_cards_left) < max(stats.mean_cards_left)
+    assert "Cards left in hand per seat" in stats.report()
+
+
+def test_merged_statistics_match_single_stream():
+    expected = simulate(100, seed=3)
+    merged = SimulationStats(2)
+    for start in range(0, 100, 30):
+        merged.merge(play_games(3, start, min(start + 30, 100), 2, "fast"))
+    merged.elapsed_time = expected.elapsed_time
+    assert merged.to_dict() == expected.to_dict()
+    assert merged.report() == expected.report()
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from crazyeights.deck import Card, Deck
+from crazyeights.game import CrazyEightsGame
+from crazyeights.simulation import create_headless_players
+
+
+def new_game(seed, num_players=2):
+    return CrazyEightsGame(create_headless_players(num_players), random.Random(seed))
+
+
+def game_state(game):
+    return (
+        game.deck.cards,
+        list(game.discard_pile),
+        [list(player.hand) for player in game.players],
+        game.current_player_index,
+        game.active_suit,
+        game.num_turns,
+        game.num_players_skipped,
+    )
+
+
+def play_turns(game, num_turns):
+    for _ in range(num_turns):
+        if game.play_turn() is not None:
+            break
+
+
+def test_deck_snapshot_is_shared():
+    deck = Deck(random.Random(1))
+    state = deck.snapshot()
+    cards = deck.cards
+    top = deck.draw_card()
+    assert deck.cards == cards[:-1]
+    deck.restore(state)
+    assert deck.cards == cards
+    assert deck.draw_card() is top
+
+
+def test_deck_indexing():
+    deck = Deck.from_cards([Card("Hearts", "2"), Card("Clubs", "3")])
+    deck.draw_card()
+    assert deck[0] == Card("Hearts", "2")
+    assert deck[-1] == Card("Hearts", "2")
+    assert deck[:] == (Card("Hearts", "2"),)
+    with pytest.raises(IndexError):
+        deck[1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_restore_returns_to_snapshot(seed):
+    game = new_game(seed)
+    play_turns(game, 5)
+    expected = game_state(game)
+    snapshot = game.snapshot()
+    play_turns(game, 20)
+    game.restore(snapshot)
+    assert game_state(game) == expected
+
+
+def test_snapshot_is_not_modified_by_game():
+    game = new_game(3)
+    snapshot = game.snapshot()
+    discard_pile = list(snapshot.discard_pile)
+    play_turns(game, 20)
+    assert snapshot.discard_pile == discard_pile
+    game.restore(snapshot)
+    play_turns(game, 20)
+    assert snapshot.discard_pile == discard_pile
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 4])
+def test_clone_plays_like_original(num_players):
+    game = new_game(42, num_players)
+    play_turns(game, 7)
+    clone = CrazyEightsGame.from_snapshot(
+        game.snapshot(), create_headless_players(num_players)
+    )
+    assert game_state(clone) == game_state(game)
+    assert clone.play() == game.play()
+    assert game_state(clone) == game_state(game)
+
+
+def test_clone_needs_matching_players():
+    snapshot = new_game(1).snapshot()
+    with pytest.raises(ValueError):
+        CrazyEightsGame.from_snapshot(snapshot, create_headless_players(3))
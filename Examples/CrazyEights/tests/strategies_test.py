@@ -0,0 +1,149 @@
+import importlib.metadata
+import random
+
+import pytest
+from click.testing import CliRunner
+
+from crazyeights import strategies
+from crazyeights.__main__ import app
+from crazyeights.ai.player import GreedyPlayer, MonteCarloPlayer
+from crazyeights.deck import SUITS, Deck
+from crazyeights.hand import Hand
+from crazyeights.interactive.player import InteractivePlayer
+from crazyeights.notifier import NullNotifier
+from crazyeights.player import TurnContext
+from crazyeights.strategies import (
+    UnknownStrategyError,
+    available_strategies,
+    create_players,
+    load_strategy,
+    parse_player_spec,
+    supports_batches,
+)
+
+
+@pytest.fixture
+def plugin(monkeypatch):
+    """Register the strategies `cautious` and `broken` as installed entry points."""
+    installed = [
+        importlib.metadata.EntryPoint(
+            "cautious",
+            "crazyeights.ai.player:MonteCarloPlayer",
+            "crazyeights.strategies",
+        ),
+        importlib.metadata.EntryPoint(
+            "broken", "crazyeights.no_such_module:Player", "crazyeights.strategies"
+        ),
+    ]
+
+    def entry_points(group):
+        assert group == strategies.ENTRY_POINT_GROUP
+        return installed
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", entry_points)
+
+
+def test_builtin_strategies():
+    assert {"greedy", "interactive", "montecarlo"} <= set(available_strategies())
+    assert load_strategy("greedy") is GreedyPlayer
+    players = create_players([("Alice", "interactive"), ("Bob", "greedy")])
+    assert [type(player) for player in players] == [InteractivePlayer, GreedyPlayer]
+    assert [player.name for player in players] == ["Alice", "Bob"]
+
+
+def test_installed_strategies_are_loaded_when_selected(plugin):
+    assert {"cautious", "broken"} <= set(available_strategies())
+    assert load_strategy("cautious") is MonteCarloPlayer
+    with pytest.raises(ModuleNotFoundError):
+        load_strategy("broken")
+    with pytest.raises(UnknownStrategyError):
+        load_strategy("reckless")
+
+
+def test_parse_player_spec():
+    assert parse_player_spec("Host:8888:greedy") == ("Host:8888", "greedy")
+    for spec in ["Alice", "Alice:", ":greedy"]:
+        with pytest.raises(ValueError):
+            parse_player_spec(spec)
+
+
+def test_player_option():
+    runner = CliRunner()
+    args = ["--player", "Alice:greedy", "--player", "Bob:greedy"]
+    args += ["--player", "Carol:greedy"]
+    result = runner.invoke(app, [*args, "--seed", "1"])
+    assert result.exit_code == 0
+    assert "Carol's turn" in result.output
+    assert result.output.rstrip().endswith("wins!")
+    result = runner.invoke(app, ["--player", "Alice:reckless"])
+    assert result.exit_code == 2
+    assert "Unknown strategy 'reckless'" in result.output
+
+
+def test_short_p_only_means_the_number_of_players():
+    runner = CliRunner()
+    result = runner.invoke(app, ["-p", "Alice:greedy"])
+    assert result.exit_code == 2
+    args = ["--player", "Alice:greedy", "simulate", "-n", "3", "-p", "3"]
+    result = runner.invoke(app, [*args, "--seed", "1"])
+    assert result.exit_code == 0
+    assert "Seat 3 win rate" in result.output
+
+
+def test_strategies_command(plugin):
+    result = CliRunner().invoke(app, ["strategies"])
+    assert result.exit_code == 0
+    assert "cautious" in result.output and "greedy" in result.output
+
+
+def test_batched_greedy_decisions_match_greedy_player():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(7)
+    player = GreedyPlayer("Greedy", NullNotifier)
+    hands, playable, hand_order, expected_cards, expected_suits = [], [], [], [], []
+    for _ in range(300):
+        cards = Deck(rng).cards
+        player.hand = Hand(cards[: rng.randint(1, 12)])
+        context = TurnContext(player.hand, cards[-1])
+        indices = [card.index for card in player.hand]
+        hand = np.zeros(52, dtype=bool)
+        hand[indices] = True
+        hands.append(hand)
+        mask = np.zeros(52, dtype=bool)
+        mask[[card.index for card in context.playable_cards]] = True
+        playable.append(mask)
+        order = np.full(52, 51)
+        order[indices] = np.arange(len(indices))
+        hand_order.append(order)
+        card = player.pick_card_to_play(context)
+        expected_cards.append(-1 if card is None else card.index)
+        expected_suits.append(SUITS.index(player.pick_suit()))
+    hands, playable, hand_order = map(np.array, (hands, playable, hand_order))
+    cards = GreedyPlayer.pick_cards_batch(hands, playable, hand_order)
+    assert cards.tolist() == expected_cards
+    assert GreedyPlayer.pick_suits_batch(hands).tolist() == expected_suits
+
+
+class LowestCardPlayer(GreedyPlayer):
+    """Plays its lowest playable card; only provides batched decisions."""
+
+    @classmethod
+    def pick_cards_batch(cls, hands, playable, hand_order):
+        import numpy as np
+
+        cards = np.where(playable, np.arange(52), 52).argmin(axis=1)
+        return np.where(playable.any(axis=1), cards, -1)
+
+
+def test_vectorized_games_use_the_strategy():
+    pytest.importorskip("numpy")
+    from crazyeights.vectorized import play_games_vectorized
+
+    greedy = play_games_vectorized(3, 0, 200, 2)
+    lowest = play_games_vectorized(3, 0, 200, 2, strategy=LowestCardPlayer)
+    assert lowest.num_games == 200
+    assert lowest.turns.total != greedy.turns.total
+    assert supports_batches(LowestCardPlayer)
+    assert not supports_batches(MonteCarloPlayer)
+    with pytest.raises(ValueError):
+        play_games_vectorized(3, 0, 10, 2, strategy=MonteCarloPlayer)
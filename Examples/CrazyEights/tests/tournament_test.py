@@ -0,0 +1,273 @@
+import json
+
+import pytest
+
+from crazyeights import tournament
+from crazyeights.results import ResultsStore, ResultsWriter
+from crazyeights.simulation import game_seed, simulate
+from crazyeights.tournament import (
+    CheckpointError,
+    TournamentCheckpoint,
+    run_tournament,
+)
+
+
+def assert_same_stats(stats, expected):
+    assert stats.num_games == expected.num_games
+    assert stats.result_counts == expected.result_counts
+    assert stats.wins == expected.wins
+    assert stats.turns.to_dict() == expected.turns.to_dict()
+    assert stats.turn_histogram.counts == expected.turn_histogram.counts
+    assert [seat_stats.to_dict() for seat_stats in stats.cards_left] == [
+        seat_stats.to_dict() for seat_stats in expected.cards_left
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_results_do_not_depend_on_worker_count(workers):
+    expected = simulate(95, seed=2023, num_players=3)
+    stats = run_tournament(95, 2023, 3, workers=workers, chunk_size=10)
+    assert_same_stats(stats, expected)
+
+
+def test_results_do_not_depend_on_chunk_size():
+    expected = run_tournament(50, 11, workers=1, chunk_size=50)
+    stats = run_tournament(50, 11, workers=1, chunk_size=7)
+    assert stats_json(stats) == stats_json(expected)
+
+
+def test_fast_engine_in_tournament():
+    expected = run_tournament(40, 5, 4, workers=1, chunk_size=10)
+    stats = run_tournament(40, 5, 4, engine="fast", workers=2, chunk_size=10)
+    assert_same_stats(stats, expected)
+
+
+class InlineExecutor:
+    """Runs submitted chunks in the test process and records how many of them
+    were submitted but not yet merged."""
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self.submitted = 0
+        self.collected = 0
+        self.max_in_flight = 0
+        self.cancelled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def submit(self, function, *args):
+        executor = self
+        self.submitted += 1
+        self.max_in_flight = max(self.max_in_flight, self.submitted - self.collected)
+
+        class Future:
+            def result(self):
+                executor.collected += 1
+                return function(*args)
+
+        return Future()
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.cancelled = cancel_futures
+
+
+@pytest.fixture
+def executors(monkeypatch):
+    created = []
+
+    def create(max_workers):
+        created.append(InlineExecutor(max_workers))
+        return created[-1]
+
+    monkeypatch.setattr(tournament, "ProcessPoolExecutor", create)
+    return created
+
+
+def test_chunks_are_submitted_in_a_bounded_window(executors):
+    expected = run_tournament(100, 9, workers=1, chunk_size=5)
+    stats = run_tournament(100, 9, workers=3, chunk_size=5)
+    assert stats_json(stats) == stats_json(expected)
+    (executor,) = executors
+    assert executor.submitted == 20
+    assert executor.max_in_flight == tournament.CHUNKS_IN_FLIGHT_PER_WORKER * 3
+
+
+def test_failed_chunk_cancels_the_remaining_chunks(executors, monkeypatch):
+    interrupt_after(monkeypatch, 2)
+    with pytest.raises(Interrupted):
+        run_tournament(100, 9, workers=2, chunk_size=5)
+    (executor,) = executors
+    assert executor.cancelled
+    assert executor.submitted < 20
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        run_tournament(10, 1, engine="quantum", workers=2)
+
+
+def stats_json(stats):
+    data = stats.to_dict()
+    del data["elapsed_time"]
+    return json.dumps(data)
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(monkeypatch, num_chunks):
+    original_play_chunk = tournament.play_chunk
+    calls = []
+
+    def play_chunk(*args):
+        if len(calls) == num_chunks:
+            raise Interrupted
+        calls.append(args)
+        return original_play_chunk(*args)
+
+    monkeypatch.setattr(tournament, "play_chunk", play_chunk)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_resumed_tournament_matches_uninterrupted_one(tmp_path, monkeypatch, workers):
+    expected_results = tmp_path / "expected.c8r"
+    expected = run_tournament(
+        90, 7, 3, "fast", workers=1, chunk_size=10, results_path=expected_results
+    )
+
+    checkpoint_path = tmp_path / "checkpoint.json"
+    results_path = tmp_path / "results.c8r"
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, 5)
+        with pytest.raises(Interrupted):
+            run_tournament(
+                90,
+                7,
+                3,
+                "fast",
+                workers=1,
+                chunk_size=10,
+                results_path=results_path,
+                checkpoint_path=checkpoint_path,
+                checkpoint_interval=0,
+            )
+    checkpoint = TournamentCheckpoint.load(checkpoint_path)
+    assert checkpoint.games_completed == 50
+    assert checkpoint.stats.num_games == 50
+
+    stats = run_tournament(
+        90,
+        num_players=3,
+        engine="fast",
+        workers=workers,
+        chunk_size=10,
+        results_path=results_path,
+        checkpoint_path=checkpoint_path,
+    )
+    assert stats_json(stats) == stats_json(expected)
+    assert results_path.read_bytes() == expected_results.read_bytes()
+    assert TournamentCheckpoint.load(checkpoint_path).games_completed == 90
+
+
+def test_resumed_tournament_may_use_another_chunk_size(tmp_path, monkeypatch):
+    expected = run_tournament(90, 7, 3, "fast", workers=1, chunk_size=90)
+    checkpoint_path = tmp_path / "checkpoint.json"
+    settings = dict(workers=1, checkpoint_path=checkpoint_path, checkpoint_interval=0)
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, 3)
+        with pytest.raises(Interrupted):
+            run_tournament(90, 7, 3, "fast", chunk_size=7, **settings)
+    assert TournamentCheckpoint.load(checkpoint_path).games_completed == 21
+    stats = run_tournament(90, 7, 3, "fast", chunk_size=20, **settings)
+    assert stats_json(stats) == stats_json(expected)
+
+
+def test_tournament_interrupted_before_the_first_interval(tmp_path, monkeypatch):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    results_path = tmp_path / "results.c8r"
+    with ResultsWriter(str(results_path), 2) as writer:
+        simulate(5, seed=1, results=writer)
+    size = results_path.stat().st_size
+    settings = dict(
+        workers=1,
+        chunk_size=10,
+        results_path=results_path,
+        checkpoint_path=checkpoint_path,
+    )
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, 0)
+        with pytest.raises(Interrupted):
+            run_tournament(30, -1, **settings)
+    checkpoint = TournamentCheckpoint.load(checkpoint_path)
+    assert checkpoint.games_completed == 0
+    assert checkpoint.seed >= 0
+    assert checkpoint.results_size == size
+
+    stats = run_tournament(30, -1, **settings)
+    expected = run_tournament(30, checkpoint.seed, workers=1, chunk_size=10)
+    assert stats_json(stats) == stats_json(expected)
+    with ResultsStore(str(results_path)) as store:
+        seeds = [seed for seed, in store.select(["seed"])]
+    assert seeds[5:] == [game_seed(checkpoint.seed, i) for i in range(30)]
+
+
+def test_checkpoints_cover_all_but_the_submission_window(
+    tmp_path, monkeypatch, executors
+):
+    saves = []
+    original_save = TournamentCheckpoint.save
+
+    def save(checkpoint, path):
+        submitted = executors[0].submitted if executors else 0
+        saves.append((submitted, checkpoint.games_completed))
+        original_save(checkpoint, path)
+
+    monkeypatch.setattr(TournamentCheckpoint, "save", save)
+    checkpoint_path = tmp_path / "checkpoint.json"
+    run_tournament(
+        100,
+        9,
+        workers=2,
+        chunk_size=5,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=0,
+    )
+    window = tournament.CHUNKS_IN_FLIGHT_PER_WORKER * 2
+    assert saves[0] == (0, 0)
+    assert [completed for _, completed in saves[1:-1]] == list(range(5, 101, 5))
+    for submitted, completed in saves:
+        assert submitted - completed // 5 < window
+
+
+def test_results_written_after_the_checkpoint_are_dropped(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    results_path = tmp_path / "results.c8r"
+    settings = dict(
+        workers=1,
+        chunk_size=10,
+        results_path=results_path,
+        checkpoint_path=checkpoint_path,
+    )
+    run_tournament(30, 3, **settings)
+    data = results_path.read_bytes()
+    with open(results_path, "ab") as file:
+        file.write(b"part of a block")
+    run_tournament(30, 3, **settings)
+    assert results_path.read_bytes() == data
+
+
+def test_checkpoint_of_a_different_tournament(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    run_tournament(20, 1, workers=1, chunk_size=10, checkpoint_path=checkpoint_path)
+    with pytest.raises(CheckpointError, match="num_players"):
+        run_tournament(20, 1, 3, workers=1, checkpoint_path=checkpoint_path)
+    with pytest.raises(CheckpointError, match="seed"):
+        run_tournament(20, 2, workers=1, chunk_size=10, checkpoint_path=checkpoint_path)
+    checkpoint_path.write_text("not json")
+    with pytest.raises(CheckpointError):
+        run_tournament(20, 1, workers=1, chunk_size=10, checkpoint_path=checkpoint_path)
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from crazyeights.ai.tracker import CardTracker
+from crazyeights.deck import CARDS_BY_INDEX, Card, Deck
+from crazyeights.game import CrazyEightsGame
+from crazyeights.observer import GameObserver
+from crazyeights.simulation import create_headless_players
+
+
+class EventLog(GameObserver):
+    def __init__(self):
+        self.events = []
+
+    def card_played(self, player_index, card):
+        self.events.append(("played", player_index, card))
+
+    def suit_picked(self, player_index, suit):
+        self.events.append(("suit", player_index, suit))
+
+    def card_drawn(self, player_index, card):
+        self.events.append(("drawn", player_index, card))
+
+
+def assert_tracker_matches_game(tracker, game):
+    player = tracker.player
+    seen = set(player.hand) | set(game.discard_pile)
+    assert tracker.unseen_cards == [c for c in CARDS_BY_INDEX if c not in seen]
+    assert tracker.hand_sizes == [len(p.hand) for p in game.players]
+    assert tracker.deck_size == len(game.deck)
+    for index, voids in enumerate(tracker.voids):
+        if index != tracker.player_index:
+            assert not {card.suit for card in game.players[index].hand} & voids
+
+
+@pytest.mark.parametrize("num_players", [2, 4])
+def test_trackers_follow_the_game(num_players):
+    for seed in range(20):
+        players = create_headless_players(num_players)
+        game = CrazyEightsGame(players, random.Random(seed))
+        trackers = [CardTracker(player) for player in players]
+        for tracker in trackers:
+            game.add_observer(tracker)
+        while game.play_turn() is None:
+            for tracker in trackers:
+                assert_tracker_matches_game(tracker, game)
+
+
+def test_observers_see_all_moves():
+    players = create_headless_players(2)
+    game = CrazyEightsGame(players, random.Random(3))
+    log = EventLog()
+    game.add_observer(log)
+    game.play()
+    played = [event for event in log.events if event[0] == "played"]
+    assert [card for _, _, card in played] == game.discard_pile[1:]
+    assert {index for _, index, _ in played} == {0, 1}
+
+
+def test_probability_without_voids():
+    players = create_headless_players(2)
+    game = CrazyEightsGame(players, random.Random(5))
+    tracker = CardTracker(players[0])
+    game.add_observer(tracker)
+    top = game.top_discard
+    playable = [c for c in tracker.unseen_cards if c.matches(top)]
+    expected = len(playable) / tracker.num_unseen
+    assert tracker.probability_next_draw_playable() == pytest.approx(expected)
+
+
+def test_unseen_cards_of_void_suits_are_in_the_deck():
+    players = create_headless_players(2)
+    game = CrazyEightsGame(players, random.Random(0))
+    ranks = ["2", "3", "4", "5", "6", "7", "9"]
+    players[0].hand = [Card("Clubs", rank) for rank in ranks]
+    players[1].hand = [Card("Diamonds", rank) for rank in ranks]
+    game.discard_pile = [Card("Hearts", "King")]
+    game.deck = Deck.from_cards([Card("Spades", "3")])
+    tracker = CardTracker(players[0])
+    game.add_observer(tracker)
+
+    # The opponent cannot follow Hearts; it draws and keeps the card.
+    game.current_player_index = 1
+    game.play_turn()
+    assert tracker.voids[1] == {"Hearts"}
+    hearts = sum(1 << c.index for c in tracker.unseen_cards if c.suit == "Hearts")
+    assert tracker.void_mask() == hearts
+    # The tracker assumes a full deck: 52 - 7 - 1 cards are unseen and 8 of them
+    # are held by the opponent, so the deck holds 36 cards, among them all 12
+    # unseen Hearts.
+    assert tracker.deck_size == 36
+    assert tracker.draw_probability(hearts) == pytest.approx(12 / 36)
+    others = ~hearts & tracker.unseen
+    assert tracker.draw_probability(others) == pytest.approx(24 / 36)
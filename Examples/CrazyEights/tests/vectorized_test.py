@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from crazyeights.simulation import play_headless_game, simulate  # noqa: E402
+from crazyeights.vectorized import (  # noqa: E402
+    VectorizedGames,
+    play_vectorized_game,
+    random_decks,
+    shuffled_decks,
+)
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 5, 8])
+def test_plays_same_games_as_object_engine(num_players):
+    for seed in range(50):
+        expected = play_headless_game(num_players, random.Random(seed))
+        assert play_vectorized_game(num_players, random.Random(seed)) == expected
+
+
+def test_simulate_with_numpy_engine():
+    expected = simulate(300, seed=3, num_players=3)
+    stats = simulate(300, seed=3, num_players=3, engine="numpy")
+    assert stats.wins == expected.wins
+    assert stats.result_counts == expected.result_counts
+    assert stats.turns.to_dict() == expected.turns.to_dict()
+
+
+def test_finished_games_are_not_advanced():
+    games = VectorizedGames(shuffled_decks(range(20)), 2)
+    games.play()
+    num_turns = games.num_turns.copy()
+    games.step()
+    assert (games.num_turns == num_turns).all()
+    assert games.num_live == 0
+
+
+def test_deal():
+    games = VectorizedGames(shuffled_decks([1, 2]), 4)
+    assert (games.hands.sum(axis=1) == 7).all()
+    assert (games.deck_sizes == 52 - 1 - 4 * 7).all()
+
+
+def test_random_decks():
+    decks = random_decks(10, np.random.default_rng(1))
+    assert (np.sort(decks, axis=1) == np.arange(52)).all()